@@ -1,16 +1,31 @@
 # -*- coding: utf-8 -*-
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 
+import karatel.logic.tic_tac_toe_3x3 as ttt
 from karatel.api.handlers import add_handlers
-from karatel.api.routers import hero, items, next_number, root, tic_tac_toe_3x3
+from karatel.api.routers import combat, hero, items, next_number, root, tic_tac_toe_3x3
+from karatel.api.workers import POOL
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Таблиця ходів будується до першого запиту,
+    пул процесів зупиняється разом із сервером"""
+    ttt.table()
+    yield
+    POOL.shutdown()
+
 
 app = FastAPI(
     title="Karatel Game API",
     root_path="/api",
     openapi_url="/openapi.json",
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 # Підключаємо маршрути
@@ -19,6 +34,7 @@ app.include_router(items.router, prefix="/items")
 app.include_router(hero.router, prefix="/hero")
 app.include_router(next_number.router, prefix="/next-number")
 app.include_router(tic_tac_toe_3x3.router, prefix="/ttt")
+app.include_router(combat.router, prefix="/combat")
 
 
 # Додаємо обробники помилок
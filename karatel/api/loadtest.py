@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Навантажувальний тест API: затримки p50/p99 та запитів на секунду
+для кожного ендпоінту. Без --url запити йдуть у застосунок напряму (ASGI)
+
+    python -m karatel.api.loadtest --requests 200 --concurrency 20
+    python -m karatel.api.loadtest --url http://127.0.0.1:8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+_BOARD = ["X", "none", "none", "none", "O", "none", "none", "none", "none"]
+_HERO = {
+    "ac": 20,
+    "attack_modifier": 20,
+    "damage": "2d6+4",
+    "max_hp": 29,
+    "initiative": 10,
+}
+_ODDS = {"a": _HERO, "b": _HERO | {"ac": 30, "max_hp": 19, "initiative": 20}}
+
+ENDPOINTS: dict[str, tuple[str, str, Any]] = {
+    "root": ("GET", "/", None),
+    "weapons": ("GET", "/items/weapons?t=all", None),
+    "professions": ("GET", "/hero/professions", None),
+    "next-number": ("GET", "/next-number/get/6", None),
+    "ttt-check": ("POST", "/ttt/check", _BOARD),
+    "ttt-move": ("POST", "/ttt/move", {"board": _BOARD, "max_player_symbol": "X"}),
+    "hero-generate": ("GET", "/hero/generate", None),
+    "combat-odds": ("POST", "/combat/odds", _ODDS),
+}
+
+
+@dataclass
+class Report:
+    """Результати навантаження одного ендпоінту"""
+
+    name: str
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def percentile(self, value: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[value - 1]
+
+    def __str__(self) -> str:
+        rps = len(self.latencies) / self.elapsed if self.elapsed else 0.0
+        statuses = " ".join(f"{k}:{v}" for k, v in sorted(self.statuses.items()))
+        return (
+            f"{self.name:<14} p50 {self.percentile(50) * 1000:8.1f} мс  "
+            f"p99 {self.percentile(99) * 1000:8.1f} мс  "
+            f"{rps:8.1f} зап/с  {statuses}"
+        )
+
+
+async def hammer(
+    client: httpx.AsyncClient, name: str, requests: int, concurrency: int
+) -> Report:
+    """requests запитів до одного ендпоінту по concurrency одночасно"""
+
+    method, path, body = ENDPOINTS[name]
+    report = Report(name)
+    remaining = iter(range(requests))
+
+    async def _worker() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            report.latencies.append(time.perf_counter() - start)
+            report.statuses[status] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def run(
+    names: list[str], requests: int, concurrency: int, url: str | None
+) -> list[Report]:
+    if url is None:
+        from karatel.api.fastapi import app
+
+        transport = httpx.ASGITransport(app=app)
+        url = "http://karatel"
+    else:
+        transport = None
+
+    reports = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url=url, timeout=60
+    ) as client:
+        for name in names:
+            # Прогрів: старт процесів пулу, кеші, імпорти
+            await hammer(client, name, concurrency, concurrency)
+            reports.append(await hammer(client, name, requests, concurrency))
+    return reports
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m karatel.api.loadtest", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--url", help="адреса запущеного сервера")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "endpoints", nargs="*", help=f"за замовчуванням усі: {', '.join(ENDPOINTS)}"
+    )
+    args = parser.parse_args(argv)
+    if unknown := set(args.endpoints) - ENDPOINTS.keys():
+        parser.error(f"невідомі ендпоінти: {', '.join(sorted(unknown))}")
+
+    try:
+        reports = asyncio.run(
+            run(
+                args.endpoints or list(ENDPOINTS),
+                args.requests,
+                args.concurrency,
+                args.url,
+            )
+        )
+    finally:
+        from karatel.api.workers import POOL
+
+        POOL.shutdown()
+
+    for report in reports:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
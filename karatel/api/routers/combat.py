@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, ConfigDict, Field
+
+from karatel.api.workers import POOL
+from karatel.logic.combat_odds import CombatOdds, combat_odds
+from karatel.logic.simulation import CombatStats
+
+MAX_HP = 500
+MAX_STAT = 100  # Межа AC, модифікатора атаки та ініціативи за модулем
+
+
+class CombatStatsSchema(BaseModel):
+    """Бойові характеристики героя"""
+
+    ac: Annotated[int, Field(ge=0, le=MAX_STAT)]
+    attack_modifier: Annotated[int, Field(ge=-MAX_STAT, le=MAX_STAT)]
+    damage: Annotated[str, Field(max_length=32, description='Наприклад, "2d6+4"')]
+    max_hp: Annotated[int, Field(ge=1, le=MAX_HP)]
+    initiative: Annotated[int, Field(ge=-MAX_STAT, le=MAX_STAT)]
+    hp: Annotated[
+        int | None,
+        Field(ge=1, le=MAX_HP, description="Поточне здоров'я, за замовчуванням повне"),
+    ] = None
+
+
+class OddsRequest(BaseModel):
+    """Два героя, A та B"""
+
+    a: CombatStatsSchema
+    b: CombatStatsSchema
+
+
+class OddsSchema(BaseModel):
+    """Точні результати бою"""
+
+    win_a: float
+    win_b: float
+    first_a: float
+    mean_turns: float
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+router = APIRouter()
+
+
+def _stats(schema: CombatStatsSchema) -> CombatStats:
+    return CombatStats(
+        ac=schema.ac,
+        attack_modifier=schema.attack_modifier,
+        damage=schema.damage,
+        max_hp=schema.max_hp,
+        initiative=schema.initiative,
+    )
+
+
+@router.post("/odds", response_model=OddsSchema)
+async def get_odds(request_data: OddsRequest) -> CombatOdds:
+    """Імовірності перемоги та очікувана тривалість бою без симуляції"""
+
+    try:
+        return await POOL.run(
+            combat_odds,
+            _stats(request_data.a),
+            _stats(request_data.b),
+            request_data.a.hp,
+            request_data.b.hp,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
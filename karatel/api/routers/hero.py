@@ -5,9 +5,10 @@ from typing import Any
 from fastapi import APIRouter
 from pydantic import BaseModel, ConfigDict
 
+from karatel.api.workers import POOL
 from karatel.core.hero import HeroFactory
 from karatel.core.professions import PROFESSIONS
-from karatel.ui.abstract import ConsoleOutput
+from karatel.ui.abstract import NoneOutput
 
 
 class ProfessionSchema(BaseModel):
@@ -27,11 +28,16 @@ class ProfessionSchema(BaseModel):
 router = APIRouter()
 
 
+def _generate_hero() -> dict[str, Any]:
+    """Генерація з повним підняттям рівнів -- виконується в пулі процесів"""
+    return HeroFactory.hero_to_dict(HeroFactory.generate(NoneOutput()))
+
+
 @router.get("/generate")
-def generate_hero() -> dict[str, Any]:
-    return HeroFactory.hero_to_dict(HeroFactory.generate(ConsoleOutput()))
+async def generate_hero() -> dict[str, Any]:
+    return await POOL.run(_generate_hero)
 
 
 @router.get("/professions", response_model=dict[str, ProfessionSchema])
-def get_professions() -> dict[str, ProfessionSchema]:
+async def get_professions() -> dict[str, ProfessionSchema]:
     return PROFESSIONS
@@ -40,7 +40,7 @@ router = APIRouter()
 
 
 @router.get("/weapons", response_model=list[WeaponSchema])
-def get_weapons(
+async def get_weapons(
     t: WeaponType = Query(..., description="Weapon type")
 ) -> list[WeaponSchema]:
 
@@ -60,5 +60,5 @@ def get_weapons(
 
 
 @router.get("/shields", response_model=list[ShieldSchema])
-def get_shields() -> list[ShieldSchema]:
+async def get_shields() -> list[ShieldSchema]:
     return SHIELDS
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Path, Query
 
 from karatel.logic.next_number import get_sequence
 from karatel.utils.constants import Difficulty
+from karatel.utils.rng import seeded
 
 LENGTH_MIN = 1
 # LENGTH_DEFAULT = 6
@@ -14,7 +15,7 @@ router = APIRouter()
 
 
 @router.get("/get/{length}")
-def get_game(
+async def get_game(
     length: Annotated[
         int, Path(description="Довжина послідовності", ge=LENGTH_MIN, le=LENGTH_MAX)
     ],
@@ -30,5 +31,12 @@ def get_game(
             description="Одна випадкова послідовність з обраного рівня складності або всі наявні на цьому рівні"
         ),
     ] = True,
+    seed: Annotated[
+        int | None,
+        Query(description="Зерно для відтворюваної послідовності"),
+    ] = None,
 ) -> tuple[tuple[int, ...], str] | tuple[tuple[tuple[int, ...], str], ...]:
-    return get_sequence(length, difficulty, random)
+    if seed is None:
+        return get_sequence(length, difficulty, random)
+    with seeded(seed):
+        return get_sequence(length, difficulty, random)
@@ -9,7 +9,7 @@ router = APIRouter()
 
 
 @router.get("/")
-def root(request: Request) -> dict[str, list[dict[str, Any]]]:
+async def root(request: Request) -> dict[str, list[dict[str, Any]]]:
     routes = [
         {"path": r.path, "name": r.name, "methods": list(r.methods)}
         for r in request.app.routes
@@ -18,5 +18,5 @@ def root(request: Request) -> dict[str, list[dict[str, Any]]]:
 
 
 @router.get("/favicon.ico")
-def favicon() -> FileResponse:
+async def favicon() -> FileResponse:
     return FileResponse("./karatel/images/favicon.png")
@@ -52,7 +52,7 @@ def normalise_board(board_list: list[str]) -> list[str]:
 
 
 @router.post("/check", response_model=GameResult)
-def check_winner(board: Board) -> GameResult:
+async def check_winner(board: Board) -> GameResult:
     """Перевірка чи є переможець"""
 
     board_list = normalise_board(board)
@@ -68,8 +68,8 @@ def check_winner(board: Board) -> GameResult:
 
 
 @router.post("/move", response_model=Move)
-def best_move(request_data: MoveRequest) -> int:
-    """Визначення найкращого ходу для гравця"""
+async def best_move(request_data: MoveRequest) -> int:
+    """Визначення найкращого ходу для гравця. Хід береться з готової таблиці"""
 
     board_list = normalise_board(request_data.board)
 
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Спільний пул процесів для важких обчислень API.
+Кількість задач в обробці обмежена: коли пул і черга заповнені,
+ендпоінт одразу відповідає 503 замість того, щоб накопичувати запити"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException
+
+from karatel.utils.settings import API_QUEUE, API_RETRY_AFTER, API_WORKERS
+
+T = TypeVar("T")
+
+
+class WorkerPool:
+    """ProcessPoolExecutor з обмеженою чергою. Процеси стартують при першій задачі"""
+
+    def __init__(self, workers: int | None = API_WORKERS, queue: int = API_QUEUE):
+        self._workers = workers
+        self._queue = queue
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """Задач, що виконуються або чекають, одночасно.
+        Без workers процесів стільки ж, скільки ядер (як у ProcessPoolExecutor)"""
+        return (self._workers or os.cpu_count() or 1) + self._queue
+
+    def _acquire(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Сервер перевантажено, спробуйте пізніше",
+                    headers={"Retry-After": str(API_RETRY_AFTER)},
+                )
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            self._in_flight += 1
+            return self._executor
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        """Виконання функції в окремому процесі.
+        Функція та аргументи мають бути придатні для pickle"""
+
+        executor = self._acquire()
+        try:
+            future = executor.submit(function, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Місце звільняється, коли задача справді завершилась: скасування
+        # запиту не зупиняє вже запущений процес
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+POOL = WorkerPool()
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""Резервне копіювання та перенесення збережень між сховищами.
+Архів -- стиснутий gzip NDJSON: рядок заголовка та по рядку на збереження.
+Усі етапи -- генератори, тож пам'ять не залежить від кількості збережень
+
+    python -m karatel.backup export sqlite:./karatel/saves/karatel.db saves.ndjson.gz
+    python -m karatel.backup import saves.ndjson.gz postgres:"dbname=karatel"
+    python -m karatel.backup copy sqlite:./karatel/saves/karatel.db postgres:
+
+Ключі користувачів у сховищах різні: SQLite та PostgreSQL знають
+користувачів за іменем, Firebase -- за uid облікового запису. Тому збереження
+переносяться лише між сховищами з однаковим ключем (user_key), а архів
+пам'ятає ключ свого джерела. Перенесення між Firebase та SQL потребує явної
+відповідності ключів -- JSON-файлу {"ключ джерела": "ключ цілі"}:
+
+    python -m karatel.backup copy firebase sqlite: --users users.json
+
+SQL-сховище створює відсутніх користувачів з випадковим паролем, а Firebase
+записує збереження до вказаного uid, не створюючи облікових записів
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import queue
+import threading
+from itertools import islice
+from typing import IO, TYPE_CHECKING, Iterable, Iterator
+
+from karatel.utils.settings import BACKUP_BATCH, BACKUP_QUEUE, BACKUP_WORKERS
+
+if TYPE_CHECKING:
+    from karatel.storage.abstract import SaveRecord, StorageManager
+
+ARCHIVE_FORMAT = "karatel-saves"
+ARCHIVE_VERSION = 2
+
+# Збереження разом з ключем користувача
+UserSave = tuple[str, "SaveRecord"]
+
+
+class BackupError(ValueError):
+    """Пошкоджений або несумісний архів"""
+
+
+def open_saver(spec: str) -> StorageManager:
+    """Сховище за описом: firebase, sqlite[:шлях], postgres[:рядок підключення]"""
+
+    kind, _, argument = spec.partition(":")
+    match kind:
+        case "firebase":
+            from karatel.storage.abstract import FirebaseSaver
+
+            return FirebaseSaver()
+        case "sqlite":
+            from karatel.storage.sqlite_manager import SQLiteSaver
+
+            return SQLiteSaver(argument) if argument else SQLiteSaver()
+        case "postgres":
+            from karatel.storage.postgresql_manager import PostgresSaver
+
+            return PostgresSaver(argument or None)
+    raise ValueError(f"Невідоме сховище: {spec}")
+
+
+def read_saves(
+    saver: StorageManager,
+    workers: int = BACKUP_WORKERS,
+    queue_size: int = BACKUP_QUEUE,
+) -> Iterator[UserSave]:
+    """Збереження всіх користувачів. Користувачів читають кілька потоків,
+    а обмежена черга не дає їм випередити запис більш ніж на queue_size"""
+
+    users: queue.Queue = queue.Queue(maxsize=workers)
+    records: queue.Queue = queue.Queue(maxsize=queue_size)
+    done = object()
+    stop = threading.Event()
+
+    def _put(target: queue.Queue, item: object) -> bool:
+        """Блокуючий запис у чергу, що переривається зупинкою"""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(source: queue.Queue) -> object:
+        """Блокуюче читання з черги, що переривається зупинкою"""
+        while not stop.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return done
+
+    def _feeder() -> None:
+        # Перелік користувачів читає один потік: курсор деяких сховищ
+        # (SQLite) можна використовувати лише в потоці, що його створив
+        try:
+            for username in saver.iter_users():
+                if not _put(users, username):
+                    return
+        except Exception as e:
+            _put(records, e)
+        finally:
+            for _ in range(workers):
+                _put(users, done)
+
+    def _worker() -> None:
+        try:
+            while (username := _get(users)) is not done:
+                for record in saver.iter_saves(username):
+                    if not _put(records, (username, record)):
+                        return
+        except Exception as e:
+            _put(records, e)
+        finally:
+            _put(records, done)
+
+    threads = [threading.Thread(target=_feeder, name="karatel-backup", daemon=True)]
+    threads += [
+        threading.Thread(target=_worker, name=f"karatel-backup-{number}", daemon=True)
+        for number in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        running = workers
+        while running:
+            item = records.get()
+            if item is done:
+                running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        # Споживач міг зупинитися раніше -- потоки завершаться самі
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def map_users(
+    saves: Iterable[UserSave],
+    source_key: str,
+    target_key: str,
+    users: dict[str, str] | None = None,
+) -> Iterable[UserSave]:
+    """Ключі користувачів для сховища-цілі. Без відповідності users ключі
+    лишаються як є, тож ключ джерела і цілі (user_key) мусить збігатися"""
+
+    if users is None:
+        if source_key != target_key:
+            raise BackupError(
+                f"Ключі користувачів несумісні ({source_key} -> {target_key}). "
+                "Потрібна відповідність ключів --users"
+            )
+        return saves
+
+    def _mapped() -> Iterator[UserSave]:
+        for username, record in saves:
+            try:
+                yield users[username], record
+            except KeyError:
+                raise BackupError(
+                    f"Немає відповідності для користувача '{username}'"
+                ) from None
+
+    return _mapped()
+
+
+def write_saves(
+    saver: StorageManager, saves: Iterable[UserSave], batch_size: int = BACKUP_BATCH
+) -> int:
+    """Запис збережень пакетами по batch_size. Повертає їх кількість"""
+
+    counter = 0
+    iterator = iter(saves)
+    while batch := list(islice(iterator, batch_size)):
+        by_user: dict[str, list[SaveRecord]] = {}
+        for username, record in batch:
+            by_user.setdefault(username, []).append(record)
+        for username, records in by_user.items():
+            counter += saver.import_saves(username, records)
+    return counter
+
+
+def write_archive(
+    path: str, saves: Iterable[UserSave], user_key: str = "username"
+) -> int:
+    """Запис збережень в архів. user_key -- ключ користувачів джерела.
+    Повертає кількість збережень"""
+
+    counter = 0
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        header = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "users": user_key,
+        }
+        file.write(json.dumps(header) + "\n")
+        for username, (hero_name, hero_dict, map_dict) in saves:
+            line = {
+                "user": username,
+                "hero_name": hero_name,
+                "hero": hero_dict,
+                "map": map_dict,
+            }
+            file.write(json.dumps(line, ensure_ascii=False) + "\n")
+            counter += 1
+    return counter
+
+
+def _read_header(file: IO[str], path: str) -> dict:
+    """Перевірений заголовок архіву"""
+
+    try:
+        header = json.loads(file.readline())
+    except json.JSONDecodeError as e:
+        raise BackupError(f"{path}: не архів збережень") from e
+    if (
+        not isinstance(header, dict)
+        or header.get("format") != ARCHIVE_FORMAT
+        or header.get("version") != ARCHIVE_VERSION
+        or not isinstance(header.get("users"), str)
+    ):
+        raise BackupError(f"{path}: невідомий формат архіву {header!r}")
+    return header
+
+
+def archive_user_key(path: str) -> str:
+    """Ключ користувачів сховища, з якого зроблено архів"""
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return _read_header(file, path)["users"]
+
+
+def read_archive(path: str) -> Iterator[UserSave]:
+    """Збереження з архіву, по одному рядку"""
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        _read_header(file, path)
+        for number, line in enumerate(file, start=2):
+            try:
+                data = json.loads(line)
+                yield data["user"], (data["hero_name"], data["hero"], data["map"])
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                raise BackupError(f"{path}:{number}: пошкоджений рядок") from e
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m karatel.backup",
+        description="Резервне копіювання та перенесення збережень",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="сховище -> архів")
+    export.add_argument("source")
+    export.add_argument("archive")
+
+    restore = commands.add_parser("import", help="архів -> сховище")
+    restore.add_argument("archive")
+    restore.add_argument("target")
+
+    copy = commands.add_parser("copy", help="сховище -> сховище")
+    copy.add_argument("source")
+    copy.add_argument("target")
+
+    for command in (export, copy):
+        command.add_argument("--workers", type=int, default=BACKUP_WORKERS)
+    for command in (restore, copy):
+        command.add_argument("--batch", type=int, default=BACKUP_BATCH)
+        command.add_argument(
+            "--users", help="JSON-файл відповідності ключів користувачів"
+        )
+
+    args = parser.parse_args(argv)
+
+    users = None
+    if getattr(args, "users", None):
+        with open(args.users, encoding="utf-8") as file:
+            users = json.load(file)
+
+    match args.command:
+        case "export":
+            source = open_saver(args.source)
+            saves = read_saves(source, args.workers)
+            counter = write_archive(args.archive, saves, source.user_key)
+        case "import":
+            target = open_saver(args.target)
+            saves = map_users(
+                read_archive(args.archive),
+                archive_user_key(args.archive),
+                target.user_key,
+                users,
+            )
+            counter = write_saves(target, saves, args.batch)
+        case _:
+            source, target = open_saver(args.source), open_saver(args.target)
+            saves = map_users(
+                read_saves(source, args.workers),
+                source.user_key,
+                target.user_key,
+                users,
+            )
+            counter = write_saves(target, saves, args.batch)
+
+    print(f"Перенесено збережень: {counter}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""Заміри продуктивності. Окремі скрипти, а не частина бібліотеки:
+
+python -m karatel.benchmarks.hero
+python -m karatel.benchmarks.combat
+python -m karatel.benchmarks.snapshot
+python -m karatel.benchmarks.sqlite
+python -m karatel.benchmarks.postgresql "dbname=karatel_bench"
+"""
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Швидкість боїв героїв 20 рівня та читання похідних характеристик"""
+
+from __future__ import annotations
+
+import time
+import timeit
+
+from karatel.core.hero import HeroFactory
+from karatel.logic.combat import fight
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.rng import seeded
+
+
+def main(count: int = 20000) -> None:
+    output = NoneOutput()
+
+    hero = HeroFactory.generate(output, level=20)
+    reads = timeit.repeat(
+        lambda: (hero.ac, hero.attack_modifier, hero.initiative, hero.alive),
+        number=100000,
+        repeat=5,
+    )
+    print(f"ac, attack_modifier, initiative, alive: {min(reads) * 1e4:.0f} нс")
+
+    best = float("inf")
+    for _ in range(5):
+        with seeded(1):
+            pairs = [
+                HeroFactory.generate_many(output, 2, level=20) for _ in range(count)
+            ]
+        start = time.perf_counter()
+        with seeded(2):
+            for hero_a, hero_b in pairs:
+                fight(hero_a, hero_b)
+        best = min(best, time.perf_counter() - start)
+    print(f"Бій: {best / count * 1e6:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Пам'ять героя та мапи з ворогами за tracemalloc,
+час створення героя з нуля (без шаблонів) до рівня 2 та MAX_LEVEL"""
+
+from __future__ import annotations
+
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from karatel.core.hero import Hero, HeroFactory
+from karatel.core.map import MapSize, generate_map
+from karatel.core.professions import PROFESSIONS
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.constants import Sex
+from karatel.utils.settings import EXPERIENCE_FOR_LEVEL, MAX_LEVEL, MIN_LEVEL
+
+
+def traced(func: Callable[[], Any]) -> tuple[int, Any]:
+    """Пам'ять, яку займає результат func, та сам результат"""
+
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main(count: int = 1000) -> None:
+    output = NoneOutput()
+    for level in range(MIN_LEVEL, MAX_LEVEL + 1):
+        HeroFactory.generate(output, level=level)  # шаблони не враховуємо
+
+    size, heroes = traced(lambda: HeroFactory.generate_many(output, count, 10))
+    print(f"Герой: {size / count:.0f} Б")
+    size, maps = traced(
+        lambda: [generate_map(heroes[0], seed=seed) for seed in range(count // 20)]
+    )
+    print(f"Мапа {MapSize.X}x{MapSize.Y}: {size / len(maps) / 1024:.1f} КБ")
+
+    for level in (MIN_LEVEL + 1, MAX_LEVEL):
+        times = timeit.repeat(
+            lambda: Hero(
+                output,
+                "Андрій",
+                Sex.M,
+                PROFESSIONS["commando"],
+                experience=EXPERIENCE_FOR_LEVEL[level - 1],
+            ),
+            number=2000,
+            repeat=5,
+        )
+        print(f"Новий герой {level} рівня: {min(times) / 2000 * 1e6:.1f} мкс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Пропускна здатність збережень PostgresSaver.
+Потрібен PostgreSQL: рядок підключення -- аргумент або postgresql_config.
+Заміри йдуть від імені тимчасового користувача, який потім видаляється
+
+    python -m karatel.benchmarks.postgresql "dbname=karatel_bench"
+"""
+
+from __future__ import annotations
+
+import secrets
+import sys
+import time
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map
+from karatel.storage.postgresql_manager import PostgresSaver
+from karatel.ui.abstract import NoneOutput
+
+
+def main(conninfo: str | None = None, count: int = 500) -> None:
+    output = NoneOutput()
+    saver = PostgresSaver(conninfo)
+    username = f"bench_{secrets.token_hex(8)}"
+    is_valid, user_id, *_ = saver.register_user(
+        output, username, secrets.token_urlsafe(), False
+    )
+    if not is_valid:
+        saver.close()
+        raise SystemExit(f"Не вдалося створити користувача '{username}'")
+
+    try:
+        heroes = []
+        for number in range(count):
+            hero = HeroFactory.generate(output, level=number % 20 + 1)
+            hero.name = f"{hero.name}_{number}"
+            heroes.append((hero, generate_map(hero, seed=number)))
+
+        start = time.perf_counter()
+        for hero, game_map in heroes:
+            saver.save_hero(hero, game_map, user_id, log=False)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        saver.save_heroes(heroes, user_id)
+        bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for hero, _ in heroes[:100]:
+            saver.load_hero(output, user_id, hero.name, log=False)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        saver.list_summaries(output, user_id)
+        listing = time.perf_counter() - start
+    finally:
+        saver.delete_user(output, user_id, user_id, False)
+        saver.close()
+
+    print(f"Збереження по одному: {count / single:.0f} героїв/с")
+    print(f"Пакетне збереження: {count / bulk:.0f} героїв/с")
+    print(f"Завантаження: {100 / load:.0f} героїв/с")
+    print(f"Список {count} описів: {listing * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
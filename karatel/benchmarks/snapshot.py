@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Бінарні знімки проти JSON: звичайна мапа та мапа з ворогами у кожній клітинці"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Callable
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import Cell, CellType, dict_to_map, generate_map, map_to_dict
+from karatel.core.snapshot import (
+    bytes_to_hero,
+    bytes_to_map,
+    hero_to_bytes,
+    map_to_bytes,
+)
+from karatel.ui.abstract import NoneOutput
+
+
+def bench(func: Callable[[], object], number: int = 20) -> float:
+    """Середній час виклику, мс"""
+    return timeit.timeit(func, number=number) / number * 1000
+
+
+def main() -> None:
+    output = NoneOutput()
+    hero = HeroFactory.generate(output, level=10)
+    typical = generate_map(hero, seed=1)
+    worst = generate_map(hero, seed=1)
+    for y in range(worst.height):
+        for x in range(worst.width):
+            if worst[y][x].type != CellType.HERO:
+                worst[y][x] = Cell(
+                    CellType.ENEMY, HeroFactory.generate(output, level=20), gold=100
+                )
+
+    for title, the_map in (("Типова мапа", typical), ("Лише вороги", worst)):
+        json_map = json.dumps(map_to_dict(the_map), ensure_ascii=False).encode("utf-8")
+        binary_map = map_to_bytes(the_map)
+        save_json = bench(lambda: json.dumps(map_to_dict(the_map), ensure_ascii=False))
+        save_binary = bench(lambda: map_to_bytes(the_map))
+        load_json = bench(lambda: dict_to_map(output, json.loads(json_map)))
+        load_binary = bench(lambda: bytes_to_map(output, binary_map))
+        print(title)
+        print(f"  Розмір: JSON {len(json_map)} Б, бінарний {len(binary_map)} Б")
+        print(f"  Збереження: JSON {save_json:.2f} мс, бінарний {save_binary:.2f} мс")
+        print(f"  Завантаження: JSON {load_json:.2f} мс, бінарний {load_binary:.2f} мс")
+
+    json_hero = json.dumps(HeroFactory.hero_to_dict(hero), ensure_ascii=False)
+    binary_hero = hero_to_bytes(hero)
+    load_json = bench(
+        lambda: HeroFactory.dict_to_hero(output, json.loads(json_hero)), 2000
+    )
+    load_binary = bench(lambda: bytes_to_hero(output, binary_hero), 2000)
+    print("Герой")
+    print(f"  Розмір: JSON {len(json_hero.encode())} Б, бінарний {len(binary_hero)} Б")
+    print(
+        f"  Завантаження: JSON {load_json * 1000:.1f} мкс, "
+        f"бінарний {load_binary * 1000:.1f} мкс"
+    )
+
+
+if __name__ == "__main__":
+    main()
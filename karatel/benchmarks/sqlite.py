@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Пропускна здатність збережень SQLiteSaver у тимчасовий файл"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map
+from karatel.storage.sqlite_manager import SQLiteSaver
+from karatel.ui.abstract import NoneOutput
+
+
+def main(count: int = 500) -> None:
+    output = NoneOutput()
+    heroes = []
+    for number in range(count):
+        hero = HeroFactory.generate(output, level=number % 20 + 1)
+        hero.name = f"{hero.name}_{number}"
+        heroes.append((hero, generate_map(hero, seed=number)))
+
+    with tempfile.TemporaryDirectory() as directory:
+        saver = SQLiteSaver(os.path.join(directory, "bench.db"))
+
+        start = time.perf_counter()
+        for hero, game_map in heroes:
+            saver._save_params(hero, game_map, 1)
+        serialize = time.perf_counter() - start
+
+        _, user_id, *_ = saver.register_user(
+            output, "bench_user", "Bench_pass1!", False
+        )
+
+        start = time.perf_counter()
+        for hero, game_map in heroes:
+            saver.save_hero(hero, game_map, user_id, log=False)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        saver.save_heroes(heroes, user_id)
+        bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for hero, _ in heroes[:100]:
+            saver.load_hero(output, user_id, hero.name, log=False)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        saver.list_summaries(output, user_id)
+        listing = time.perf_counter() - start
+        saver.close()
+
+    print(f"Лише серіалізація: {count / serialize:.0f} героїв/с")
+    print(f"Збереження по одному: {count / single:.0f} героїв/с")
+    print(f"Пакетне збереження: {count / bulk:.0f} героїв/с")
+    print(f"Завантаження: {100 / load:.0f} героїв/с")
+    print(f"Список {count} описів: {listing * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from dataclasses import dataclass
+import random
+from dataclasses import dataclass, field
 
 from karatel.storage.abstract import StorageManager
 from karatel.ui.abstract import OutputSpace
@@ -17,3 +18,8 @@ class GameStateManager:
     local_id: str | None = None
     id_token: str | None = None
     refresh_token: str | None = None
+    seed: int | None = None  # Зерно сесії. None -- випадкове
+    rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.rng = random.Random(self.seed)
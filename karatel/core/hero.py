@@ -1,15 +1,16 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import copy
 import math
-import random
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import TYPE_CHECKING, Type
 
 if TYPE_CHECKING:
     from karatel.ui.abstract import OutputSpace
 
 from karatel.core.items import (
-    ITEMS,
     JUST_HAND,
     UNARMED_STRIKE,
     Item,
@@ -19,8 +20,11 @@ from karatel.core.items import (
     select_weapon,
 )
 from karatel.core.professions import PROFESSIONS, Profession
+from karatel.core.registry import ITEM_REGISTRY, PROFESSION_REGISTRY, SKILL_REGISTRY
 from karatel.core.skills import SKILLS, Skill, SkillTiming
+from karatel.ui.abstract import NoneOutput
 from karatel.utils.constants import FEMALE_NAMES, MALE_NAMES, TRANSLATIONS, Sex
+from karatel.utils.rng import get_rng
 from karatel.utils.settings import (
     BASE_SKILL_LEVELS,
     DEBUG,
@@ -29,11 +33,99 @@ from karatel.utils.settings import (
     MAX_LEVEL,
     MIN_LEVEL,
 )
-from karatel.utils.utils import clamp_value, get_modifier, obj_finder, sanitize_word
+from karatel.utils.utils import clamp_value, get_modifier, sanitize_word
+
+# Кеш шаблонів героїв: (професія, рівень, права рука, ліва рука) -> Hero
+_HERO_TEMPLATES: dict[tuple[Profession, int, Weapon | None, Shield | None], Hero] = {}
+
+STAT_NAMES = ("Strength", "Dexterity", "Constitution", "Intelligence", "Charisma")
+# Назва характеристики -> слот у Stats
+_STAT_SLOTS = {name: name.lower() for name in STAT_NAMES}
+
+# Базові навички, що видаються на рівнях BASE_SKILL_LEVELS
+_BASE_SKILLS = tuple(
+    SKILLS[name]
+    for name in (
+        "self_heal_small",
+        "self_heal_medium",
+        "self_heal_strong",
+        "self_heal_ultimate",
+    )
+)
+
+
+def level_for_experience(experience: int) -> int:
+    """Рівень героя з таким досвідом -- кількість пройдених порогів досвіду"""
+    return clamp_value(
+        bisect_right(EXPERIENCE_FOR_LEVEL, experience), MIN_LEVEL, MAX_LEVEL
+    )
+
+
+class Stats(MutableMapping):
+    """Характеристики героя: п'ять слотів замість словника
+    з тим самим інтерфейсом -- stats["Strength"] += 2.
+    version змінюється при кожному записі через stats[...]"""
+
+    __slots__ = tuple(_STAT_SLOTS.values()) + ("version",)
+
+    def __init__(self, values: Mapping[str, int] | None = None) -> None:
+        for slot in _STAT_SLOTS.values():
+            setattr(self, slot, 10)
+        self.version = 0
+        if values is not None:
+            self.update(values)
+
+    def __getitem__(self, key: str) -> int:
+        return getattr(self, _STAT_SLOTS[key])
+
+    def __setitem__(self, key: str, value: int) -> None:
+        setattr(self, _STAT_SLOTS[key], value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Характеристику не можна видалити")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STAT_NAMES)
+
+    def __len__(self) -> int:
+        return len(STAT_NAMES)
+
+    def __repr__(self) -> str:
+        return f"Stats({dict(self)!r})"
+
+    def copy(self) -> Stats:
+        return copy.copy(self)
 
 
 class Hero:
-    """Клас героя"""
+    """Клас героя. Слоти замість __dict__: на мапі сотні ворогів.
+    Менеджери не зберігаються в герої, а створюються при зверненні.
+    Клас броні, атака та ініціатива кешуються і перераховуються лише
+    після зміни характеристик (а отже й рівня) або предметів у руках"""
+
+    __slots__ = (
+        "name",
+        "_sex",
+        "profession",
+        "_level",
+        "_experience",
+        "_hp",
+        "max_hp",
+        "_lives",
+        "_money",
+        "_stats",
+        "output",
+        "skills",
+        "inventory",
+        "_left_hand",
+        "_right_hand",
+        # Кеш похідних характеристик
+        "_ac",
+        "_attack_modifier",
+        "_initiative",
+        "_derived",  # Версія stats, для якої пораховано кеш. -1 -- застарів
+    )
 
     def __init__(
         self,
@@ -56,19 +148,9 @@ class Hero:
 
         self._money = 0
 
-        self.stats = {
-            "Strength": 10,
-            "Dexterity": 10,
-            "Constitution": 10,
-            "Intelligence": 10,
-            "Charisma": 10,
-        }
-        # Менеджери
+        self._stats = Stats()
+        self._derived = -1
         self.output = output
-        self.leveling = LevelSystem(self)
-        self.equipment = EquipmentManager(self)
-        self.display = HeroDisplay(self)
-        self.skill_manager = SkillSystem(self)
 
         self.skills = []
 
@@ -82,10 +164,30 @@ class Hero:
 
         self.inventory = []
 
-        self.left_hand = JUST_HAND
-        self.right_hand = UNARMED_STRIKE
+        self._left_hand = JUST_HAND
+        self._right_hand = UNARMED_STRIKE
 
-        self.output.write(f"Персонажа {self.name} створено", log=DEBUG)
+        self.output.write_lazy("Персонажа {} створено", self.name, log=DEBUG)
+
+    @property
+    def leveling(self) -> LevelSystem:
+        """Менеджер рівнів та досвіду"""
+        return LevelSystem(self)
+
+    @property
+    def equipment(self) -> EquipmentManager:
+        """Менеджер екіпіровки"""
+        return EquipmentManager(self)
+
+    @property
+    def display(self) -> HeroDisplay:
+        """Виведення інформації про героя"""
+        return HeroDisplay(self)
+
+    @property
+    def skill_manager(self) -> SkillSystem:
+        """Менеджер навичок"""
+        return SkillSystem(self)
 
     def __str__(self) -> str:
         """Повертає текстове представлення героя для print()."""
@@ -106,14 +208,50 @@ class Hero:
             else:
                 return f"{self.name} померла остаточно."
 
+    @property
+    def stats(self) -> Stats:
+        """Повертає характеристики героя"""
+        return self._stats
+
+    @stats.setter
+    def stats(self, value: Mapping[str, int]) -> None:
+        """Сеттер характеристик. Приймає і звичайний словник"""
+        self._stats = value if isinstance(value, Stats) else Stats(value)
+        self._derived = -1
+
+    @property
+    def left_hand(self) -> Shield:
+        """Повертає щит у лівій руці"""
+        return self._left_hand
+
+    @left_hand.setter
+    def left_hand(self, value: Shield) -> None:
+        self._left_hand = value
+        self._derived = -1
+
+    @property
+    def right_hand(self) -> Weapon:
+        """Повертає зброю у правій руці"""
+        return self._right_hand
+
+    @right_hand.setter
+    def right_hand(self, value: Weapon) -> None:
+        self._right_hand = value
+        self._derived = -1
+
+    def _update_derived(self) -> None:
+        """Перераховує кеш похідних бойових характеристик"""
+        stats = self._stats
+        self._initiative = get_modifier(stats.dexterity)
+        self._ac = 10 + self._initiative + self._left_hand.ac_bonus
+        self._attack_modifier = get_modifier(stats[self._right_hand.stat])
+        self._derived = stats.version
+
     @property
     def hp(self) -> int:
         """Повертає кількість здоров'я"""
 
-        if self.lives > 0:
-            return self._hp
-        else:
-            return 0
+        return self._hp if self._lives > 0 else 0
 
     @hp.setter
     def hp(self, value: int) -> None:
@@ -125,23 +263,29 @@ class Hero:
 
     @property
     def ac(self) -> int:
-        """Розраховує та повертає клас броні"""
-        return (10 + get_modifier(self.stats["Dexterity"])) + self.left_hand.ac_bonus
+        """Повертає клас броні"""
+        if self._derived != self._stats.version:
+            self._update_derived()
+        return self._ac
 
     @property
     def attack_modifier(self) -> int:
-        """Розраховує та повертає модифікатор атаки"""
-        return get_modifier(self.stats[self.right_hand.stat])
+        """Повертає модифікатор атаки"""
+        if self._derived != self._stats.version:
+            self._update_derived()
+        return self._attack_modifier
 
     @property
     def initiative(self) -> int:
-        """Розраховує та повертає модифікатор ініціативи"""
-        return get_modifier(self.stats["Dexterity"])
+        """Повертає модифікатор ініціативи"""
+        if self._derived != self._stats.version:
+            self._update_derived()
+        return self._initiative
 
     @property
     def alive(self) -> bool:
         """Повертає статус чи живий герой"""
-        return self.hp > 0
+        return self._hp > 0 and self._lives > 0
 
     @property
     def money(self) -> int:
@@ -203,6 +347,8 @@ class Hero:
 class HeroDisplay:
     """Виведення інформації про героя"""
 
+    __slots__ = ("hero",)
+
     def __init__(self, hero: Hero) -> None:
         self.hero = hero
 
@@ -293,6 +439,8 @@ class HeroDisplay:
 class LevelSystem:
     """Управління рівнями та досвідом"""
 
+    __slots__ = ("hero",)
+
     def __init__(self, hero: Hero) -> None:
         self.hero = hero
 
@@ -301,16 +449,20 @@ class LevelSystem:
         self.hero.max_hp = 10 + get_modifier(self.hero.stats["Constitution"])
         self.hero._hp = self.hero.max_hp
 
-    def level_up(self, add_constitution: bool = True, log: bool = LOG) -> None:
-        """Підвищує характеристики при новому рівні."""
+    def level_up(
+        self, add_constitution: bool = True, log: bool = LOG, levels: int = 1
+    ) -> None:
+        """Підвищує характеристики при новому рівні.
+        levels -- скільки рівнів щойно отримано: бонуси додаються
+        одразу за всі, результат той самий, що й після levels викликів"""
         for main_bonuses in self.hero.profession.main_bonuses:
-            self.hero.stats[main_bonuses] += 2
+            self.hero.stats[main_bonuses] += 2 * levels
         for secondary_bonuses in self.hero.profession.secondary_bonuses:
-            self.hero.stats[secondary_bonuses] += 1
+            self.hero.stats[secondary_bonuses] += levels
         if add_constitution:
-            self.hero.stats["Constitution"] += 1
+            self.hero.stats["Constitution"] += levels
         self.set_hp()
-        self.hero.skill_manager.can_learn_skill(log=log)
+        self.hero.skill_manager.can_learn_skill(log=log, levels=levels)
 
     def set_penalties(self) -> None:
         """Встановлює штрафи."""
@@ -325,38 +477,41 @@ class LevelSystem:
         if not amount:
             return
         self.hero.experience += amount
-        self.hero.output.write(f"{self.hero.name} отримує {amount} досвіду", log=log)
+        self.hero.output.write_lazy(
+            "{} отримує {} досвіду", self.hero.name, amount, log=log
+        )
         if self.hero.experience == EXPERIENCE_FOR_LEVEL[-1]:
-            self.hero.output.write(
-                f"{self.hero.name} досяг максимального досвіду: "
-                + f"{EXPERIENCE_FOR_LEVEL[-1]}",
+            self.hero.output.write_lazy(
+                "{} досяг максимального досвіду: {}",
+                self.hero.name,
+                EXPERIENCE_FOR_LEVEL[-1],
                 log=log,
             )
 
         if self.hero.level == MAX_LEVEL:
-            self.hero.output.write(
-                f"{self.hero.name} досяг максимального рівня: " + f"{self.hero.level}",
+            self.hero.output.write_lazy(
+                "{} досяг максимального рівня: {}",
+                self.hero.name,
+                self.hero.level,
                 log=log,
             )
             return
 
-        while (
-            self.hero.level < MAX_LEVEL
-            and self.hero.experience >= EXPERIENCE_FOR_LEVEL[self.hero.level]
-        ):
-            self.hero.level += 1
-            self.level_up(log=log)
-            self.hero.output.write(
-                f"Рівень {self.hero.name} підвищено: {self.hero.level}", log=log
+        target = level_for_experience(self.hero.experience)
+        if target > self.hero.level:
+            levels = target - self.hero.level
+            self.hero.level = target
+            self.level_up(log=log, levels=levels)
+            self.hero.output.write_lazy(
+                "Рівень {} підвищено: {}", self.hero.name, self.hero.level, log=log
             )
 
         if self.hero.level < MAX_LEVEL:
-            self.hero.output.write(
-                (
-                    f"У {self.hero.name} досвіду: {self.hero.experience}. "
-                    f"До наступного рівня: "
-                    f"{EXPERIENCE_FOR_LEVEL[self.hero.level] - self.hero.experience}."
-                ),
+            self.hero.output.write_lazy(
+                "У {} досвіду: {}. До наступного рівня: {}.",
+                self.hero.name,
+                self.hero.experience,
+                EXPERIENCE_FOR_LEVEL[self.hero.level] - self.hero.experience,
                 log=log,
             )
 
@@ -364,6 +519,8 @@ class LevelSystem:
 class SkillSystem:
     """Управління скілами"""
 
+    __slots__ = ("hero",)
+
     def __init__(self, hero: Hero) -> None:
         self.hero = hero
 
@@ -372,12 +529,12 @@ class SkillSystem:
 
         if skill not in self.hero.skills:
             self.hero.skills.append(skill)
-            self.hero.output.write(
-                f"{self.hero.name} отримує навичку {skill.name}", log=log
+            self.hero.output.write_lazy(
+                "{} отримує навичку {}", self.hero.name, skill.name, log=log
             )
         else:
-            self.hero.output.write(
-                f"{self.hero.name} вже має навичку {skill.name}", log=log
+            self.hero.output.write_lazy(
+                "{} вже має навичку {}", self.hero.name, skill.name, log=log
             )
 
     def forget_skill(self, skill: Skill, log: bool = LOG) -> None:
@@ -385,31 +542,32 @@ class SkillSystem:
 
         if skill in self.hero.skills:
             self.hero.skills.remove(skill)
-            self.hero.output.write(
-                f"{self.hero.name} забуває навичку {skill.name}", log=log
+            self.hero.output.write_lazy(
+                "{} забуває навичку {}", self.hero.name, skill.name, log=log
             )
         else:
-            self.hero.output.write(
-                f"{self.hero.name} не має навички {skill.name}", log=log
+            self.hero.output.write_lazy(
+                "{} не має навички {}", self.hero.name, skill.name, log=log
             )
 
-    def can_learn_skill(self, log: bool = LOG) -> None:
+    def can_learn_skill(self, log: bool = LOG, levels: int = 1) -> None:
         """Видавання базових навичок залежно від рівня персонажа
-        Використовується при "докручуванні" до потрібного рівня"""
-
-        match self.hero.level:
-
-            case level if level == BASE_SKILL_LEVELS[0]:
-                self.learn_skill(SKILLS["self_heal_small"], log=log)
-            case level if level == BASE_SKILL_LEVELS[1]:
-                self.forget_skill(SKILLS["self_heal_small"], log=log)
-                self.learn_skill(SKILLS["self_heal_medium"], log=log)
-            case level if level == BASE_SKILL_LEVELS[2]:
-                self.forget_skill(SKILLS["self_heal_medium"], log=log)
-                self.learn_skill(SKILLS["self_heal_strong"], log=log)
-            case level if level == BASE_SKILL_LEVELS[3]:
-                self.forget_skill(SKILLS["self_heal_strong"], log=log)
-                self.learn_skill(SKILLS["self_heal_ultimate"], log=log)
+        Використовується при "докручуванні" до потрібного рівня.
+        levels -- скільки рівнів щойно отримано: видається лише навичка
+        найвищого з пройдених рівнів"""
+
+        first = bisect_right(BASE_SKILL_LEVELS, self.hero.level - levels)
+        last = bisect_right(BASE_SKILL_LEVELS, self.hero.level)
+        if first == last:
+            return
+
+        if first > 0:
+            self.forget_skill(_BASE_SKILLS[first - 1], log=log)
+        # Навички проміжних рівнів вивчались би і одразу забувались
+        for skill in _BASE_SKILLS[first : last - 1]:
+            if skill in self.hero.skills:
+                self.forget_skill(skill, log=log)
+        self.learn_skill(_BASE_SKILLS[last - 1], log=log)
 
     def use_all_skills(self, timing: SkillTiming, log=LOG) -> None:
         """Використати всі вивчені навички, які відповідають
@@ -423,6 +581,8 @@ class SkillSystem:
 class EquipmentManager:
     """Управління екіпіровкою"""
 
+    __slots__ = ("hero",)
+
     def __init__(self, hero: Hero) -> None:
         self.hero = hero
 
@@ -443,12 +603,12 @@ class EquipmentManager:
         if current_hand != default_item:
             self.hero.inventory.append(current_hand)
         if item != default_item:
-            self.hero.output.write(f"Екіпіруємо {item.name}", log=log)
+            self.hero.output.write_lazy("Екіпіруємо {}", item.name, log=log)
         else:
             if current_hand != default_item:
-                self.hero.output.write(f"{current_hand.name} Знято!", log=log)
+                self.hero.output.write_lazy("{} Знято!", current_hand.name, log=log)
             else:
-                self.hero.output.write(f"В руках пусто!", log=log)
+                self.hero.output.write("В руках пусто!", log=log)
 
     def equip_weapon(self, weapon: Weapon | None = None, log: bool = LOG) -> None:
         """Екіпірує зброю."""
@@ -460,13 +620,15 @@ class EquipmentManager:
             if weapon.two_handed:
                 if self.hero.left_hand != JUST_HAND:
                     self.hero.inventory.append(self.hero.left_hand)
-                    self.hero.output.write(f"{weapon.name} потребує обох рук!", log=log)
-                    self.hero.output.write(
-                        f"{self.hero.left_hand.name} автоматично знято", log=log
+                    self.hero.output.write_lazy(
+                        "{} потребує обох рук!", weapon.name, log=log
+                    )
+                    self.hero.output.write_lazy(
+                        "{} автоматично знято", self.hero.left_hand.name, log=log
                     )
                 self.hero.left_hand = JUST_HAND
         else:
-            self.hero.output.write(f"{weapon.name} не є зброєю", log=log)
+            self.hero.output.write_lazy("{} не є зброєю", weapon.name, log=log)
 
     def equip_shield(self, shield: Shield | None = None, log: bool = LOG) -> None:
         """Екіпірує щит."""
@@ -479,15 +641,15 @@ class EquipmentManager:
             if shield != JUST_HAND:
                 if self.hero.right_hand.two_handed:
                     self.hero.inventory.append(self.hero.right_hand)
-                    self.hero.output.write(
-                        f"{self.hero.right_hand.name} потребує обох рук!", log=log
+                    self.hero.output.write_lazy(
+                        "{} потребує обох рук!", self.hero.right_hand.name, log=log
                     )
-                    self.hero.output.write(
-                        f"{self.hero.right_hand.name} автоматично знято", log=log
+                    self.hero.output.write_lazy(
+                        "{} автоматично знято", self.hero.right_hand.name, log=log
                     )
                     self.hero.right_hand = UNARMED_STRIKE
         else:
-            self.hero.output.write(f"{shield.name} не є щитом", log=log)
+            self.hero.output.write_lazy("{} не є щитом", shield.name, log=log)
 
     def add_item(self, item: Item, log: bool = LOG) -> None:
         """Додавання предметів в інвентар"""
@@ -495,11 +657,13 @@ class EquipmentManager:
         if isinstance(item, Item):
             if item != UNARMED_STRIKE and item != JUST_HAND:
                 self.hero.inventory.append(item)
-                self.hero.output.write(f"{self.hero.name} підбирає: {item}", log=log)
+                self.hero.output.write_lazy(
+                    "{} підбирає: {}", self.hero.name, item, log=log
+                )
             else:
-                self.hero.output.write(f"Не можна підібрати {item.name}", log=log)
+                self.hero.output.write_lazy("Не можна підібрати {}", item.name, log=log)
         else:
-            self.hero.output.write(f"{item} не є предметом", log=log)
+            self.hero.output.write_lazy("{} не є предметом", item, log=log)
 
     def select_item(self, item_class: Type | None = None) -> Item | None:
         """Повертає перший предмет з інвентаря, заданого типу"""
@@ -528,40 +692,91 @@ class HeroFactory:
         """Генерація рандомного героя, або героя з
         конкретними характеристиками"""
 
+        rng = get_rng()
         if sex is None:
-            sex = random.choice((Sex.M, Sex.F))
+            sex = rng.choice((Sex.M, Sex.F))
         if name is None:
             name = HeroFactory.select_name(sex=sex)
         if profession is None:
-            profession = random.choice(list(PROFESSIONS.values()))
+            profession = rng.choice(list(PROFESSIONS.values()))
         else:
             profession = PROFESSIONS[profession]
         if level is None:
-            experience = random.choice(EXPERIENCE_FOR_LEVEL)
+            level = EXPERIENCE_FOR_LEVEL.index(rng.choice(EXPERIENCE_FOR_LEVEL)) + 1
         else:
             level = clamp_value(level, MIN_LEVEL, MAX_LEVEL)
-            experience = EXPERIENCE_FOR_LEVEL[level - 1]
 
-        hero = Hero(
-            name=name,
-            sex=sex,
+        template = HeroFactory.template(profession, level, right_hand, left_hand)
+        return HeroFactory.clone(template, output=output, name=name, sex=sex)
+
+    @staticmethod
+    def generate_many(
+        output: OutputSpace,
+        n: int,
+        level: int | None = None,
+        profession: str | None = None,
+    ) -> list[Hero]:
+        """Генерація n рандомних героїв заданого рівня та/або професії"""
+        return [
+            HeroFactory.generate(output, level=level, profession=profession)
+            for _ in range(n)
+        ]
+
+    @staticmethod
+    def template(
+        profession: Profession,
+        level: int,
+        right_hand: Weapon | None = None,
+        left_hand: Shield | None = None,
+    ) -> Hero:
+        """Повертає шаблон героя з кешу, або створює його.
+        Характеристики, навички та екіпірування залежать лише від
+        професії, рівня та предметів у руках. Шаблон не можна змінювати --
+        лише клонувати через HeroFactory.clone"""
+
+        key = (profession, level, right_hand, left_hand)
+        template = _HERO_TEMPLATES.get(key)
+        if template is not None:
+            return template
+
+        template = Hero(
+            name="template",
+            sex=Sex.M,
             profession=profession,
-            experience=experience,
-            output=output,
+            experience=EXPERIENCE_FOR_LEVEL[level - 1],
+            output=NoneOutput(),
         )
 
         if left_hand is None:
-            hero.equipment.equip_shield(select_shield(hero.level), log=DEBUG)
+            template.equipment.equip_shield(select_shield(template.level), log=DEBUG)
         else:
-            hero.equipment.equip_shield(left_hand, log=DEBUG)
+            template.equipment.equip_shield(left_hand, log=DEBUG)
 
         if right_hand is None:
-            hero.equipment.equip_weapon(
-                select_weapon(hero.level, hero.profession.main_bonuses[0]), log=DEBUG
+            template.equipment.equip_weapon(
+                select_weapon(template.level, template.profession.main_bonuses[0]),
+                log=DEBUG,
             )
         else:
-            hero.equipment.equip_weapon(right_hand, log=DEBUG)
+            template.equipment.equip_weapon(right_hand, log=DEBUG)
 
+        _HERO_TEMPLATES[key] = template
+        return template
+
+    @staticmethod
+    def clone(template: Hero, output: OutputSpace, name: str, sex: Sex) -> Hero:
+        """Створює нового героя -- копію шаблону з власними іменем,
+        статтю та output"""
+
+        hero = copy.copy(template)
+        hero.name = sanitize_word(name)
+        hero.sex = sex
+        hero.output = output
+        hero.stats = template.stats.copy()
+        hero.skills = template.skills.copy()
+        hero.inventory = template.inventory.copy()
+
+        hero.output.write_lazy("Персонажа {} створено", hero.name, log=DEBUG)
         return hero
 
     @staticmethod
@@ -569,13 +784,6 @@ class HeroFactory:
         """Створення героя передаючи словник.
         Використовується при завантаженнях зі збереження"""
 
-        def _create_list(input_list: list, base: tuple) -> list:
-            """Допоміжна функція для забезпечення DRY"""
-            the_list = []
-            for item in input_list:
-                the_list.append(obj_finder(item, base))
-            return the_list
-
         def _get_sex(value: str) -> Sex | None:
             for sex in Sex:
                 if sex.value == value:
@@ -586,15 +794,15 @@ class HeroFactory:
             output=output,
             name=the_dict["name"],
             sex=_get_sex(the_dict["sex"]),
-            profession=obj_finder(the_dict["profession"], PROFESSIONS),
+            profession=PROFESSION_REGISTRY.by_name(the_dict["profession"]),
             experience=int(the_dict["experience"] or "0"),
         )
         hero.lives = int(the_dict["lives"] or "1")
         hero.money = int(the_dict["money"] or "0")
-        hero.right_hand = obj_finder(the_dict["right_hand"], ITEMS)
-        hero.left_hand = obj_finder(the_dict["left_hand"], ITEMS)
-        hero.inventory = _create_list(the_dict["inventory"], ITEMS)
-        hero.skills = _create_list(the_dict["skills"], SKILLS)
+        hero.right_hand = ITEM_REGISTRY.by_name(the_dict["right_hand"])
+        hero.left_hand = ITEM_REGISTRY.by_name(the_dict["left_hand"])
+        hero.inventory = [ITEM_REGISTRY.by_name(name) for name in the_dict["inventory"]]
+        hero.skills = [SKILL_REGISTRY.by_name(name) for name in the_dict["skills"]]
 
         return hero
 
@@ -623,10 +831,11 @@ class HeroFactory:
     @staticmethod
     def select_name(sex: Sex | None = None) -> str:
         """Допоміжна фун-ія для вибору імені героя при генерації"""
+        rng = get_rng()
         if sex is None:
-            sex = random.choice((Sex.M, Sex.F))
+            sex = rng.choice((Sex.M, Sex.F))
 
         if sex == Sex.F:
-            return random.choice(FEMALE_NAMES)
+            return rng.choice(FEMALE_NAMES)
         else:
-            return random.choice(MALE_NAMES)
+            return rng.choice(MALE_NAMES)
@@ -2,20 +2,24 @@
 from __future__ import annotations
 
 import random
+from abc import ABC, abstractmethod
+from array import array
 from enum import Enum, IntEnum
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from karatel.core.hero import Hero, HeroFactory
 from karatel.core.items import (
-    ITEMS,
     ITEMS_LIST,
     JUST_HAND,
     UNARMED_STRIKE,
     Item,
     match_level,
 )
+from karatel.core.registry import ITEM_REGISTRY
 from karatel.utils.constants import Emoji
-from karatel.utils.utils import obj_finder
+from karatel.utils.rng import SEED_BITS, get_rng, new_seed, seeded
 
 if TYPE_CHECKING:
     from karatel.ui.abstract import OutputSpace
@@ -44,6 +48,14 @@ class MapSize(IntEnum):
     Y = 15
 
 
+class MapLimits(IntEnum):
+    """Максимальний розмір мапи та розмір чанку,
+    яким генерується велика мапа"""
+
+    MAX = 1000
+    CHUNK = 16
+
+
 class GoldLimits(IntEnum):
     """Ліміти грошай при генерації клітинок з золотом"""
 
@@ -101,21 +113,19 @@ TYPES_OF_CELL = (
     + [CellType.GAME] * CellMultiplier.GAME
 )
 
+# Типи клітинок та їх ймовірності для векторної генерації чанків.
+# __members__, бо однакові значення в IntEnum стають псевдонімами
+WEIGHTED_CELL_TYPES = tuple(CellType[name] for name in CellMultiplier.__members__)
+CELL_WEIGHTS = np.array(
+    [value for value in CellMultiplier.__members__.values()], dtype=float
+)
+CELL_WEIGHTS /= CELL_WEIGHTS.sum()
 
-class Cell:
-    """Клас, що описує клітинку мапи"""
 
-    def __init__(
-        self,
-        cell_type: CellType,
-        obj: Hero | Item | None = None,
-        gold: int = 0,
-        experience: int = 0,
-    ) -> None:
-        self.type = cell_type
-        self.obj = obj
-        self.gold = gold
-        self.experience = experience
+class BaseCell:
+    """Спільна логіка клітинок мапи -- як окремих, так і 'вікон' у DungeonMap"""
+
+    __slots__ = ()
 
     @property
     def emoji(self) -> str:
@@ -145,6 +155,312 @@ class Cell:
                     return Emoji.TOMB.value
 
 
+class Cell(BaseCell):
+    """Клас, що описує клітинку мапи"""
+
+    __slots__ = ("type", "obj", "gold", "experience")
+
+    def __init__(
+        self,
+        cell_type: CellType,
+        obj: Hero | Item | None = None,
+        gold: int = 0,
+        experience: int = 0,
+    ) -> None:
+        self.type = cell_type
+        self.obj = obj
+        self.gold = gold
+        self.experience = experience
+
+
+# Типи клітинок за індексом, що зберігається в DungeonMap
+CELL_TYPES = tuple(CellType)
+_CELL_TYPE_INDEX = {cell_type: index for index, cell_type in enumerate(CELL_TYPES)}
+
+# Версія компактного формату збереження мапи (зерно + зміни)
+DELTA_FORMAT_VERSION = 2
+
+# Типи клітинок, позиції яких DungeonMap відстежує без сканування мапи
+INDEXED_CELL_TYPES = (CellType.HERO, CellType.ENEMY, CellType.ITEM, CellType.EXIT)
+
+
+class MapCell(BaseCell):
+    """'Вікно' на клітинку DungeonMap. Читання та запис
+    атрибутів йдуть напряму в масиви мапи"""
+
+    __slots__ = ("_map", "_index")
+
+    def __init__(self, the_map: DungeonMap, index: int) -> None:
+        self._map = the_map
+        self._index = index
+
+    @property
+    def type(self) -> CellType:
+        return CELL_TYPES[self._map.types[self._index]]
+
+    @type.setter
+    def type(self, cell_type: CellType) -> None:
+        self._map.set_type(self._index, cell_type)
+        self._map.mark(self._index)
+
+    @property
+    def obj(self) -> Hero | Item | None:
+        return self._map.objects.get(self._index)
+
+    @obj.setter
+    def obj(self, obj: Hero | Item | None) -> None:
+        if obj is None:
+            self._map.objects.pop(self._index, None)
+        else:
+            self._map.objects[self._index] = obj
+        self._map.mark(self._index)
+
+    @property
+    def gold(self) -> int:
+        return self._map.gold[self._index]
+
+    @gold.setter
+    def gold(self, value: int) -> None:
+        self._map.gold[self._index] = value
+        self._map.mark(self._index)
+
+    @property
+    def experience(self) -> int:
+        return self._map.experience[self._index]
+
+    @experience.setter
+    def experience(self, value: int) -> None:
+        self._map.experience[self._index] = value
+        self._map.mark(self._index)
+
+
+class MapRow:
+    """Рядок мапи. Дозволяє звертатися до мапи як the_map[y][x]"""
+
+    __slots__ = ("_map", "_y")
+
+    def __init__(self, the_map: BaseMap, y: int) -> None:
+        self._map = the_map
+        self._y = y
+
+    def __len__(self) -> int:
+        return self._map.width
+
+    def __getitem__(self, x: int) -> MapCell:
+        return self._map.cell(self._y, x)
+
+    def __setitem__(self, x: int, cell: BaseCell) -> None:
+        self._map.set_cell(self._y, x, cell)
+
+    def __iter__(self):
+        for x in range(self._map.width):
+            yield self._map.cell(self._y, x)
+
+
+class BaseMap(ABC):
+    """Спільний інтерфейс мап: звернення the_map[y][x] та ітерація по рядках"""
+
+    __slots__ = ()
+
+    width: int
+    height: int
+    seed: int | None
+    level: int | None
+    objects: dict[int, Hero | Item]
+
+    @abstractmethod
+    def cell(self, y: int, x: int) -> MapCell:
+        """Клітинка (Y, X)"""
+        pass
+
+    @abstractmethod
+    def set_cell(self, y: int, x: int, cell: BaseCell) -> None:
+        """Запис клітинки (Y, X)"""
+        pass
+
+    @abstractmethod
+    def coordinates(self, cell_type: CellType) -> list[tuple[int, int]]:
+        """Координати всіх клітинок типу cell_type"""
+        pass
+
+    @abstractmethod
+    def hero_position(self) -> tuple[int | None, int | None]:
+        """Позиція героя"""
+        pass
+
+    @abstractmethod
+    def count(self, cell_type: CellType) -> int:
+        """Кількість клітинок типу cell_type"""
+        pass
+
+    @abstractmethod
+    def touch(self, y: int, x: int) -> None:
+        """Позначає клітинку (Y, X) зміненою"""
+        pass
+
+    @abstractmethod
+    def changes(self) -> list[int]:
+        """Індекси змінених клітинок"""
+        pass
+
+    def reveal(self, y: int, x: int) -> None:
+        """Готує клітинки навколо (Y, X). Звичайна мапа вже згенерована повністю"""
+
+    def nearest(
+        self, cell_type: CellType, y: int, x: int
+    ) -> tuple[int | None, int | None]:
+        """Найближча до (Y, X) клітинка типу cell_type.
+        Відстань -- кількість ходів з урахуванням діагональних"""
+
+        best: tuple[int, int] | None = None
+        best_distance = -1
+        for cell_y, cell_x in self.coordinates(cell_type):
+            distance = max(abs(cell_y - y), abs(cell_x - x))
+            if best is None or distance < best_distance:
+                best, best_distance = (cell_y, cell_x), distance
+        return best if best is not None else (None, None)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> MapRow:
+        if not 0 <= y < self.height:
+            raise IndexError(f"Рядок {y} поза межами мапи")
+        return MapRow(self, y)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield MapRow(self, y)
+
+
+class DungeonMap(BaseMap):
+    """Компактна мапа підземелля.
+    Типи клітинок, гроші та досвід зберігаються у типізованих масивах,
+    об'єкти (герой, вороги, предмети) -- у словнику лише для клітинок, де вони є.
+    Підтримує звернення the_map[y][x], як до списку списків Cell.
+    Позиції героя, ворогів, предметів та виходу оновлюються при кожному
+    записі, тому їх пошук не потребує сканування мапи"""
+
+    __slots__ = (
+        "width",
+        "height",
+        "types",
+        "gold",
+        "experience",
+        "objects",
+        "positions",
+        "seed",
+        "level",
+        "changed",
+    )
+
+    def __init__(self, height: int = MapSize.Y, width: int = MapSize.X) -> None:
+        self.width = width
+        self.height = height
+        size = width * height
+        self.types = array("B", bytes(size))  # 0 -- CellType.EMPTY
+        self.gold = array("I", bytes(4 * size))
+        self.experience = array("I", bytes(4 * size))
+        self.objects: dict[int, Hero | Item] = {}
+        self.positions: dict[CellType, set[int]] = {
+            cell_type: set() for cell_type in INDEXED_CELL_TYPES
+        }
+        self.seed: int | None = None  # Зерно, з якого мапу згенеровано
+        self.level: int | None = None  # Рівень героя під час генерації
+        # Індекси клітинок, змінених після генерації. None -- не відстежуємо
+        self.changed: set[int] | None = None
+
+    @classmethod
+    def from_cells(cls, cells: list[list[BaseCell]]) -> DungeonMap:
+        """Створення мапи зі списку списків клітинок"""
+
+        the_map = cls(height=len(cells), width=len(cells[0]) if cells else 0)
+        for y, line in enumerate(cells):
+            for x, cell in enumerate(line):
+                the_map.set_cell(y, x, cell)
+        return the_map
+
+    def to_cells(self) -> list[list[Cell]]:
+        """Конвертація у список списків окремих клітинок"""
+        return [
+            [Cell(cell.type, cell.obj, cell.gold, cell.experience) for cell in line]
+            for line in self
+        ]
+
+    def index(self, y: int, x: int) -> int:
+        """Індекс клітинки у масивах мапи"""
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f"Клітинка ({y}, {x}) поза межами мапи")
+        return y * self.width + x
+
+    def cell(self, y: int, x: int) -> MapCell:
+        """Клітинка мапи за координатами"""
+        return MapCell(self, self.index(y, x))
+
+    def set_cell(self, y: int, x: int, cell: BaseCell) -> None:
+        """Записує вміст клітинки в мапу"""
+
+        index = self.index(y, x)
+        # Спершу читаємо все з cell -- вона може бути 'вікном' на цю ж мапу
+        cell_type, obj, gold, experience = (
+            cell.type,
+            cell.obj,
+            cell.gold,
+            cell.experience,
+        )
+        self.set_type(index, cell_type)
+        self.gold[index] = gold
+        self.experience[index] = experience
+        if obj is None:
+            self.objects.pop(index, None)
+        else:
+            self.objects[index] = obj
+        self.mark(index)
+
+    def mark(self, index: int) -> None:
+        """Позначає клітинку зміненою після генерації"""
+        if self.changed is not None:
+            self.changed.add(index)
+
+    def touch(self, y: int, x: int) -> None:
+        """Позначає клітинку зміненою, коли змінився сам об'єкт у ній
+        (наприклад, поранений ворог)"""
+        self.mark(self.index(y, x))
+
+    def changes(self) -> list[int]:
+        """Індекси змінених після генерації клітинок"""
+        return sorted(self.changed or ())
+
+    def set_type(self, index: int, cell_type: CellType) -> None:
+        """Змінює тип клітинки та оновлює індекс позицій"""
+
+        old_type = CELL_TYPES[self.types[index]]
+        if old_type is cell_type:
+            return
+        if old_type in self.positions:
+            self.positions[old_type].discard(index)
+        if cell_type in self.positions:
+            self.positions[cell_type].add(index)
+        self.types[index] = _CELL_TYPE_INDEX[cell_type]
+
+    def coordinates(self, cell_type: CellType) -> list[tuple[int, int]]:
+        """Координати (Y, X) всіх клітинок типу cell_type"""
+        return [
+            divmod(index, self.width) for index in sorted(self.positions[cell_type])
+        ]
+
+    def hero_position(self) -> tuple[int | None, int | None]:
+        """Координати героя (Y, X) або (None, None), якщо його немає на мапі"""
+
+        for index in self.positions[CellType.HERO]:
+            return divmod(index, self.width)
+        return None, None
+
+    def count(self, cell_type: CellType) -> int:
+        """Кількість клітинок типу cell_type"""
+        return len(self.positions[cell_type])
+
+
 EMPTY_CELL = Cell(CellType.EMPTY, None)  # Пуста клітинка
 
 
@@ -156,6 +472,8 @@ def select_obj(
 ) -> Cell:
     """Вибір клітинки. Якщо не задано тип -- випадковий"""
 
+    rng = get_rng()
+
     def _generate_enemy(level: int | None = None) -> Cell:
         """Створення клітинки з ворогом"""
 
@@ -163,7 +481,7 @@ def select_obj(
         enemy_cell = Cell(
             cell_type=CellType.ENEMY,
             obj=enemy,
-            gold=random.randint(GoldLimits.MIN, GoldLimits.ENEMY * enemy.level),
+            gold=rng.randint(GoldLimits.MIN, GoldLimits.ENEMY * enemy.level),
         )
         return enemy_cell
 
@@ -171,7 +489,7 @@ def select_obj(
         """Створення клітинки з предметом"""
 
         if all_items:
-            item = random.choice(all_items)
+            item = rng.choice(all_items)
             all_items.remove(item)
         else:
             item = None
@@ -188,7 +506,7 @@ def select_obj(
         gold_cell = Cell(
             cell_type=CellType.GOLD,
             obj=None,
-            gold=random.randint(GoldLimits.MIN, GoldLimits.MAX) * enemy_level,
+            gold=rng.randint(GoldLimits.MIN, GoldLimits.MAX) * enemy_level,
         )
         return gold_cell
 
@@ -207,7 +525,7 @@ def select_obj(
         book_cell = Cell(
             cell_type=CellType.BOOK,
             obj=None,
-            experience=random.randint(ExpLimits.MIN, ExpLimits.MAX) * enemy_level,
+            experience=rng.randint(ExpLimits.MIN, ExpLimits.MAX) * enemy_level,
         )
         return book_cell
 
@@ -241,209 +559,512 @@ def select_obj(
                 return EMPTY_CELL
 
     if cell_type is None:
-        cell_type = random.choice(TYPES_OF_CELL)
+        cell_type = rng.choice(TYPES_OF_CELL)
 
     return _create()
 
 
-def generate_map(hero: Hero) -> list[list[Cell]]:
-    """Генерація мапи"""
-
-    def _crate_item_list() -> list:
-        item_list: list = []
-        # Метчимо рівень героя з рівнем предметів, які випадають на мапі
-        # та додаємо мультиплікатор
-        start_index = match_level(hero.level)
-        max_index = match_level(hero.level) + EnemyLine.MULTIPLIER
-        # Створюємо список предметів, який приблизно відповідає рівню героя
-        for a_list in ITEMS_LIST:
-            for index, item in enumerate(a_list[start_index:], start=start_index):
-                item_list.append(item)
-                if index == max_index:
-                    break
-        # Видаляємо дефолтні предмети, якщо вони є
-        if UNARMED_STRIKE in item_list:
-            item_list.remove(UNARMED_STRIKE)
-        if JUST_HAND in item_list:
-            item_list.remove(JUST_HAND)
-        return item_list
-
-    start_hero_position_y = random.randint(0, StartHeroPosition.Y)
-    start_hero_position_x = random.randint(0, StartHeroPosition.X)
-
-    all_items = _crate_item_list()
-
-    the_map: list[list] = []
-    for coordinate_y in range(MapSize.Y):
-        line_y: list[Cell] = []
-        for coordinate_x in range(0, MapSize.X):
-
-            # Встановлюємо гравця на стартову позицію
-            if (
-                coordinate_y == start_hero_position_y
-                and coordinate_x == start_hero_position_x
-            ):
-                cell = Cell(CellType.HERO, hero)
-
-            # Встановлюємо ворогів перед виходом з підземелля
-            elif (
-                MapSize.Y - EnemyLine.Y <= coordinate_y <= MapSize.Y - 1
-                and MapSize.X - EnemyLine.X <= coordinate_x <= MapSize.X - 1
-            ) and (coordinate_y != MapSize.Y - 1 or coordinate_x != MapSize.X - 1):
-                cell = select_obj(
-                    output=hero.output,
-                    all_items=all_items,
-                    cell_type=CellType.ENEMY,
-                    enemy_level=hero.level + EnemyLine.MULTIPLIER,
-                )
+def _items_for_level(level: int) -> list:
+    """Список предметів, які приблизно відповідають рівню героя"""
+
+    item_list: list = []
+    # Метчимо рівень героя з рівнем предметів, які випадають на мапі
+    # та додаємо мультиплікатор
+    start_index = match_level(level)
+    max_index = match_level(level) + EnemyLine.MULTIPLIER
+    # Створюємо список предметів, який приблизно відповідає рівню героя
+    for a_list in ITEMS_LIST:
+        for index, item in enumerate(a_list[start_index:], start=start_index):
+            item_list.append(item)
+            if index == max_index:
+                break
+    # Видаляємо дефолтні предмети, якщо вони є
+    if UNARMED_STRIKE in item_list:
+        item_list.remove(UNARMED_STRIKE)
+    if JUST_HAND in item_list:
+        item_list.remove(JUST_HAND)
+    return item_list
+
+
+def _place_cell(
+    hero: Hero,
+    level: int,
+    all_items: list,
+    coordinate_y: int,
+    coordinate_x: int,
+    height: int,
+    width: int,
+    start: tuple[int, int],
+    cell_type: CellType | None = None,
+) -> Cell:
+    """Клітинка мапи з урахуванням стартової позиції героя,
+    лінії ворогів перед виходом та самого виходу.
+    cell_type -- тип для решти клітинок. Якщо не задано -- випадковий"""
+
+    # Встановлюємо гравця на стартову позицію
+    if (coordinate_y, coordinate_x) == start:
+        return Cell(CellType.HERO, hero)
+
+    # Встановлюємо ворогів перед виходом з підземелля
+    elif (
+        height - EnemyLine.Y <= coordinate_y <= height - 1
+        and width - EnemyLine.X <= coordinate_x <= width - 1
+    ) and (coordinate_y != height - 1 or coordinate_x != width - 1):
+        return select_obj(
+            output=hero.output,
+            all_items=all_items,
+            cell_type=CellType.ENEMY,
+            enemy_level=level + EnemyLine.MULTIPLIER,
+        )
+
+    # Встановлюємо вихід
+    elif coordinate_y == height - 1 and coordinate_x == width - 1:
+        return Cell(
+            CellType.EXIT,
+            None,
+            gold=get_rng().randint((GoldLimits.EXIT // 2), GoldLimits.EXIT),
+        )
+
+    # Генеруємо випадкові клітинки мапи
+    else:
+        return select_obj(
+            output=hero.output,
+            all_items=all_items,
+            cell_type=cell_type,
+            enemy_level=level,
+        )
+
+
+def _check_size(height: int, width: int) -> None:
+    """Перевірка розміру мапи"""
+    if not (1 <= height <= MapLimits.MAX and 1 <= width <= MapLimits.MAX):
+        raise ValueError(
+            f"Розмір мапи {height}x{width} поза межами 1..{MapLimits.MAX.value}"
+        )
 
-            # Встановлюємо вихід
-            elif coordinate_y == MapSize.Y - 1 and coordinate_x == MapSize.X - 1:
-                cell = Cell(
-                    CellType.EXIT,
-                    None,
-                    gold=random.randint((GoldLimits.EXIT // 2), GoldLimits.EXIT),
-                )
 
-            # Генеруємо випадкові клітинки мапи
-            else:
-                cell = select_obj(
-                    output=hero.output, all_items=all_items, enemy_level=hero.level
+def _check_seed(seed: int) -> None:
+    """Перевірка зерна: воно зберігається як беззнакове 32-бітне число"""
+    if not 0 <= seed < 2**SEED_BITS:
+        raise ValueError(f"Зерно мапи {seed} поза межами 0..{2**SEED_BITS - 1}")
+
+
+def generate_map(
+    hero: Hero,
+    height: int = MapSize.Y,
+    width: int = MapSize.X,
+    seed: int | None = None,
+    level: int | None = None,
+) -> DungeonMap:
+    """Генерація мапи. Мапа повністю визначається зерном та рівнем героя.
+    Якщо зерно не задано -- нове з поточного генератора.
+    level -- рівень ворогів та предметів. Якщо не задано -- рівень героя"""
+
+    _check_size(height, width)
+
+    if seed is None:
+        seed = new_seed()
+    _check_seed(seed)
+    if level is None:
+        level = hero.level
+
+    the_map = DungeonMap(height=height, width=width)
+    the_map.seed = seed
+    the_map.level = level
+
+    with seeded(seed) as rng:
+        start_hero_position_y = rng.randint(0, min(StartHeroPosition.Y, height - 1))
+        start_hero_position_x = rng.randint(0, min(StartHeroPosition.X, width - 1))
+        start = (start_hero_position_y, start_hero_position_x)
+
+        all_items = _items_for_level(level)
+
+        for coordinate_y in range(height):
+            for coordinate_x in range(0, width):
+                cell = _place_cell(
+                    hero,
+                    level,
+                    all_items,
+                    coordinate_y,
+                    coordinate_x,
+                    height,
+                    width,
+                    start,
                 )
+                the_map.set_cell(coordinate_y, coordinate_x, cell)
 
-            line_y.append(cell)
-        the_map.append(line_y)
+    the_map.changed = set()
     return the_map
 
 
-def render_map(output: OutputSpace, the_map: list) -> None:
-    """Рендеринг мапи"""
+class LazyDungeonMap(BaseMap):
+    """Велика мапа, що генерується чанками MapLimits.CHUNK x MapLimits.CHUNK
+    при першому зверненні до них. Кожен чанк визначається зерном мапи
+    та своїми координатами, тож пам'ять і час генерації залежать
+    від дослідженої площі, а не від розміру мапи"""
 
-    text = ""
-    for y in the_map:
-        for x in y:
-            text += " " + x.emoji + " "
-        text += "\n"
-    output.write(text)
+    __slots__ = ("width", "height", "seed", "level", "hero", "start", "chunks")
 
+    def __init__(
+        self, hero: Hero, height: int, width: int, seed: int, level: int
+    ) -> None:
+        _check_size(height, width)
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.level = level
+        self.hero = hero
+        self.chunks: dict[tuple[int, int], DungeonMap] = {}
+
+        start_random = random.Random(seed)
+        self.start = (
+            start_random.randint(0, min(StartHeroPosition.Y, height - 1)),
+            start_random.randint(0, min(StartHeroPosition.X, width - 1)),
+        )
 
-def map_to_dict(the_map: list) -> list:
-    """Конвертація мапи в словник для збереження в БД"""
+    def _chunk(self, chunk_y: int, chunk_x: int) -> DungeonMap:
+        """Чанк мапи. Генерується при першому зверненні"""
 
-    map_dict: list = []
-    for y in the_map:
-        line: list = []
-        for x in y:
-            match x.type.value:
-                case CellType.HERO.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "obj": HeroFactory.hero_to_dict(x.obj),
-                        }
-                    )
-                case CellType.ENEMY.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "obj": HeroFactory.hero_to_dict(x.obj),
-                            "gold": x.gold,
-                        }
-                    )
-                case CellType.ITEM.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "obj": getattr(x.obj, "name", None),
-                        }
-                    )
-                case CellType.GOLD.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "gold": x.gold,
-                        }
-                    )
-                case CellType.BOOK.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "experience": x.experience,
-                        }
+        chunk = self.chunks.get((chunk_y, chunk_x))
+        if chunk is None:
+            chunk = self._generate_chunk(chunk_y, chunk_x)
+            self.chunks[(chunk_y, chunk_x)] = chunk
+        return chunk
+
+    def _generate_chunk(self, chunk_y: int, chunk_x: int) -> DungeonMap:
+        """Генерація чанку з зерна мапи"""
+
+        rng = np.random.default_rng([self.seed, chunk_y, chunk_x])
+        top = chunk_y * MapLimits.CHUNK
+        left = chunk_x * MapLimits.CHUNK
+        height = min(MapLimits.CHUNK, self.height - top)
+        width = min(MapLimits.CHUNK, self.width - left)
+
+        # Векторно вибираємо типи всіх клітинок чанку
+        types = rng.choice(
+            len(WEIGHTED_CELL_TYPES), size=(height, width), p=CELL_WEIGHTS
+        )
+
+        chunk = DungeonMap(height=height, width=width)
+        with seeded(int(rng.integers(2**32))):
+            all_items = _items_for_level(self.level)
+            for local_y in range(height):
+                for local_x in range(width):
+                    cell = _place_cell(
+                        self.hero,
+                        self.level,
+                        all_items,
+                        top + local_y,
+                        left + local_x,
+                        self.height,
+                        self.width,
+                        self.start,
+                        cell_type=WEIGHTED_CELL_TYPES[types[local_y, local_x]],
                     )
-                case CellType.EXIT.value:
-                    line.append(
-                        {
-                            "type": x.type.value,
-                            "gold": x.gold,
-                        }
+                    if cell is not EMPTY_CELL:
+                        chunk.set_cell(local_y, local_x, cell)
+        chunk.changed = set()
+        return chunk
+
+    def _locate(self, y: int, x: int) -> tuple[DungeonMap, int, int]:
+        """Чанк та координати клітинки в ньому"""
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise IndexError(f"Клітинка ({y}, {x}) поза межами мапи")
+        chunk_y, local_y = divmod(y, MapLimits.CHUNK)
+        chunk_x, local_x = divmod(x, MapLimits.CHUNK)
+        return self._chunk(chunk_y, chunk_x), local_y, local_x
+
+    def cell(self, y: int, x: int) -> MapCell:
+        """Клітинка мапи за координатами"""
+        chunk, local_y, local_x = self._locate(y, x)
+        return chunk.cell(local_y, local_x)
+
+    def set_cell(self, y: int, x: int, cell: BaseCell) -> None:
+        """Записує вміст клітинки в мапу"""
+        chunk, local_y, local_x = self._locate(y, x)
+        chunk.set_cell(local_y, local_x, cell)
+
+    def touch(self, y: int, x: int) -> None:
+        """Позначає клітинку зміненою"""
+        chunk, local_y, local_x = self._locate(y, x)
+        chunk.touch(local_y, local_x)
+
+    def changes(self) -> list[int]:
+        """Індекси змінених після генерації клітинок у всій мапі"""
+
+        result = []
+        for (chunk_y, chunk_x), chunk in self.chunks.items():
+            for index in chunk.changes():
+                local_y, local_x = divmod(index, chunk.width)
+                y = chunk_y * MapLimits.CHUNK + local_y
+                x = chunk_x * MapLimits.CHUNK + local_x
+                result.append(y * self.width + x)
+        return sorted(result)
+
+    def reveal(self, y: int, x: int, radius: int = MapLimits.CHUNK) -> None:
+        """Генерує всі чанки в радіусі radius клітинок від (Y, X)"""
+
+        first_y = max(0, y - radius) // MapLimits.CHUNK
+        last_y = min(self.height - 1, y + radius) // MapLimits.CHUNK
+        first_x = max(0, x - radius) // MapLimits.CHUNK
+        last_x = min(self.width - 1, x + radius) // MapLimits.CHUNK
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                self._chunk(chunk_y, chunk_x)
+
+    @property
+    def objects(self) -> dict[int, Hero | Item]:
+        """Об'єкти згенерованих чанків за індексом клітинки у всій мапі"""
+
+        objects = {}
+        for (chunk_y, chunk_x), chunk in self.chunks.items():
+            for index, obj in chunk.objects.items():
+                local_y, local_x = divmod(index, chunk.width)
+                y = chunk_y * MapLimits.CHUNK + local_y
+                x = chunk_x * MapLimits.CHUNK + local_x
+                objects[y * self.width + x] = obj
+        return objects
+
+    def coordinates(self, cell_type: CellType) -> list[tuple[int, int]]:
+        """Координати (Y, X) клітинок типу cell_type у згенерованих чанках"""
+
+        result = []
+        for (chunk_y, chunk_x), chunk in self.chunks.items():
+            for local_y, local_x in chunk.coordinates(cell_type):
+                result.append(
+                    (
+                        chunk_y * MapLimits.CHUNK + local_y,
+                        chunk_x * MapLimits.CHUNK + local_x,
                     )
-                case CellType.HEART.value | CellType.GAME.value | CellType.EMPTY.value:
-                    line.append({"type": x.type.value})
+                )
+        return sorted(result)
 
-                case _:
-                    line.append({"type": x.type.value})
+    def hero_position(self) -> tuple[int | None, int | None]:
+        """Координати героя (Y, X) або (None, None), якщо його немає на мапі"""
 
-        map_dict.append(line)
-    return map_dict
+        for (chunk_y, chunk_x), chunk in self.chunks.items():
+            local_y, local_x = chunk.hero_position()
+            if local_y is not None and local_x is not None:
+                return (
+                    chunk_y * MapLimits.CHUNK + local_y,
+                    chunk_x * MapLimits.CHUNK + local_x,
+                )
+        return None, None
+
+    def count(self, cell_type: CellType) -> int:
+        """Кількість клітинок типу cell_type у згенерованих чанках"""
+        return sum(chunk.count(cell_type) for chunk in self.chunks.values())
+
+
+def generate_lazy_map(
+    hero: Hero,
+    height: int,
+    width: int,
+    seed: int | None = None,
+    level: int | None = None,
+) -> LazyDungeonMap:
+    """Генерація великої мапи, що створюється чанками навколо героя.
+    Якщо зерно не задано -- випадкове, рівень -- рівень героя"""
+
+    if seed is None:
+        seed = new_seed()
+    _check_seed(seed)
+    if level is None:
+        level = hero.level
+    the_map = LazyDungeonMap(hero, height=height, width=width, seed=seed, level=level)
+    the_map.reveal(*the_map.start)
+    return the_map
 
 
-def dict_to_map(output: OutputSpace, the_list: list) -> list:
-    """Конвертація словника в мапу для відновлення з БД"""
+def render_map(output: OutputSpace, the_map: DungeonMap) -> None:
+    """Рендеринг мапи"""
 
-    the_map: list[list] = []
-    for y in the_list:
-        line_y: list[Cell] = []
+    text = ""
+    for y in the_map:
         for x in y:
+            text += " " + x.emoji + " "
+        text += "\n"
+    output.write(text)
 
-            cell = EMPTY_CELL
 
-            match x["type"]:
+def _cell_to_dict(cell: BaseCell) -> dict:
+    """Конвертація клітинки в словник"""
+
+    match cell.type.value:
+        case CellType.HERO.value:
+            return {
+                "type": cell.type.value,
+                "obj": HeroFactory.hero_to_dict(cell.obj),
+            }
+        case CellType.ENEMY.value:
+            return {
+                "type": cell.type.value,
+                "obj": HeroFactory.hero_to_dict(cell.obj),
+                "gold": cell.gold,
+            }
+        case CellType.ITEM.value:
+            return {
+                "type": cell.type.value,
+                "obj": getattr(cell.obj, "name", None),
+            }
+        case CellType.GOLD.value:
+            return {
+                "type": cell.type.value,
+                "gold": cell.gold,
+            }
+        case CellType.BOOK.value:
+            return {
+                "type": cell.type.value,
+                "experience": cell.experience,
+            }
+        case CellType.EXIT.value:
+            return {
+                "type": cell.type.value,
+                "gold": cell.gold,
+            }
+        case CellType.HEART.value | CellType.GAME.value | CellType.EMPTY.value:
+            return {"type": cell.type.value}
+
+        case _:
+            return {"type": cell.type.value}
+
+
+def _dict_to_cell(output: OutputSpace, x: dict) -> Cell:
+    """Конвертація словника в клітинку"""
+
+    match x["type"]:
+
+        case CellType.HERO.value:
+            return Cell(
+                cell_type=CellType.HERO,
+                obj=HeroFactory.dict_to_hero(output, x["obj"]),
+            )
+
+        case CellType.ENEMY.value:
+            return Cell(
+                cell_type=CellType.ENEMY,
+                obj=HeroFactory.dict_to_hero(output, x["obj"]),
+                gold=x["gold"],
+            )
+
+        case CellType.ITEM.value:
+            return Cell(
+                cell_type=CellType.ITEM,
+                obj=ITEM_REGISTRY.by_name(x["obj"]),
+            )
+
+        case CellType.GOLD.value:
+            return Cell(cell_type=CellType.GOLD, obj=None, gold=x["gold"])
+
+        case CellType.BOOK.value:
+            return Cell(cell_type=CellType.BOOK, obj=None, experience=x["experience"])
+
+        case CellType.EXIT.value:
+            return Cell(cell_type=CellType.EXIT, obj=None, gold=x["gold"])
+
+        case CellType.HEART.value:
+            return Cell(cell_type=CellType.HEART, obj=None)
+
+        case CellType.GAME.value:
+            return Cell(cell_type=CellType.GAME, obj=None)
+
+        case CellType.EMPTY.value | _:
+            return EMPTY_CELL
+
+
+def map_to_dict(the_map: BaseMap) -> list:
+    """Конвертація мапи в словник для збереження в БД.
+    Повний формат -- всі клітинки мапи"""
+
+    return [[_cell_to_dict(x) for x in y] for y in the_map]
+
+
+def map_to_delta(the_map: BaseMap) -> dict:
+    """Компактний формат збереження: зерно, рівень генерації та лише
+    змінені клітинки (відвідані, вбиті вороги, зібрані предмети).
+    Клітинка героя зберігається завжди"""
+
+    if the_map.seed is None or the_map.level is None:
+        raise ValueError("Мапу без зерна неможливо зберегти як зміни")
+
+    changes = set(the_map.changes())
+    hero_y, hero_x = the_map.hero_position()
+    if hero_y is not None and hero_x is not None:
+        changes.add(hero_y * the_map.width + hero_x)
+
+    delta = []
+    for index in sorted(changes):
+        y, x = divmod(index, the_map.width)
+        delta.append([index, _cell_to_dict(the_map[y][x])])
+
+    return {
+        "version": DELTA_FORMAT_VERSION,
+        "seed": the_map.seed,
+        "level": the_map.level,
+        "height": int(the_map.height),
+        "width": int(the_map.width),
+        "lazy": isinstance(the_map, LazyDungeonMap),
+        "delta": delta,
+    }
+
+
+def map_to_save(the_map: BaseMap) -> list | dict:
+    """Формат для збереження в БД: компактний, якщо мапу можна
+    відтворити з зерна, інакше повний"""
+
+    if the_map.seed is not None and the_map.level is not None:
+        return map_to_delta(the_map)
+    return map_to_dict(the_map)
 
-                case CellType.HERO.value:
-                    cell = Cell(
-                        cell_type=CellType.HERO,
-                        obj=HeroFactory.dict_to_hero(output, x["obj"]),
-                    )
 
-                case CellType.ENEMY.value:
-                    cell = Cell(
-                        cell_type=CellType.ENEMY,
-                        obj=HeroFactory.dict_to_hero(output, x["obj"]),
-                        gold=x["gold"],
-                    )
+def _delta_to_map(output: OutputSpace, the_dict: dict) -> BaseMap:
+    """Відтворення мапи з зерна та застосування змін"""
 
-                case CellType.ITEM.value:
-                    cell = Cell(
-                        cell_type=CellType.ITEM,
-                        obj=(
-                            obj_finder(x["obj"], ITEMS)
-                            if x["obj"] is not None
-                            else None
-                        ),
-                    )
+    if the_dict.get("version") != DELTA_FORMAT_VERSION:
+        raise ValueError(f"Невідома версія формату мапи: {the_dict.get('version')}")
 
-                case CellType.GOLD.value:
-                    cell = Cell(cell_type=CellType.GOLD, obj=None, gold=x["gold"])
+    delta = [(index, _dict_to_cell(output, x)) for index, x in the_dict["delta"]]
 
-                case CellType.BOOK.value:
-                    cell = Cell(
-                        cell_type=CellType.BOOK, obj=None, experience=x["experience"]
-                    )
+    # Генерації потрібен герой -- беремо збереженого з його клітинки
+    hero = next(
+        (cell.obj for _, cell in delta if cell.type == CellType.HERO),
+        None,
+    )
+    if hero is None:
+        hero = HeroFactory.generate(output, level=the_dict["level"])
+
+    generate = generate_lazy_map if the_dict["lazy"] else generate_map
+    the_map = generate(
+        hero,
+        height=the_dict["height"],
+        width=the_dict["width"],
+        seed=the_dict["seed"],
+        level=the_dict["level"],
+    )
 
-                case CellType.EXIT.value:
-                    cell = Cell(cell_type=CellType.EXIT, obj=None, gold=x["gold"])
+    # Стартову клітинку, якщо герой з неї пішов, поверне delta
+    start_y, start_x = the_map.hero_position()
+    if start_y is not None and start_x is not None:
+        the_map[start_y][start_x] = EMPTY_CELL
 
-                case CellType.HEART.value:
-                    cell = Cell(cell_type=CellType.HEART, obj=None)
+    for index, cell in delta:
+        the_map.set_cell(*divmod(index, the_map.width), cell)
+    return the_map
 
-                case CellType.GAME.value:
-                    cell = Cell(cell_type=CellType.GAME, obj=None)
 
-                case CellType.EMPTY.value | _:
-                    pass  # cell вже встановлено
+def dict_to_map(output: OutputSpace, the_list: list | dict) -> BaseMap:
+    """Конвертація словника в мапу для відновлення з БД.
+    Підтримує повний формат (список рядків) та компактний (зерно + зміни)"""
 
-            line_y.append(cell)
+    if isinstance(the_list, dict):
+        return _delta_to_map(output, the_list)
 
-        the_map.append(line_y)
+    the_map = DungeonMap(
+        height=len(the_list), width=len(the_list[0]) if the_list else 0
+    )
+    for coordinate_y, y in enumerate(the_list):
+        for coordinate_x, x in enumerate(y):
+            cell = _dict_to_cell(output, x)
+            if cell is not EMPTY_CELL:
+                the_map.set_cell(coordinate_y, coordinate_x, cell)
     return the_map
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Реєстр предметів, навичок та професій.
+Індекси будуються один раз при імпорті, тому пошук за назвою чи ID -- O(1)"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Generic, Iterable, Iterator, TypeVar
+
+from karatel.core.items import ITEMS, Item
+from karatel.core.professions import PROFESSIONS, Profession
+from karatel.core.skills import SKILLS, Skill
+
+T = TypeVar("T", Item, Skill, Profession)
+
+
+def stable_id(name: str) -> int:
+    """Стабільний ID об'єкта -- CRC32 його назви.
+    Не залежить від порядку в базах, тож придатний для збережень"""
+    return zlib.crc32(name.encode("utf-8"))
+
+
+class Registry(Generic[T]):
+    """Індекси об'єктів бази: назва -> об'єкт та ID -> об'єкт"""
+
+    __slots__ = ("title", "_by_name", "_by_id")
+
+    def __init__(self, title: str, objects: Iterable[T]) -> None:
+        self.title = title
+        self._by_name: dict[str, T] = {}
+        self._by_id: dict[int, T] = {}
+
+        for obj in objects:
+            # Як і раніше при лінійному пошуку -- перемагає перший з назвою
+            if obj.name in self._by_name:
+                continue
+            obj_id = stable_id(obj.name)
+            if obj_id in self._by_id:
+                raise ValueError(
+                    f"{title}: однаковий ID у '{obj.name}' "
+                    f"та '{self._by_id[obj_id].name}'"
+                )
+            self._by_name[obj.name] = obj
+            self._by_id[obj_id] = obj
+
+    def by_name(self, name: str | None) -> T | None:
+        """Об'єкт за назвою або None"""
+        return self._by_name.get(name) if name is not None else None
+
+    def by_id(self, obj_id: int) -> T:
+        """Об'єкт за ID. KeyError, якщо такого немає"""
+        return self._by_id[obj_id]
+
+    def id_of(self, obj: T) -> int:
+        """ID об'єкта"""
+        return stable_id(obj.name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._by_name.values())
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+
+ITEM_REGISTRY: Registry[Item] = Registry("Предмети", ITEMS)
+SKILL_REGISTRY: Registry[Skill] = Registry("Навички", SKILLS.values())
+PROFESSION_REGISTRY: Registry[Profession] = Registry("Професії", PROFESSIONS.values())
@@ -62,8 +62,11 @@ class HealSelfSkill(Skill):
                     power = self.power
             # Обмеження максимального здоров'я реалізовано через сеттер Hero.hp
             hero.hp += power
-            hero.output.write(
-                f"{hero.name} Відновлює {power} здоров'я за допомогою '{self.name}'",
+            hero.output.write_lazy(
+                "{} Відновлює {} здоров'я за допомогою '{}'",
+                hero.name,
+                power,
+                self.name,
                 log=log,
             )
 
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""Бінарні знімки героїв та мап.
+Назви предметів, навичок та професій зберігаються як короткі числові ID,
+а герой відновлюється без повторного проходження всіх рівнів"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+
+from karatel.core.hero import Hero, HeroFactory
+from karatel.core.map import CELL_TYPES, DungeonMap
+from karatel.core.registry import ITEM_REGISTRY, PROFESSION_REGISTRY, SKILL_REGISTRY
+from karatel.utils.constants import Sex
+from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
+
+if TYPE_CHECKING:
+    from karatel.core.items import Item
+    from karatel.ui.abstract import OutputSpace
+
+SNAPSHOT_VERSION = 2
+
+HERO_MAGIC = b"KH"
+MAP_MAGIC = b"KM"
+
+# ID предметів, навичок та професій -- зі спільного реєстру,
+# тому не залежать від порядку в базах
+_SEXES = tuple(Sex)
+_STATS = ("Strength", "Dexterity", "Constitution", "Intelligence", "Charisma")
+
+# Заголовок: магічні байти, версія
+_HEADER = struct.Struct("<2sB")
+# Герой: стать, професія, рівень, досвід, hp, max_hp, життя, гроші,
+# характеристики, права та ліва рука, кількість навичок та предметів
+_HERO = struct.Struct(f"<BIBIHHBI{len(_STATS)}hIIBH")
+# Мапа: висота, ширина, прапорці, зерно, рівень генерації, кількість об'єктів
+_MAP = struct.Struct("<HHBIBI")
+# Об'єкт на мапі: індекс клітинки, тип об'єкта
+_OBJECT = struct.Struct("<IB")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+_OBJECT_HERO = 0
+_OBJECT_ITEM = 1
+
+_FLAG_SEED = 1
+_FLAG_CHANGES = 2
+
+
+class SnapshotError(ValueError):
+    """Пошкоджений або несумісний знімок"""
+
+
+class _Reader:
+    """Послідовне читання з буфера"""
+
+    __slots__ = ("data", "offset")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def read(self, size: int) -> memoryview:
+        if self.offset + size > len(self.data):
+            raise SnapshotError("Знімок обрізано")
+        chunk = self.data[self.offset : self.offset + size]
+        self.offset += size
+        return chunk
+
+    def array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        values.frombytes(self.read(count * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+
+def _array_bytes(values: array) -> bytes:
+    """Байти масиву в little-endian"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _check_header(reader: _Reader, magic: bytes) -> None:
+    """Перевірка магічних байтів та версії"""
+
+    try:
+        found, version = reader.unpack(_HEADER)
+    except struct.error as e:
+        raise SnapshotError("Знімок обрізано") from e
+    if found != magic:
+        raise SnapshotError(f"Очікувався знімок {magic!r}, отримано {found!r}")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Невідома версія знімка: {version}")
+
+
+def _pack_hero(hero: Hero, parts: list) -> None:
+    """Запис героя в список частин буфера"""
+
+    name = hero.name.encode("utf-8")
+    parts.append(_U16.pack(len(name)))
+    parts.append(name)
+    parts.append(
+        _HERO.pack(
+            _SEXES.index(hero._sex),
+            PROFESSION_REGISTRY.id_of(hero.profession),
+            hero.level,
+            hero.experience,
+            hero._hp,
+            hero.max_hp,
+            hero.lives,
+            hero.money,
+            *(hero.stats[stat] for stat in _STATS),
+            ITEM_REGISTRY.id_of(hero.right_hand),
+            ITEM_REGISTRY.id_of(hero.left_hand),
+            len(hero.skills),
+            len(hero.inventory),
+        )
+    )
+    ids = [SKILL_REGISTRY.id_of(skill) for skill in hero.skills]
+    ids += [ITEM_REGISTRY.id_of(item) for item in hero.inventory]
+    parts.append(struct.pack(f"<{len(ids)}I", *ids))
+
+
+def _unpack_hero(output: OutputSpace, reader: _Reader) -> Hero:
+    """Відновлення героя. Характеристики встановлюються напряму,
+    без повторного підвищення рівнів"""
+
+    (name_size,) = reader.unpack(_U16)
+    name = bytes(reader.read(name_size)).decode("utf-8")
+    (
+        sex,
+        profession,
+        level,
+        experience,
+        hp,
+        max_hp,
+        lives,
+        money,
+        *stats,
+        right_hand,
+        left_hand,
+        skills_count,
+        inventory_count,
+    ) = reader.unpack(_HERO)
+    ids = reader.unpack(struct.Struct(f"<{skills_count + inventory_count}I"))
+    if not MIN_LEVEL <= level <= MAX_LEVEL:
+        raise SnapshotError(f"Недопустимий рівень героя: {level}")
+
+    profession = PROFESSION_REGISTRY.by_id(profession)
+    hero = HeroFactory.clone(
+        HeroFactory.template(profession, level),
+        output=output,
+        name=name,
+        sex=_SEXES[sex],
+    )
+    hero._level = level
+    hero._experience = experience
+    hero.max_hp = max_hp
+    hero._hp = hp
+    hero._lives = lives
+    hero._money = money
+    hero.stats = dict(zip(_STATS, stats))
+    hero.right_hand = ITEM_REGISTRY.by_id(right_hand)
+    hero.left_hand = ITEM_REGISTRY.by_id(left_hand)
+    hero.skills = [SKILL_REGISTRY.by_id(obj_id) for obj_id in ids[:skills_count]]
+    hero.inventory = [ITEM_REGISTRY.by_id(obj_id) for obj_id in ids[skills_count:]]
+    return hero
+
+
+def hero_to_bytes(hero: Hero) -> bytes:
+    """Бінарний знімок героя"""
+
+    parts: list = [_HEADER.pack(HERO_MAGIC, SNAPSHOT_VERSION)]
+    _pack_hero(hero, parts)
+    return b"".join(parts)
+
+
+def bytes_to_hero(output: OutputSpace, data: bytes) -> Hero:
+    """Відновлення героя з бінарного знімка"""
+
+    reader = _Reader(data)
+    _check_header(reader, HERO_MAGIC)
+    try:
+        return _unpack_hero(output, reader)
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise SnapshotError("Пошкоджений знімок героя") from e
+
+
+def map_to_bytes(the_map: DungeonMap) -> bytes:
+    """Бінарний знімок мапи: масиви клітинок як є, об'єкти -- з ID"""
+
+    if not isinstance(the_map, DungeonMap):
+        raise TypeError("Бінарний знімок підтримує лише DungeonMap")
+
+    flags = 0
+    if the_map.seed is not None and the_map.level is not None:
+        flags |= _FLAG_SEED
+    if the_map.changed is not None:
+        flags |= _FLAG_CHANGES
+
+    parts: list = [
+        _HEADER.pack(MAP_MAGIC, SNAPSHOT_VERSION),
+        _MAP.pack(
+            the_map.height,
+            the_map.width,
+            flags,
+            the_map.seed or 0,
+            the_map.level or 0,
+            len(the_map.objects),
+        ),
+        the_map.types.tobytes(),
+        _array_bytes(the_map.gold),
+        _array_bytes(the_map.experience),
+    ]
+
+    if the_map.changed is not None:
+        changes = array("I", sorted(the_map.changed))
+        parts.append(_U32.pack(len(changes)))
+        parts.append(_array_bytes(changes))
+
+    for index, obj in sorted(the_map.objects.items()):
+        if isinstance(obj, Hero):
+            parts.append(_OBJECT.pack(index, _OBJECT_HERO))
+            _pack_hero(obj, parts)
+        else:
+            parts.append(_OBJECT.pack(index, _OBJECT_ITEM))
+            parts.append(_U32.pack(ITEM_REGISTRY.id_of(obj)))
+
+    return b"".join(parts)
+
+
+def bytes_to_map(output: OutputSpace, data: bytes) -> DungeonMap:
+    """Відновлення мапи з бінарного знімка"""
+
+    reader = _Reader(data)
+    _check_header(reader, MAP_MAGIC)
+    try:
+        height, width, flags, seed, level, objects_count = reader.unpack(_MAP)
+        size = height * width
+
+        the_map = DungeonMap(height=height, width=width)
+        types = reader.array("B", size)
+        if max(types, default=0) >= len(CELL_TYPES):
+            raise SnapshotError("Невідомий тип клітинки")
+        # Спершу типи, щоб індекс позицій відповідав мапі
+        for index, type_index in enumerate(types):
+            if type_index:
+                the_map.set_type(index, CELL_TYPES[type_index])
+        the_map.gold = reader.array("I", size)
+        the_map.experience = reader.array("I", size)
+
+        if flags & _FLAG_SEED:
+            the_map.seed = seed
+            the_map.level = level
+        if flags & _FLAG_CHANGES:
+            (changes_count,) = reader.unpack(_U32)
+            the_map.changed = set(reader.array("I", changes_count))
+            if max(the_map.changed, default=0) >= size:
+                raise SnapshotError("Зміна поза мапою")
+
+        for _ in range(objects_count):
+            index, kind = reader.unpack(_OBJECT)
+            if index >= size:
+                raise SnapshotError(f"Об'єкт поза мапою: {index}")
+            obj: Hero | Item
+            if kind == _OBJECT_HERO:
+                obj = _unpack_hero(output, reader)
+            elif kind == _OBJECT_ITEM:
+                (item_id,) = reader.unpack(_U32)
+                obj = ITEM_REGISTRY.by_id(item_id)
+            else:
+                raise SnapshotError(f"Невідомий тип об'єкта: {kind}")
+            the_map.objects[index] = obj
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise SnapshotError("Пошкоджений знімок мапи") from e
+
+    return the_map
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""Перевірка балансу професій з послідовною зупинкою.
+Подвійний послідовний тест відношення правдоподібностей (SPRT Вальда):
+частка перемог, рівна середині смуги [min_ratio, max_ratio], проти частки,
+що відхиляється від середини на ширину смуги в будь-який бік. Межі смуги
+лежать посередині, тож рішення там -- навпіл, як і в тесті з фіксованою
+кількістю боїв. Без рішення після max_fights боїв -- звичайна перевірка частки
+
+    python -m karatel.logic.balance --levels 1 10 20 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from itertools import combinations
+
+from karatel.core.hero import HeroFactory
+from karatel.core.professions import PROFESSIONS
+from karatel.logic.combat import fight
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.rng import seeded
+from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
+
+MIN_RATIO = 0.45
+MAX_RATIO = 0.55
+MAX_FIGHTS = 1000  # стільки боїв проводив тест без послідовної зупинки
+ALPHA = 0.01  # імовірність забракувати збалансовану пару (для кожного з тестів)
+BETA = 0.01  # імовірність пропустити пару, що відхиляється на ширину смуги
+
+output = NoneOutput()
+
+
+@dataclass(frozen=True)
+class BalanceResult:
+    """Рішення щодо однієї пари професій на одному рівні"""
+
+    level: int
+    prof1: str
+    prof2: str
+    fights: int
+    wins1: int
+    passed: bool
+    early: bool  # Рішення прийнято до MAX_FIGHTS боїв
+
+    @property
+    def ratio(self) -> float:
+        """Частка перемог prof1"""
+        return self.wins1 / self.fights if self.fights else 0.0
+
+    def __str__(self) -> str:
+        verdict = "OK " if self.passed else "ЗБІЙ"
+        how = "рано" if self.early else "повністю"
+        return (
+            f"{verdict} {self.level:>2} {self.prof1:>10} vs {self.prof2:<10} "
+            f"{self.ratio:.3f} {self.fights:>5} боїв ({how})"
+        )
+
+
+def check_balance(
+    level: int,
+    prof1: str,
+    prof2: str,
+    min_ratio: float = MIN_RATIO,
+    max_ratio: float = MAX_RATIO,
+    max_fights: int = MAX_FIGHTS,
+    alpha: float = ALPHA,
+    beta: float = BETA,
+    seed: int | None = None,
+) -> BalanceResult:
+    """Бої prof1 проти prof2 до рішення SPRT або до max_fights"""
+
+    center = (min_ratio + max_ratio) / 2
+    width = max_ratio - min_ratio
+    # Приріст логарифма відношення правдоподібностей за перемогу та поразку
+    # для гіпотез "prof1 сильніший" та "prof1 слабший"
+    steps = [
+        (math.log(ratio / center), math.log((1 - ratio) / (1 - center)))
+        for ratio in (center + width, center - width)
+    ]
+    upper = math.log((1 - beta) / alpha)
+    lower = math.log(beta / (1 - alpha))
+
+    fights = wins1 = 0
+    llr = [0.0, 0.0]
+    passed = None
+    with seeded(seed) if seed is not None else nullcontext():
+        while passed is None and fights < max_fights:
+            hero1 = HeroFactory.generate(output, level=level, profession=prof1)
+            hero2 = HeroFactory.generate(output, level=level, profession=prof2)
+            fight(hero1, hero2)
+            if hero1.alive == hero2.alive:
+                raise RuntimeError(f"Бій {prof1} проти {prof2} без переможця")
+            fights += 1
+            wins1 += hero1.alive
+
+            for i, (win, loss) in enumerate(steps):
+                llr[i] += win if hero1.alive else loss
+            if max(llr) >= upper:
+                passed = False
+            elif max(llr) <= lower:
+                passed = True
+
+    early = passed is not None
+    if not early:
+        passed = min_ratio <= wins1 / fights <= max_ratio
+
+    return BalanceResult(
+        level=level,
+        prof1=prof1,
+        prof2=prof2,
+        fights=fights,
+        wins1=wins1,
+        passed=passed,
+        early=early,
+    )
+
+
+def _check(task: tuple) -> BalanceResult:
+    return check_balance(*task)
+
+
+def balance_matrix(
+    levels: list[int] | None = None,
+    professions: list[str] | None = None,
+    workers: int | None = None,
+) -> dict[tuple[int, str, str], BalanceResult]:
+    """Перевірка всіх (рівень, професія 1, професія 2),
+    розподілена між процесами"""
+
+    if levels is None:
+        levels = list(range(MIN_LEVEL, MAX_LEVEL + 1))
+    if professions is None:
+        professions = list(PROFESSIONS.keys())
+
+    tasks = [
+        (level, prof1, prof2)
+        for level in levels
+        for prof1, prof2 in combinations(professions, 2)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_check, tasks)
+        return {task: result for task, result in zip(tasks, results)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m karatel.logic.balance",
+        description="Баланс професій з послідовною зупинкою",
+    )
+    parser.add_argument("--levels", type=int, nargs="*")
+    parser.add_argument("--professions", nargs="*", choices=list(PROFESSIONS))
+    parser.add_argument("--workers", type=int)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = balance_matrix(args.levels, args.professions, args.workers)
+    elapsed = time.perf_counter() - start
+
+    for result in results.values():
+        print(result)
+    spent = sum(result.fights for result in results.values())
+    passed = sum(result.passed for result in results.values())
+    print(
+        f"\nПройшли: {passed} з {len(results)}. "
+        f"Боїв: {spent} замість {MAX_FIGHTS * len(results)}, {elapsed:.1f} с"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,14 +11,19 @@ def attack(attacker: Hero, defender: Hero) -> bool:
 
     def _apply_damage(att: Hero, defn: Hero, damg: int) -> None:
         """Допоміжна функція для забезпечення принципів DRY"""
-        att.output.write(
-            f"{att.name} наносить {damg} шкоди за "
-            + f"допомогою '{att.right_hand.name}'",
+        att.output.write_lazy(
+            "{} наносить {} шкоди за допомогою '{}'",
+            att.name,
+            damg,
+            att.right_hand.name,
             log=LOG,
         )
         defn.hp -= damg
-        att.output.write(
-            f"У {defn.name} лишається {defn.hp} з " + f"{defn.max_hp} здоров'я",
+        att.output.write_lazy(
+            "У {} лишається {} з {} здоров'я",
+            defn.name,
+            defn.hp,
+            defn.max_hp,
             end="\n\n",
             log=LOG,
         )
@@ -26,9 +31,11 @@ def attack(attacker: Hero, defender: Hero) -> bool:
     attack_chance = Dice.roll(output=attacker.output, dice_string="1d20")
 
     if attack_chance == 20:
-        attacker.output.write(
-            f"Ходить {attacker.name}. Шанс атаки: {attack_chance}. Критичний успіх! "
-            f"{attacker.name} наносить подвійну шкоду!",
+        attacker.output.write_lazy(
+            "Ходить {0}. Шанс атаки: {1}. Критичний успіх! "
+            "{0} наносить подвійну шкоду!",
+            attacker.name,
+            attack_chance,
             end="\n\n",
             log=LOG,
         )
@@ -41,17 +48,23 @@ def attack(attacker: Hero, defender: Hero) -> bool:
         _apply_damage(attacker, defender, attack_value)
         return not defender.alive
     elif attack_chance == 1:
-        attacker.output.write(
-            f"Ходить {attacker.name}. Шанс атаки: {attack_chance}. Критичний провал! "
-            + f"{attacker.name} промахується!",
+        attacker.output.write_lazy(
+            "Ходить {0}. Шанс атаки: {1}. Критичний провал! {0} промахується!",
+            attacker.name,
+            attack_chance,
             end="\n\n",
             log=LOG,
         )
         return False
-    elif (attack_chance + attacker.attack_modifier) >= defender.ac:
-        attacker.output.write(
-            f"Ходить {attacker.name}. Шанс атаки: {attack_chance}, модифікатор "
-            + f"{attacker.attack_modifier:+d}, це >= {defender.ac}",
+    modifier = attacker.attack_modifier
+    defender_ac = defender.ac
+    if (attack_chance + modifier) >= defender_ac:
+        attacker.output.write_lazy(
+            "Ходить {}. Шанс атаки: {}, модифікатор {:+d}, це >= {}",
+            attacker.name,
+            attack_chance,
+            modifier,
+            defender_ac,
             log=LOG,
         )
         attack_value = Dice.roll(
@@ -60,12 +73,17 @@ def attack(attacker: Hero, defender: Hero) -> bool:
         _apply_damage(attacker, defender, attack_value)
         return not defender.alive
     else:
-        attacker.output.write(
-            f"Ходить {attacker.name}. Шанс атаки: {attack_chance}, модифікатор "
-            + f"{attacker.attack_modifier:+d}, це < {defender.ac}",
+        attacker.output.write_lazy(
+            "Ходить {}. Шанс атаки: {}, модифікатор {:+d}, це < {}",
+            attacker.name,
+            attack_chance,
+            modifier,
+            defender_ac,
             log=LOG,
         )
-        attacker.output.write(f"{attacker.name} промахується", end="\n\n", log=LOG)
+        attacker.output.write_lazy(
+            "{} промахується", attacker.name, end="\n\n", log=LOG
+        )
         return False
 
 
@@ -74,8 +92,8 @@ def fight(hero_a: Hero, hero_b: Hero) -> None:
 
     def after_fight_actions(comb_x: Hero, comb_y: Hero) -> None:
         """Дії, які виконуються після бою"""
-        comb_x.output.write(
-            f"{comb_x.name} — перемагає, {comb_y.name} — гине!", end="\n\n", log=LOG
+        comb_x.output.write_lazy(
+            "{} — перемагає, {} — гине!", comb_x.name, comb_y.name, end="\n\n", log=LOG
         )
         comb_x.skill_manager.use_all_skills(SkillTiming.POST_BATTLE, log=LOG)
         xp_reward = comb_y.level * XP_MULTIPLIER
@@ -83,13 +101,14 @@ def fight(hero_a: Hero, hero_b: Hero) -> None:
 
     if hero_a.alive and hero_b.alive:
         comb_a, comb_b = roll_initiative(hero_a, hero_b)
-        comb_a.output.write(
-            f"Починається бій між {comb_a.name} та {comb_b.name}. "
-            + f"{comb_a.name} отримує право першого ходу.",
+        comb_a.output.write_lazy(
+            "Починається бій між {0} та {1}. {0} отримує право першого ходу.",
+            comb_a.name,
+            comb_b.name,
             end="\n\n",
             log=LOG,
         )
-        while comb_a.hp > 0 and comb_b.hp > 0:
+        while comb_a.alive and comb_b.alive:
             if attack(comb_a, comb_b):
                 after_fight_actions(comb_a, comb_b)
                 break
@@ -104,25 +123,34 @@ def fight(hero_a: Hero, hero_b: Hero) -> None:
 
 def roll_initiative(comb_a: Hero, comb_b: Hero) -> tuple[Hero, Hero]:
     """Визначає порядок ходів. Повертає пару (перший, другий)."""
-    comb_a.output.write(
-        f"Готуємося до бою між {comb_a.name} ({comb_a.sex}) та "
-        + f"{comb_b.name} ({comb_b.sex})",
+    comb_a.output.write_lazy(
+        "Готуємося до бою між {} ({}) та {} ({})",
+        comb_a.name,
+        comb_a.sex,
+        comb_b.name,
+        comb_b.sex,
         log=LOG,
     )
 
     init_a = Dice.roll(output=comb_a.output, dice_string="1d20")
     total_a = init_a + comb_a.initiative
-    comb_a.output.write(
-        f"Ініціатива {comb_a.name}: {init_a}, "
-        + f"модифікатор {comb_a.initiative:+d} = {total_a}",
+    comb_a.output.write_lazy(
+        "Ініціатива {}: {}, модифікатор {:+d} = {}",
+        comb_a.name,
+        init_a,
+        comb_a.initiative,
+        total_a,
         log=LOG,
     )
 
     init_b = Dice.roll(output=comb_b.output, dice_string="1d20")
     total_b = init_b + comb_b.initiative
-    comb_b.output.write(
-        f"Ініціатива {comb_b.name}: {init_b}, "
-        + f"модифікатор {comb_b.initiative:+d} = {total_b}",
+    comb_b.output.write_lazy(
+        "Ініціатива {}: {}, модифікатор {:+d} = {}",
+        comb_b.name,
+        init_b,
+        comb_b.initiative,
+        total_b,
         end="\n\n",
         log=LOG,
     )
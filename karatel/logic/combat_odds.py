@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Точний розрахунок бою за правилами fight() без кидків кубиків.
+Бій -- ланцюг Маркова зі станами (здоров'я A, здоров'я B, чий хід),
+імовірності перемоги та очікувана тривалість рахуються динамічним
+програмуванням від стану зі здоров'ям 1 до початкового"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from karatel.utils.dice import Dice
+from karatel.utils.settings import DICE_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from karatel.logic.simulation import CombatStats
+
+# Розподіл -- кортеж пар (значення, імовірність), відсортований за значенням
+Distribution = tuple[tuple[int, float], ...]
+
+MAX_DAMAGE_OUTCOMES = 1000  # граней у всіх кубиках шкоди, більше -- помилка
+# Кроків динамічного програмування (здоров'я A x здоров'я B x значень шкоди),
+# більше -- помилка. Близько 3 с обчислень
+MAX_COMBAT_STEPS = 20_000_000
+
+
+@dataclass(frozen=True)
+class CombatOdds:
+    """Точні результати бою двох героїв"""
+
+    win_a: float  # Імовірність перемоги A
+    win_b: float
+    first_a: float  # Імовірність, що A виграє ініціативу
+    mean_turns: float  # Очікувана кількість атак за бій
+
+
+def _convolve(left: dict[int, float], right: dict[int, float]) -> dict[int, float]:
+    result: dict[int, float] = {}
+    for x, p in left.items():
+        for y, q in right.items():
+            result[x + y] = result.get(x + y, 0.0) + p * q
+    return result
+
+
+@lru_cache(maxsize=DICE_CACHE_SIZE)
+def damage_distribution(dice_string: str) -> Distribution:
+    """Точний розподіл суми кидка, наприклад "2d6+4".
+    Результат кешується для кожного рядка шкоди"""
+
+    expression = Dice.compile(dice_string)
+    # Перевірка до побудови кубиків: і кількість згорток, і ширина
+    # розподілу не перевищують сумарної кількості граней
+    if sum(count * sides for count, sides, _ in expression.dice) > MAX_DAMAGE_OUTCOMES:
+        raise ValueError(f"Занадто широкий розподіл шкоди: '{dice_string}'")
+
+    result = {expression.modifier: 1.0}
+    for count, sides, sign in expression.dice:
+        die = {sign * face: 1.0 / sides for face in range(1, sides + 1)}
+        for _ in range(count):
+            result = _convolve(result, die)
+    return tuple(sorted(result.items()))
+
+
+def attack_distribution(
+    attack_modifier: int, damage: str, defender_ac: int
+) -> Distribution:
+    """Розподіл шкоди за одну атаку з урахуванням промахів, як у attack():
+    20 -- подвійний кидок шкоди, 1 -- промах, інакше влучання за AC"""
+
+    single = dict(damage_distribution(damage))
+    if min(single) < 0:
+        raise ValueError(f"Шкода '{damage}' може лікувати, розрахунок неможливий")
+
+    hits = sum(1 for roll in range(2, 20) if roll + attack_modifier >= defender_ac)
+    result = {0: (1 + 18 - hits) / 20}  # критичний провал та промахи
+    for value, p in single.items():
+        result[value] = result.get(value, 0.0) + p * hits / 20
+    for value, p in _convolve(single, single).items():
+        result[value] = result.get(value, 0.0) + p / 20
+    return tuple(sorted((value, p) for value, p in result.items() if p))
+
+
+def initiative_odds(initiative_a: int, initiative_b: int) -> float:
+    """Імовірність, що A ходить першим. Нічиї перекидаються"""
+
+    wins = ties = 0
+    for roll_a in range(1, 21):
+        for roll_b in range(1, 21):
+            difference = roll_a + initiative_a - roll_b - initiative_b
+            wins += difference > 0
+            ties += difference == 0
+    return wins / (400 - ties)
+
+
+def combat_odds(
+    stats_a: CombatStats,
+    stats_b: CombatStats,
+    hp_a: int | None = None,
+    hp_b: int | None = None,
+) -> CombatOdds:
+    """Точні імовірності перемоги та очікувана кількість атак.
+    За замовчуванням обидва герої починають з повним здоров'ям"""
+
+    hp_a = stats_a.max_hp if hp_a is None else hp_a
+    hp_b = stats_b.max_hp if hp_b is None else hp_b
+    if hp_a <= 0 or hp_b <= 0:
+        raise ValueError("Мертві не воюють!")
+
+    first_a = initiative_odds(stats_a.initiative, stats_b.initiative)
+    by_a = attack_distribution(stats_a.attack_modifier, stats_a.damage, stats_b.ac)
+    by_b = attack_distribution(stats_b.attack_modifier, stats_b.damage, stats_a.ac)
+
+    # Атака без шкоди лише передає хід: цикл двох станів розв'язується явно
+    miss_a = dict(by_a).get(0, 0.0)
+    miss_b = dict(by_b).get(0, 0.0)
+    if miss_a * miss_b == 1:
+        raise ValueError("Жоден з героїв не може завдати шкоди")
+    loop = 1 / (1 - miss_a * miss_b)
+    hits_a = [(value, p) for value, p in by_a if value > 0]
+    hits_b = [(value, p) for value, p in by_b if value > 0]
+    if hp_a * hp_b * (len(hits_a) + len(hits_b)) > MAX_COMBAT_STEPS:
+        raise ValueError("Занадто довгий розрахунок: забагато здоров'я або шкоди")
+
+    # [a][b] -> імовірність перемоги A та очікувана кількість атак,
+    # коли ходить A (win_x, turns_x) або B (win_y, turns_y)
+    win_x = [[0.0] * (hp_b + 1) for _ in range(hp_a + 1)]
+    win_y = [[0.0] * (hp_b + 1) for _ in range(hp_a + 1)]
+    turns_x = [[0.0] * (hp_b + 1) for _ in range(hp_a + 1)]
+    turns_y = [[0.0] * (hp_b + 1) for _ in range(hp_a + 1)]
+
+    for a in range(1, hp_a + 1):
+        for b in range(1, hp_b + 1):
+            win_after_a = turns_after_a = 0.0
+            for value, p in hits_a:
+                if value >= b:
+                    win_after_a += p
+                else:
+                    win_after_a += p * win_y[a][b - value]
+                    turns_after_a += p * turns_y[a][b - value]
+            win_after_b = turns_after_b = 0.0
+            for value, p in hits_b:
+                if value < a:
+                    win_after_b += p * win_x[a - value][b]
+                    turns_after_b += p * turns_x[a - value][b]
+
+            win_x[a][b] = (win_after_a + miss_a * win_after_b) * loop
+            win_y[a][b] = (win_after_b + miss_b * win_after_a) * loop
+            turns_x[a][b] = (1 + turns_after_a + miss_a * (1 + turns_after_b)) * loop
+            turns_y[a][b] = (1 + turns_after_b + miss_b * (1 + turns_after_a)) * loop
+
+    win_a = first_a * win_x[hp_a][hp_b] + (1 - first_a) * win_y[hp_a][hp_b]
+    mean_turns = first_a * turns_x[hp_a][hp_b] + (1 - first_a) * turns_y[hp_a][hp_b]
+    return CombatOdds(
+        win_a=win_a, win_b=1 - win_a, first_a=first_a, mean_turns=mean_turns
+    )
@@ -3,41 +3,50 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Tuple
 
-from karatel.core.map import EMPTY_CELL, CellType, MapSize
+from karatel.core.map import EMPTY_CELL, CellType
 from karatel.logic.combat import fight
+from karatel.utils.rng import use_rng
 from karatel.utils.settings import LOG
 from karatel.utils.utils import clamp_value
 
 if TYPE_CHECKING:
     from karatel.core.game_state_manager import GameStateManager
     from karatel.core.hero import Hero
-    from karatel.core.map import Cell
+    from karatel.core.map import BaseCell, BaseMap
     from karatel.ui.abstract import OutputSpace
 
 
-def output_setter(the_map: list, output: OutputSpace) -> None:
+def output_setter(the_map: BaseMap, output: OutputSpace) -> None:
     """Встановлює переданий output всім об'єктам на переданій мапі.
     Використовується після завантаження мапи з БД"""
-    for y in range(len(the_map)):
-        for x in range(len(the_map[y])):
-            if the_map[y][x].obj is not None and hasattr(the_map[y][x].obj, "output"):
-                the_map[y][x].obj.output = output
+    for obj in the_map.objects.values():
+        if hasattr(obj, "output"):
+            obj.output = output
 
 
-def find_hero(the_map: list) -> Tuple[int | None, int | None]:
+def find_hero(the_map: BaseMap) -> Tuple[int | None, int | None]:
     """Шукає героя на карті. Повертає координати Y та X"""
-    for y in range(len(the_map)):
-        for x in range(len(the_map[y])):
-            if the_map[y][x].type == CellType.HERO:
-                return y, x
-    return None, None
+    return the_map.hero_position()
 
 
-def add_money(hero: Hero, cell: Cell, log=LOG) -> None:
+def nearest_enemy(the_map: BaseMap) -> Tuple[int | None, int | None]:
+    """Координати Y та X найближчого до героя ворога"""
+    pos_y, pos_x = find_hero(the_map)
+    if pos_y is None or pos_x is None:
+        return None, None
+    return the_map.nearest(CellType.ENEMY, pos_y, pos_x)
+
+
+def remaining_loot(the_map: BaseMap) -> int:
+    """Кількість предметів, які ще лишилися на мапі"""
+    return the_map.count(CellType.ITEM)
+
+
+def add_money(hero: Hero, cell: BaseCell, log=LOG) -> None:
     """Додавання грошей"""
     if cell.gold > 0:
         hero.money += cell.gold
-        hero.output.write(f"{hero.name} отримує {cell.gold} грн", log=log)
+        hero.output.write_lazy("{} отримує {} грн", hero.name, cell.gold, log=log)
 
 
 def add_lives(hero: Hero, value: int | None, log=LOG) -> None:
@@ -47,17 +56,32 @@ def add_lives(hero: Hero, value: int | None, log=LOG) -> None:
             value = hero.lives * -1
         hero.lives += value
         if value > 0:
-            hero.output.write(f"{hero.name} отримує {value} життя", log=log)
+            hero.output.write_lazy("{} отримує {} життя", hero.name, value, log=log)
         elif value < 0:
-            hero.output.write(f"{hero.name} втрачає {abs(value)} життя", log=log)
+            hero.output.write_lazy(
+                "{} втрачає {} життя", hero.name, abs(value), log=log
+            )
 
 
 def move_hero(
     gsm: GameStateManager,
     step_y: int,
     step_x: int,
-    the_map: list,
+    the_map: BaseMap,
     log: bool = LOG,
+) -> CellType | None:
+    """Переміщення персонажа по мапі.
+    Всі кидки (бій, навички) виконуються генератором сесії gsm.rng"""
+    with use_rng(gsm.rng):
+        return _move_hero(gsm, step_y, step_x, the_map, log)
+
+
+def _move_hero(
+    gsm: GameStateManager,
+    step_y: int,
+    step_x: int,
+    the_map: BaseMap,
+    log: bool,
 ) -> CellType | None:
     """Переміщення персонажа по мапі"""
 
@@ -76,14 +100,16 @@ def move_hero(
         the_map[new_y][new_x] = the_map[pos_y][pos_x]
         if new_y != pos_y or new_x != pos_x:
             the_map[pos_y][pos_x] = EMPTY_CELL
+            # Готуємо наступну ділянку великої мапи
+            the_map.reveal(new_y, new_x)
 
     pos_y, pos_x = find_hero(the_map)
 
     if pos_y is None or pos_x is None:
         return None
     else:
-        new_y = clamp_value((pos_y + step_y), 0, MapSize.Y - 1)
-        new_x = clamp_value((pos_x + step_x), 0, MapSize.X - 1)
+        new_y = clamp_value((pos_y + step_y), 0, len(the_map) - 1)
+        new_x = clamp_value((pos_x + step_x), 0, len(the_map[new_y]) - 1)
 
         # Перевіряємо клітинку, куди треба перемістити героя
         new_cell_type = the_map[new_y][new_x].type
@@ -101,8 +127,9 @@ def move_hero(
                         the_map[new_y][new_x].obj, log=log
                     )
                 else:
-                    the_map[pos_y][pos_x].obj.output.write(
-                        f"{the_map[pos_y][pos_x].obj.name} на жаль, нічого не знаходить.",
+                    the_map[pos_y][pos_x].obj.output.write_lazy(
+                        "{} на жаль, нічого не знаходить.",
+                        the_map[pos_y][pos_x].obj.name,
                         log=log,
                     )
                 _step()
@@ -118,25 +145,30 @@ def move_hero(
 
             # Якщо там ворог
             case CellType.ENEMY.value:
-                gsm.output.write(
-                    f"Ваш ворог:\n"
-                    + f"{the_map[new_y][new_x].obj}\n"
-                    + f"{the_map[new_y][new_x].obj.display.hp()} "
-                    + f"{the_map[new_y][new_x].obj.display.level()}\n"
-                    + f"{the_map[new_y][new_x].obj.display.stats()}\n"
-                    + f"{the_map[new_y][new_x].obj.display.ac()}\n"
-                    + f"{the_map[new_y][new_x].obj.display.modifiers()}\n",
+                enemy = the_map[new_y][new_x].obj
+                gsm.output.write_lazy(
+                    lambda: f"Ваш ворог:\n"
+                    + f"{enemy}\n"
+                    + f"{enemy.display.hp()} "
+                    + f"{enemy.display.level()}\n"
+                    + f"{enemy.display.stats()}\n"
+                    + f"{enemy.display.ac()}\n"
+                    + f"{enemy.display.modifiers()}\n",
                     log=log,
                 )
                 fight(the_map[pos_y][pos_x].obj, the_map[new_y][new_x].obj)
                 if the_map[pos_y][pos_x].obj.alive:
                     _step()
+                else:
+                    # Ворог вижив, але його стан змінився
+                    the_map.touch(new_y, new_x)
 
             # Якщо це вихід
             case CellType.EXIT.value:
-                gsm.output.write(
-                    f"{the_map[pos_y][pos_x].obj.name} знаходить вихід. "
-                    + "Тепер можна створити нове підземелля, з сильнішими ворогами.",
+                gsm.output.write_lazy(
+                    "{} знаходить вихід. "
+                    "Тепер можна створити нове підземелля, з сильнішими ворогами.",
+                    the_map[pos_y][pos_x].obj.name,
                     log=log,
                 )
                 add_lives(the_map[pos_y][pos_x].obj, 1)
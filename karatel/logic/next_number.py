@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 
-import random
-
 from karatel.utils.constants import PRIMES, Difficulty
+from karatel.utils.rng import get_rng
 
 
 def arithmetic_sequence(start: int, step: int, length: int) -> tuple[int, ...]:
@@ -110,40 +109,42 @@ def get_game(
     Якщо random_game = False, створює кортеж кортежів.
     """
 
+    rng = get_rng()
+
     easy: tuple = (
         (
             arithmetic_sequence,
-            (random.randint(-100, 100), random.randint(1, 10), length),
+            (rng.randint(-100, 100), rng.randint(1, 10), length),
             1,  # пряма послідовність
             "Арифметична послідовність",
         ),
         (
             arithmetic_sequence,
-            (random.randint(-100, 100), random.randint(-10, -1), length),
+            (rng.randint(-100, 100), rng.randint(-10, -1), length),
             1,  # пряма послідовність
             "Арифметична послідовність (від'ємний крок)",
         ),
         (
             power_sequence,
-            (random.randint(2, 3), random.randint(1, 3), length),
+            (rng.randint(2, 3), rng.randint(1, 3), length),
             1,  # пряма послідовність
             "Послідовність степенів",
         ),
         (
             geometric_sequence,
-            (random.randint(1, 9), random.randint(2, 9), length),
+            (rng.randint(1, 9), rng.randint(2, 9), length),
             1,  # пряма послідовність
             "Геометрична послідовність (пряма)",
         ),
         (
             primes_sequence,
-            (random.randint(0, len(PRIMES) - length), length),
+            (rng.randint(0, len(PRIMES) - length), length),
             1,  # пряма послідовність
             "Послідовність простих чисел",
         ),
         (
             primes_sequence,
-            (random.randint(0, len(PRIMES) - length), length),
+            (rng.randint(0, len(PRIMES) - length), length),
             -1,  # зворотна послідовність
             "Послідовність простих чисел (інверсія)",
         ),
@@ -152,19 +153,19 @@ def get_game(
     medium: tuple = (
         (
             geometric_sequence,
-            (random.randint(1, 9), random.randint(2, 9), length),
+            (rng.randint(1, 9), rng.randint(2, 9), length),
             -1,  # зворотна послідовність
             "Геометрична послідовність (інверсія)",
         ),
         (
             geometric_sequence,
-            (random.randint(1, 9), random.randint(-9, -2), length),
+            (rng.randint(1, 9), rng.randint(-9, -2), length),
             1,  # пряма послідовність
             "Геометрична послідовність (зміна знаку)",
         ),
         (
             fibonacci_sequence,
-            (random.randint(0, 10), length),
+            (rng.randint(0, 10), length),
             1,  # пряма послідовність
             "Послідовність Фібоначчі",
         ),
@@ -173,16 +174,16 @@ def get_game(
     hard: tuple = (
         (
             geometric_sequence,
-            (random.randint(1, 9), random.randint(-9, -2), length),
+            (rng.randint(1, 9), rng.randint(-9, -2), length),
             -1,  # зворотна послідовність
             "Геометрична послідовність (зміна знаку, інверсія)",
         ),
         (
             arithmetic_plus_sequence,
             (
-                random.randint(1, 100),
-                random.randint(1, 10),
-                random.randint(1, 5),
+                rng.randint(1, 100),
+                rng.randint(1, 10),
+                rng.randint(1, 5),
                 length,
             ),
             1,  # пряма послідовність
@@ -191,9 +192,9 @@ def get_game(
         (
             arithmetic_plus_sequence,
             (
-                random.randint(1, 100),
-                random.randint(1, 10),
-                random.randint(-5, -1),
+                rng.randint(1, 100),
+                rng.randint(1, 10),
+                rng.randint(-5, -1),
                 length,
             ),
             1,  # пряма послідовність
@@ -202,9 +203,9 @@ def get_game(
         (
             arithmetic_plus_sequence,
             (
-                random.randint(1, 100),
-                random.randint(-10, -1),
-                random.randint(1, 5),
+                rng.randint(1, 100),
+                rng.randint(-10, -1),
+                rng.randint(1, 5),
                 length,
             ),
             1,  # пряма послідовність
@@ -213,9 +214,9 @@ def get_game(
         (
             arithmetic_plus_sequence,
             (
-                random.randint(1, 100),
-                random.randint(-10, -1),
-                random.randint(-5, -1),
+                rng.randint(1, 100),
+                rng.randint(-10, -1),
+                rng.randint(-5, -1),
                 length,
             ),
             1,  # пряма послідовність
@@ -226,7 +227,7 @@ def get_game(
     expert: tuple = (
         (
             fibonacci_sequence,
-            (random.randint(0, 10), length),
+            (rng.randint(0, 10), length),
             -1,  # зворотна послідовність
             "Послідовність Фібоначчі (інверсія)",
         ),
@@ -246,10 +247,10 @@ def get_game(
         case Difficulty.ALL:
             the_tuple = easy + medium + hard + expert
         case Difficulty.RANDOM | _:
-            the_tuple = random.choice((easy, medium, hard, expert))
+            the_tuple = rng.choice((easy, medium, hard, expert))
 
     if random_game:
-        return random.choice(the_tuple)
+        return rng.choice(the_tuple)
     else:
         return the_tuple
 
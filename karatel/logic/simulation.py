@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from karatel.core.hero import HeroFactory
+from karatel.core.professions import PROFESSIONS
+from karatel.core.skills import HealSelfSkill, SkillTiming
+from karatel.utils.dice import Dice
+from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
+
+if TYPE_CHECKING:
+    from karatel.core.hero import Hero
+    from karatel.ui.abstract import OutputSpace
+
+
+@dataclass(frozen=True)
+class CombatStats:
+    """Бойові характеристики героя для пакетної симуляції боїв"""
+
+    ac: int
+    attack_modifier: int
+    damage: str  # наприклад, "2d6+2"
+    max_hp: int
+    initiative: int
+    heal: tuple[int | str, ...] = ()  # Сила навичок, що діють після бою
+
+    @classmethod
+    def from_hero(cls, hero: Hero) -> CombatStats:
+        """Знімає бойові характеристики з героя"""
+        return cls(
+            ac=hero.ac,
+            attack_modifier=hero.attack_modifier,
+            damage=hero.right_hand.damage,
+            max_hp=hero.max_hp,
+            initiative=hero.initiative,
+            heal=tuple(
+                skill.power
+                for skill in hero.skills
+                if isinstance(skill, HealSelfSkill)
+                and skill.skill_timing == SkillTiming.POST_BATTLE
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """Результати пакетної симуляції боїв"""
+
+    fights: int
+    wins_a: int
+    wins_b: int
+    turns: np.ndarray  # turns[k] -- кількість боїв, що тривали k атак
+    hp_left_a: float  # Середнє здоров'я A після перемоги та лікування
+    hp_left_b: float  # Середнє здоров'я B після перемоги та лікування
+
+    @property
+    def ratio_a(self) -> float:
+        """Частка перемог героя A"""
+        return self.wins_a / self.fights if self.fights else 0.0
+
+    @property
+    def ratio_b(self) -> float:
+        """Частка перемог героя B"""
+        return self.wins_b / self.fights if self.fights else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        """Середня кількість атак за бій"""
+        if not self.fights:
+            return 0.0
+        return float(np.dot(np.arange(self.turns.size), self.turns) / self.fights)
+
+
+def simulate_fights(
+    stats_a: CombatStats,
+    stats_b: CombatStats,
+    num_fights: int,
+    rng: np.random.Generator | None = None,
+) -> SimulationResult:
+    """Проводить num_fights боїв одночасно за правилами fight().
+    Кожен крок циклу -- одна атака в усіх ще не завершених боях"""
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    sides = (stats_a, stats_b)
+    ac = np.array([stats_a.ac, stats_b.ac])
+    max_hp = np.array([stats_a.max_hp, stats_b.max_hp])
+
+    # Ініціатива. Нічиї перекидаємо, як у roll_initiative()
+    attacker = np.empty(num_fights, dtype=np.int8)
+    pending = np.arange(num_fights)
+    while pending.size:
+        total_a = rng.integers(1, 21, size=pending.size) + stats_a.initiative
+        total_b = rng.integers(1, 21, size=pending.size) + stats_b.initiative
+        attacker[pending] = np.where(total_a > total_b, 0, 1)
+        pending = pending[total_a == total_b]
+
+    hp = np.repeat(max_hp[:, np.newaxis], num_fights, axis=1)
+    turns = np.zeros(num_fights, dtype=np.int64)
+    active = np.arange(num_fights)
+
+    while active.size:
+        current = attacker[active]
+        defender = 1 - current
+        attack_chance = rng.integers(1, 21, size=active.size)
+        damage = np.zeros(active.size, dtype=np.int64)
+
+        for side, stats in enumerate(sides):
+            dice = Dice.compile(stats.damage)
+            is_attacker = current == side
+            # Критичний успіх -- подвійний кидок шкоди
+            crit = is_attacker & (attack_chance == 20)
+            # Звичайне влучання. Критичний провал (1) завжди промах
+            hit = (
+                is_attacker
+                & (attack_chance != 1)
+                & (attack_chance != 20)
+                & (attack_chance + stats.attack_modifier >= ac[1 - side])
+            )
+            num_crit = int(crit.sum())
+            if num_crit:
+                damage[crit] = dice.roll_many(num_crit, rng) + dice.roll_many(
+                    num_crit, rng
+                )
+            num_hit = int(hit.sum())
+            if num_hit:
+                damage[hit] = dice.roll_many(num_hit, rng)
+
+        # Обмеження здоров'я -- як у сеттері Hero.hp
+        hp[defender, active] = np.clip(
+            hp[defender, active] - damage, 0, max_hp[defender]
+        )
+        turns[active] += 1
+        attacker[active] = defender
+        active = active[hp[defender, active] > 0]
+
+    winner_a = hp[0] > 0
+    wins_a = int(winner_a.sum())
+
+    def _hp_left(side: int, won: np.ndarray) -> float:
+        """Лікування переможця після бою та середнє здоров'я, що лишилось"""
+        if not won.any():
+            return 0.0
+        left = hp[side, won]
+        for power in sides[side].heal:
+            if isinstance(power, str):
+                left = left + Dice.compile(power).roll_many(left.size, rng)
+            else:
+                left = left + power
+            left = np.clip(left, 0, max_hp[side])
+        return float(left.mean())
+
+    return SimulationResult(
+        fights=num_fights,
+        wins_a=wins_a,
+        wins_b=num_fights - wins_a,
+        turns=np.bincount(turns),
+        hp_left_a=_hp_left(0, winner_a),
+        hp_left_b=_hp_left(1, ~winner_a),
+    )
+
+
+def simulate_matrix(
+    output: OutputSpace,
+    num_fights: int,
+    levels: list[int] | None = None,
+    professions: list[str] | None = None,
+    rng: np.random.Generator | None = None,
+) -> dict[tuple[int, str, str], SimulationResult]:
+    """Прогін матриці (рівень, професія 1, професія 2).
+    Характеристики залежать лише від професії та рівня,
+    тому на кожну комбінацію генерується один герой"""
+
+    if levels is None:
+        levels = list(range(MIN_LEVEL, MAX_LEVEL + 1))
+    if professions is None:
+        professions = list(PROFESSIONS.keys())
+    if rng is None:
+        rng = np.random.default_rng()
+
+    results = {}
+    for level in levels:
+        stats = {
+            profession: CombatStats.from_hero(
+                HeroFactory.generate(output, level=level, profession=profession)
+            )
+            for profession in professions
+        }
+        for prof1, prof2 in combinations(professions, 2):
+            results[(level, prof1, prof2)] = simulate_fights(
+                stats[prof1], stats[prof2], num_fights, rng
+            )
+    return results
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import math
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING
 
 from karatel.utils.constants import Emoji
@@ -43,58 +44,100 @@ def check_winner(board: list[str]) -> str | None:
     return None
 
 
+# Позиція -- число в трійковій системі, клітинка i дає розряд 3**i:
+# 0 -- порожня, 1 -- гравець, що максимізує, 2 -- той, що мінімізує.
+# Усього 3**9 = 19683 дошки, з них 5478 досяжні в грі
+POSITIONS = 3**9
+_POWERS = tuple(3**i for i in range(9))
+_MAX, _MIN = 1, 2
+_NO_MOVE = 9
+
+
+def encode(board: list[str], max_player_symbol: str, min_player_symbol: str) -> int:
+    """Дошка -> номер позиції"""
+
+    key = 0
+    for cell, power in zip(board, _POWERS):
+        if cell == max_player_symbol:
+            key += _MAX * power
+        elif cell == min_player_symbol:
+            key += _MIN * power
+        elif cell != Emoji.EMPTY.value:
+            raise ValueError(f"Невідомий символ на дошці: {cell}")
+    return key
+
+
+def _cells(key: int) -> tuple[int, ...]:
+    return tuple(key // power % 3 for power in _POWERS)
+
+
+def _score(key: int) -> int | None:
+    """Результат для завершеної позиції (як у check_winner), інакше None"""
+
+    cells = _cells(key)
+    for a, b, c in WIN_POSITIONS:
+        if cells[a] == cells[b] == cells[c] != 0:
+            return 1 if cells[a] == _MAX else -1
+    if 0 not in cells:
+        return 0
+    return None
+
+
+@cache
+def _solve(key: int, is_max_turn: bool) -> int:
+    """Мінімакс з пам'яттю: кожна позиція рахується один раз"""
+
+    score = _score(key)
+    if score is not None:
+        return score
+
+    cells = _cells(key)
+    symbol = _MAX if is_max_turn else _MIN
+    scores = [
+        _solve(key + symbol * power, not is_max_turn)
+        for cell, power in zip(cells, _POWERS)
+        if cell == 0
+    ]
+    return max(scores) if is_max_turn else min(scores)
+
+
+@cache
+def table() -> bytes:
+    """Найкращий хід гравця, що максимізує, для кожної з 3**9 позицій
+    (_NO_MOVE -- ходів немає). Будується один раз, 19683 байти"""
+
+    moves = bytearray(POSITIONS)
+    for key in range(POSITIONS):
+        best_score = -math.inf
+        move = _NO_MOVE
+        for i, (cell, power) in enumerate(zip(_cells(key), _POWERS)):
+            if cell == 0:
+                score = _solve(key + _MAX * power, False)
+                if score > best_score:
+                    best_score = score
+                    move = i
+        moves[key] = move
+    return bytes(moves)
+
+
 def minimax(
     board: list[str],
     is_max_turn: bool,
     max_player_symbol: str,
     min_player_symbol: str,
 ) -> int:
-    """Побудова дерева ходів"""
+    """Оцінка позиції: 1 -- виграш того, хто максимізує, -1 -- програш, 0 -- нічия"""
 
-    winner = check_winner(board)
-
-    if winner == max_player_symbol:
-        return 1
-    if winner == min_player_symbol:
-        return -1
-    if winner == TTT.DRAW.value:
-        return 0
-
-    if is_max_turn:
-        best_score = -math.inf
-        for i in range(9):
-            if board[i] == Emoji.EMPTY.value:
-                board[i] = max_player_symbol
-                score = minimax(board, False, max_player_symbol, min_player_symbol)
-                board[i] = Emoji.EMPTY.value
-                best_score = max(best_score, score)
-        return best_score
-    else:
-        best_score = math.inf
-        for i in range(9):
-            if board[i] == Emoji.EMPTY.value:
-                board[i] = min_player_symbol
-                score = minimax(board, True, max_player_symbol, min_player_symbol)
-                board[i] = Emoji.EMPTY.value
-                best_score = min(best_score, score)
-        return best_score
+    key = encode(board, max_player_symbol, min_player_symbol)
+    return _solve(key, is_max_turn)
 
 
 def best_move(board: list, max_player_symbol: str, min_player_symbol: str) -> int:
     """Вибір кращого ходу"""
-    best_score = -math.inf
-    move = None
-
-    for i in range(9):
-        if board[i] == Emoji.EMPTY.value:
-            board[i] = max_player_symbol
-            score = minimax(board, False, max_player_symbol, min_player_symbol)
-            board[i] = Emoji.EMPTY.value
-            if score > best_score:
-                best_score = score
-                move = i
-
-    if move is None:
+
+    move = table()[encode(board, max_player_symbol, min_player_symbol)]
+
+    if move == _NO_MOVE:
         raise ValueError("Немає доступних ходів на дошці")
 
     return move
@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import math
+import random
+import time
+from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from karatel.utils.constants import Emoji
+from karatel.utils.settings import TTT_TABLE_BITS, TTT_TIME_BUDGET
 
 if TYPE_CHECKING:
     from karatel.ui.abstract import OutputSpace
@@ -51,137 +54,308 @@ def check_winner(board: list[str]) -> str | None:
     return None
 
 
+# Бітборди: клітинка i -- біт 1 << i. Позиція -- два 16-бітні числа,
+# клітинки того, хто ходить, і клітинки суперника
+FULL = (1 << 16) - 1
+WIN_MASKS = tuple(sum(1 << i for i in combo) for combo in WIN_POSITIONS)
+
+WIN_SCORE = 1000  # виграш на глибині ply оцінюється як WIN_SCORE - ply
+_PROVEN = WIN_SCORE // 2  # оцінки, більші за модулем, -- доведений результат
+
+# Спершу клітинки на трьох лініях (центр і кути), потім решта
+MOVE_ORDER = (5, 6, 9, 10, 0, 3, 12, 15, 1, 2, 4, 7, 8, 11, 13, 14)
+
+
+def _symmetries() -> tuple[tuple[int, ...], ...]:
+    """8 симетрій квадрата: куди переходить кожна клітинка"""
+
+    transforms = (
+        lambda r, c: (r, c),
+        lambda r, c: (c, 3 - r),
+        lambda r, c: (3 - r, 3 - c),
+        lambda r, c: (3 - c, r),
+        lambda r, c: (r, 3 - c),
+        lambda r, c: (3 - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (3 - c, 3 - r),
+    )
+    return tuple(
+        tuple(4 * row + col for row, col in (t(i // 4, i % 4) for i in range(16)))
+        for t in transforms
+    )
+
+
+SYMMETRIES = _symmetries()
+_INVERSE = tuple(tuple(perm.index(i) for i in range(16)) for perm in SYMMETRIES)
+
+
+def _zobrist() -> tuple[tuple[tuple[tuple[int, ...], ...], ...], int]:
+    """Ключі Зобриста для (сторона, клітинка) у кожній з 8 симетрій.
+    Кожен ключ також змінює чергу ходу. Хід оновлює всі 8 хешів,
+    мінімальний з них -- ключ класу симетричних позицій"""
+
+    rng = random.Random(0x4B41)  # фіксоване зерно -- відтворюваний пошук
+    keys = [[rng.getrandbits(64) for _ in range(16)] for _ in range(2)]
+    turn = rng.getrandbits(64)
+    moves = tuple(
+        tuple(
+            tuple(keys[side][perm[cell]] ^ turn for perm in SYMMETRIES)
+            for cell in range(16)
+        )
+        for side in range(2)
+    )
+    return moves, turn
+
+
+_ZOBRIST, _TURN = _zobrist()
+
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+
+class TranspositionTable:
+    """Таблиця транспозицій фіксованого розміру (2**bits записів).
+    Запис витісняє попередній у тій самій комірці"""
+
+    __slots__ = ("_mask", "_entries")
+
+    def __init__(self, bits: int = TTT_TABLE_BITS) -> None:
+        self._mask = (1 << bits) - 1
+        self._entries: list[tuple | None] = [None] * (1 << bits)
+
+    def get(self, key: int) -> tuple | None:
+        entry = self._entries[key & self._mask]
+        return entry if entry is not None and entry[0] == key else None
+
+    def put(
+        self, key: int, depth: int, flag: int, value: int, move: int | None
+    ) -> None:
+        self._entries[key & self._mask] = (key, depth, flag, value, move)
+
+    def clear(self) -> None:
+        self._entries = [None] * len(self._entries)
+
+
+# Спільна для всіх пошуків: оцінки зберігаються відносно позиції,
+# тож лишаються правильними і для наступних ходів. Запис -- один кортеж,
+# тому одночасні пошуки з різних сесій не псують таблицю
+TABLE = TranspositionTable()
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """Результат пошуку: хід, оцінка для того, хто ходить, та глибина"""
+
+    move: int
+    score: int
+    depth: int
+    nodes: int
+    complete: bool  # гру прораховано до кінця або знайдено виграш/програш
+
+
+class _Timeout(Exception):
+    """Вичерпано бюджет часу"""
+
+
+def to_bitboards(
+    board: list[str], max_player_symbol: str, min_player_symbol: str
+) -> tuple[int, int]:
+    """Дошка -> (клітинки max_player_symbol, клітинки min_player_symbol)"""
+
+    mine = theirs = 0
+    for i, cell in enumerate(board):
+        if cell == max_player_symbol:
+            mine |= 1 << i
+        elif cell == min_player_symbol:
+            theirs |= 1 << i
+        elif cell != Emoji.EMPTY.value:
+            raise ValueError(f"Невідомий символ на дошці: {cell}")
+    return mine, theirs
+
+
+def has_line(bits: int) -> bool:
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+
 def evaluate_position(board: list[str], max_player: str, min_player: str) -> int:
-    """Евристична оцінка позиції"""
-    score = 0
+    """Евристична оцінка позиції для max_player"""
+    return _evaluate_bits(*to_bitboards(board, max_player, min_player))
 
-    for combo in WIN_POSITIONS:
-        max_count = sum(1 for i in combo if board[i] == max_player)
-        min_count = sum(1 for i in combo if board[i] == min_player)
-        empty_count = sum(1 for i in combo if board[i] == Emoji.EMPTY.value)
 
-        # Якщо лінія не заблокована
-        if max_count > 0 and min_count == 0:
-            score += max_count**2  # 1, 4, 9, 16
-        elif min_count > 0 and max_count == 0:
-            score -= min_count**2
+def _evaluate_bits(mine: int, theirs: int) -> int:
+    """Евристична оцінка: квадрат кількості фішок на кожній незаблокованій лінії"""
 
+    score = 0
+    for mask in WIN_MASKS:
+        if not theirs & mask:
+            score += (mine & mask).bit_count() ** 2  # 0, 1, 4, 9, 16
+        elif not mine & mask:
+            score -= (theirs & mask).bit_count() ** 2
     return score
 
 
-def minimax(
+def _hashes(mine: int, theirs: int) -> tuple[int, ...]:
+    """8 хешів кореня пошуку. Ходить сторона 0 (mine)"""
+
+    hashes = (0,) * 8
+    count = 0
+    for side, bits in ((0, mine), (1, theirs)):
+        for cell in range(16):
+            if bits >> cell & 1:
+                hashes = tuple(h ^ k for h, k in zip(hashes, _ZOBRIST[side][cell]))
+                count += 1
+    if count % 2:
+        # Ключі фішок несуть і зміну черги -- повертаємо чергу стороні 0
+        hashes = tuple(h ^ _TURN for h in hashes)
+    return hashes
+
+
+class _Search:
+    """Негамакс з альфа-бета відсіканням, таблицею транспозицій та симетріями"""
+
+    __slots__ = ("table", "deadline", "nodes")
+
+    def __init__(self, table: TranspositionTable, deadline: float) -> None:
+        self.table = table
+        self.deadline = deadline
+        self.nodes = 0
+
+    def negamax(
+        self,
+        mine: int,
+        theirs: int,
+        side: int,
+        hashes: tuple[int, ...],
+        depth: int,
+        ply: int,
+        alpha: int,
+        beta: int,
+    ) -> tuple[int, int | None]:
+        self.nodes += 1
+        if not self.nodes & 1023 and time.perf_counter() > self.deadline:
+            raise _Timeout
+
+        if has_line(theirs):  # суперник щойно виграв
+            return ply - WIN_SCORE, None
+        occupied = mine | theirs
+        if occupied == FULL:
+            return 0, None
+        if depth == 0:
+            return _evaluate_bits(mine, theirs), None
+
+        key = min(hashes)
+        symmetry = hashes.index(key)
+        first = None
+        original_alpha = alpha
+        entry = self.table.get(key)
+        if entry is not None:
+            _, stored_depth, flag, value, move = entry
+            if move is not None:
+                first = _INVERSE[symmetry][move]
+            # Виграш зберігається відносно позиції, а не кореня
+            if value > _PROVEN:
+                value -= ply
+            elif value < -_PROVEN:
+                value += ply
+            if stored_depth >= depth:
+                if flag == _EXACT:
+                    return value, first
+                if flag == _LOWER and value > alpha:
+                    alpha = value
+                elif flag == _UPPER and value < beta:
+                    beta = value
+                if alpha >= beta:
+                    return value, first
+
+        best_score = -WIN_SCORE - 1
+        best = None
+        for move in _moves(occupied, first):
+            child = tuple(h ^ k for h, k in zip(hashes, _ZOBRIST[side][move]))
+            score, _ = self.negamax(
+                theirs,
+                mine | 1 << move,
+                1 - side,
+                child,
+                depth - 1,
+                ply + 1,
+                -beta,
+                -alpha,
+            )
+            score = -score
+            if score > best_score:
+                best_score = score
+                best = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        flag = (
+            _UPPER
+            if best_score <= original_alpha
+            else _LOWER if best_score >= beta else _EXACT
+        )
+        value = best_score
+        if value > _PROVEN:
+            value += ply
+        elif value < -_PROVEN:
+            value -= ply
+        self.table.put(key, depth, flag, value, SYMMETRIES[symmetry][best])
+        return best_score, best
+
+
+def _moves(occupied: int, first: int | None) -> Iterator[int]:
+    if first is not None and not occupied >> first & 1:
+        yield first
+    for move in MOVE_ORDER:
+        if move != first and not occupied >> move & 1:
+            yield move
+
+
+def search(
     board: list[str],
-    depth: int,
-    max_depth: int,
-    is_max_turn: bool,
     max_player_symbol: str,
     min_player_symbol: str,
-    alpha: float = -math.inf,
-    beta: float = math.inf,
-) -> int:
-    """Побудова дерева ходів"""
-
-    if depth >= max_depth:
-        return evaluate_position(board, max_player_symbol, min_player_symbol)
-
-    winner = check_winner(board)
-
-    if winner == max_player_symbol:
-        return 100 - depth
-    if winner == min_player_symbol:
-        return depth - 100
-    if winner == TTT.DRAW.value:
-        return 0
-
-    if is_max_turn:
-        best_score = -math.inf
-        for i in range(16):
-            if board[i] == Emoji.EMPTY.value:
-                board[i] = max_player_symbol
-                score = minimax(
-                    board,
-                    depth + 1,
-                    max_depth,
-                    False,
-                    max_player_symbol,
-                    min_player_symbol,
-                    alpha,
-                    beta,
-                )
-                board[i] = Emoji.EMPTY.value
-                best_score = max(best_score, score)
-
-                alpha = max(alpha, score)
-                if beta <= alpha:
-                    break
-
-        return best_score
-    else:
-        best_score = math.inf
-        for i in range(16):
-            if board[i] == Emoji.EMPTY.value:
-                board[i] = min_player_symbol
-                score = minimax(
-                    board,
-                    depth + 1,
-                    max_depth,
-                    True,
-                    max_player_symbol,
-                    min_player_symbol,
-                    alpha,
-                    beta,
-                )
-                board[i] = Emoji.EMPTY.value
-                best_score = min(best_score, score)
-
-                beta = min(beta, score)
-                if beta <= alpha:
-                    break
-
-        return best_score
-
-
-def best_move(board: list, max_player_symbol: str, min_player_symbol: str) -> int:
-    """Вибір кращого ходу"""
-    best_score = -math.inf
-    move = None
-    alpha = -math.inf
-    beta = math.inf
-
-    filled = sum(1 for cell in board if cell != Emoji.EMPTY.value)
-    if filled < 4:
-        # Початок гри - обмежуємо глибину
-        actual_depth = 4
-    elif filled < 8:
-        actual_depth = 6
-    else:
-        # Кінець гри - повний перебір
-        actual_depth = 16
-
-    for i in range(16):
-        if board[i] == Emoji.EMPTY.value:
-            board[i] = max_player_symbol
-            score = minimax(
-                board,
-                0,
-                actual_depth,
-                False,
-                max_player_symbol,
-                min_player_symbol,
-                alpha,
-                beta,
+    budget: float = TTT_TIME_BUDGET,
+    table: TranspositionTable = TABLE,
+) -> SearchResult:
+    """Ітеративне поглиблення в межах бюджету часу (секунд).
+    Повертає найкращий хід останньої завершеної ітерації"""
+
+    mine, theirs = to_bitboards(board, max_player_symbol, min_player_symbol)
+    empty = 16 - (mine | theirs).bit_count()
+    if not empty:
+        raise ValueError("Немає доступних ходів на дошці")
+
+    searcher = _Search(table, time.perf_counter() + budget)
+    hashes = _hashes(mine, theirs)
+    result = SearchResult(next(_moves(mine | theirs, None)), 0, 0, 0, False)
+
+    for depth in range(1, empty + 1):
+        try:
+            score, move = searcher.negamax(
+                mine, theirs, 0, hashes, depth, 0, -WIN_SCORE - 1, WIN_SCORE + 1
             )
-            board[i] = Emoji.EMPTY.value
-            if score > best_score:
-                best_score = score
-                move = i
+        except _Timeout:
+            break
+        complete = depth == empty or abs(score) > _PROVEN
+        result = SearchResult(move, score, depth, searcher.nodes, complete)
+        if complete:
+            break
 
-            alpha = max(alpha, score)
+    return result
 
-    if move is None:
-        raise ValueError("Немає доступних ходів на дошці")
 
-    return move
+def best_move(
+    board: list,
+    max_player_symbol: str,
+    min_player_symbol: str,
+    budget: float = TTT_TIME_BUDGET,
+) -> int:
+    """Вибір кращого ходу"""
+    return search(board, max_player_symbol, min_player_symbol, budget).move
 
 
 def render_board(output: OutputSpace, board: list) -> None:
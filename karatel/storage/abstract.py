@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 import requests
 
@@ -13,38 +14,41 @@ from karatel.auth.firebase import (
     firebase_signin,
     firebase_signup,
 )
+from karatel.core.hero import HeroFactory
+from karatel.core.map import dict_to_map
 from karatel.storage import firebase_manager
-
-# from karatel.storage.sqlite_manager import (
-#     delete_row_by_id,
-#     delete_table,
-#     insert_user,
-#     select_heroes,
-#     select_user,
-#     sqlite_hero_and_map_loader,
-#     sqlite_hero_and_map_saver,
-#     update_user_data,
-# )
+from karatel.ui.abstract import NoneOutput
 from karatel.utils.crypt import (  # hash_pass,; is_username_valid,; validate_password,
     is_email_valid,
     is_password_valid,
 )
 
-# from karatel.utils.settings import HERO_SQL_TABLE, USERS_SQL_TABLE
-
 if TYPE_CHECKING:
     from karatel.core.hero import Hero
+    from karatel.storage.summary import HeroSummary
     from karatel.ui.abstract import OutputSpace
 
+# Збереження у вигляді словників: (ім'я героя, герой, мапа)
+SaveRecord = tuple[str, dict, dict | list | None]
+
 
 class StorageManager(ABC):
     """'Відкритий простір' для збереження/завантаження користувача та героїв"""
 
+    # Що є ключем користувача в iter_users, iter_saves та import_saves:
+    # "username" -- ім'я користувача, "uid" -- ID облікового запису Firebase
+    user_key = "username"
+
     @abstractmethod
     def list_hero(self, output: OutputSpace, username: str) -> list:
         """Перегляд переліку героїв через 'відкритий простір'"""
         pass
 
+    @abstractmethod
+    def list_summaries(self, output: OutputSpace, username: str) -> list[HeroSummary]:
+        """Перелік коротких описів героїв, без завантаження мап"""
+        pass
+
     @abstractmethod
     def save_hero(
         self, hero: Hero, game_map: list | None, username: str, log: bool
@@ -97,6 +101,46 @@ class StorageManager(ABC):
         """Перевірка валідності імені користувача"""
         pass
 
+    # Міграція між сховищами. Словники героя та мапи переносяться як є,
+    # без відновлення героїв та мап
+
+    @abstractmethod
+    def iter_users(self) -> Iterator[str]:
+        """Ключі всіх користувачів сховища"""
+        pass
+
+    def iter_saves(self, username: str) -> Iterator[SaveRecord]:
+        """Усі збереження користувача"""
+
+        for hero_name, json_hero, json_map in self.list_hero(NoneOutput(), username):
+            yield (
+                hero_name,
+                json.loads(json_hero),
+                json.loads(json_map) if json_map is not None else None,
+            )
+
+    def import_saves(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        """Запис збережень, отриманих з iter_saves. Повертає їх кількість"""
+        return self.save_records(username, saves)
+
+    def save_records(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        """Запис збережень-словників без відновлення героя та мапи.
+        username -- той самий ключ, що й у save_hero. Повертає кількість.
+        За замовчуванням герой і мапа все ж відновлюються для save_hero"""
+
+        output = NoneOutput()
+        counter = 0
+        for _, hero_dict, map_dict in saves:
+            hero = HeroFactory.dict_to_hero(output, hero_dict)
+            game_map = (
+                dict_to_map(output=output, the_list=map_dict)
+                if map_dict is not None
+                else None
+            )
+            self.save_hero(hero, game_map, username, log=False)
+            counter += 1
+        return counter
+
     @staticmethod
     def check_password(output: OutputSpace, password: str, log: bool) -> bool:
         """Перевірка валідності пароля користувача"""
@@ -114,9 +158,14 @@ class StorageManager(ABC):
 class FirebaseSaver(StorageManager):
     """Робота з Firebase"""
 
+    user_key = "uid"
+
     def list_hero(self, output: OutputSpace, username: str) -> list:
         return firebase_manager.fetch_heroes(username)
 
+    def list_summaries(self, output: OutputSpace, username: str) -> list[HeroSummary]:
+        return firebase_manager.fetch_summaries(username)
+
     def save_hero(
         self, hero: Hero, game_map: list | None, username: str, log: bool
     ) -> None:
@@ -134,6 +183,18 @@ class FirebaseSaver(StorageManager):
     def delete_hero(self, output: OutputSpace, username: str, hero_name: str) -> bool:
         return firebase_manager.delete_hero(uid=username, hero_name=hero_name)
 
+    def iter_users(self) -> Iterator[str]:
+        return firebase_manager.iter_users()
+
+    def iter_saves(self, username: str) -> Iterator[SaveRecord]:
+        return firebase_manager.iter_saves(username)
+
+    def import_saves(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        return firebase_manager.import_saves(saves, uid=username)
+
+    def save_records(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        return firebase_manager.import_saves(saves, uid=username)
+
     def register_user(
         self, output: OutputSpace, username: str, password: str, log: bool
     ) -> tuple[bool, str | None, str | None, str | None, str | None]:
@@ -219,133 +280,6 @@ class FirebaseSaver(StorageManager):
         return uname
 
 
-# # Спосіб збереження в SQLite втратив свою актуальність
-#
-# class SQLiteSaver(StorageManager):
-#     """Робота з SQLite"""
-#
-#     def __init__(self):
-#         # self._path = SQLITE_PATH
-#         self._hero_table = HERO_SQL_TABLE
-#         self._users_table = USERS_SQL_TABLE
-#
-#     def _create_table_name(self, username: str) -> str:
-#         return self._hero_table + "_" + username
-#
-#     def list_hero(self, output: OutputSpace, username: str) -> list:
-#         return select_heroes(
-#             output=output,
-#             table_name=self._create_table_name(username),
-#         )
-#
-#     def save_hero(
-#         self, hero: Hero, game_map: list | None, username: str, log: bool
-#     ) -> None:
-#         sqlite_hero_and_map_saver(
-#             hero=hero,
-#             game_map=game_map,
-#             table_name=self._create_table_name(username),
-#             log=log,
-#         )
-#
-#     def load_hero(
-#         self, output: OutputSpace, username: str, hero_id: int, log: bool
-#     ) -> tuple[Hero, list]:
-#         return sqlite_hero_and_map_loader(
-#             output=output,
-#             table_name=self._create_table_name(username),
-#             hero_id=hero_id,
-#             log=log,
-#         )
-#
-#     def delete_hero(self, output: OutputSpace, username: str, row_id: int) -> bool:
-#         return delete_row_by_id(
-#             output=output,
-#             table_name=self._create_table_name(username),
-#             row_id=row_id,
-#         )
-#
-#     def register_user(
-#         self, output: OutputSpace, username: str, password: str, log: bool
-#     ) -> bool:
-#         hashed_password = hash_pass(password)
-#         return insert_user(
-#             output=output,
-#             username=username,
-#             hashed_password=hashed_password,
-#             table_name=self._users_table,
-#             log=log,
-#         )
-#
-#     def fetch_user(
-#         self, output: OutputSpace, username: str, log: bool
-#     ) -> tuple[int, bytes] | None:
-#         return select_user(
-#             output=output, username=username, table_name=self._users_table, log=log
-#         )
-#
-#     def delete_user(self, output: OutputSpace, username: str, row_id: int) -> bool:
-#         delete_table(output=output, table_name=self._create_table_name(username))
-#         is_row_deleted = delete_row_by_id(
-#             output=output, table_name=self._users_table, row_id=row_id
-#         )
-#         return is_row_deleted
-#
-#     def update_password(
-#         self, output: OutputSpace, user_id: int, password: str, log: bool
-#     ) -> bool:
-#         hashed_password = hash_pass(password)
-#         return update_user_data(
-#             output=output,
-#             user_id=user_id,
-#             hashed_password=hashed_password,
-#             table_name=self._users_table,
-#             log=log,
-#         )
-#
-#     def update_username(
-#         self,
-#         output: OutputSpace,
-#         user_id: int,
-#         new_username: str,
-#         old_username: str,
-#         log: bool,
-#     ) -> bool:
-#         return update_user_data(
-#             output=output,
-#             user_id=user_id,
-#             username=new_username,
-#             old_username_table=self._create_table_name(old_username),
-#             new_username_table=self._create_table_name(new_username),
-#             table_name=self._users_table,
-#             log=log,
-#         )
-#
-#     def validate_user(
-#         self, output: OutputSpace, username: str, password: str, log: bool
-#     ) -> tuple[int | None, bool]:
-#         all_data = select_user(
-#             output=output, username=username, table_name=self._users_table, log=False
-#         )
-#         if all_data is None:
-#             return None, False
-#         user_id, hashed_password = all_data
-#         return user_id, validate_password(password, hashed_password)
-#
-#     @staticmethod
-#     def check_username(output: OutputSpace, username: str, log: bool) -> bool:
-#         uname = is_username_valid(username)
-#         if not uname:
-#             output.write(
-#                 "Ім'я користувача має містити мінімум 2 символи, "
-#                 + "може мати лише літери латинського алфавіту, "
-#                 + "цифри та знак підкреслення.",
-#                 log=log,
-#             )
-#         return uname
-
-
-#
 # Спосіб збереження в файл втратив свою актуальність
 #
 # class FileSaver(ABC):
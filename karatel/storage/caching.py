@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""Кешуючий декоратор для StorageManager.
+Збереження: пропуск незмінених героїв, об'єднання частих збережень
+та запис у фоновому потоці. Завантаження: LRU-кеш з TTL"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import dict_to_map, map_to_save
+from karatel.storage.abstract import SaveRecord, StorageManager
+from karatel.utils.settings import (
+    SAVE_CACHE_SIZE,
+    SAVE_CACHE_TTL,
+    SAVE_FLUSH_DELAY,
+    SAVE_RETRIES,
+)
+
+if TYPE_CHECKING:
+    from karatel.core.hero import Hero
+    from karatel.storage.summary import HeroSummary
+    from karatel.ui.abstract import OutputSpace
+
+# Відкриті декоратори. Слабкі посилання, щоб atexit не тримав їх у пам'яті
+_SAVERS: weakref.WeakSet[CachingSaver] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_all() -> None:
+    """Запис усього, що чекає, при завершенні програми"""
+    for saver in list(_SAVERS):
+        saver.close()
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Незмінний знімок героя та мапи на момент збереження"""
+
+    hero: dict
+    game_map: dict | list | None
+    digest: str
+
+    @classmethod
+    def take(cls, hero: Hero, game_map: list | None) -> _Snapshot:
+        hero_dict = HeroFactory.hero_to_dict(hero)
+        map_save = map_to_save(game_map) if game_map is not None else None
+        payload = json.dumps(
+            [hero_dict, map_save], sort_keys=True, ensure_ascii=False
+        ).encode("utf-8")
+        return cls(hero_dict, map_save, hashlib.blake2b(payload).hexdigest())
+
+    def restore(self, output: OutputSpace) -> tuple[Hero, list | None]:
+        """Нові герой та мапа зі знімка"""
+        hero = HeroFactory.dict_to_hero(output, self.hero)
+        game_map = (
+            dict_to_map(output=output, the_list=self.game_map)
+            if self.game_map is not None
+            else None
+        )
+        return hero, game_map
+
+
+class CachingSaver(StorageManager):
+    """Декоратор над будь-яким StorageManager"""
+
+    def __init__(
+        self,
+        saver: StorageManager,
+        ttl: float = SAVE_CACHE_TTL,
+        max_size: int = SAVE_CACHE_SIZE,
+        retries: int = SAVE_RETRIES,
+        delay: float = SAVE_FLUSH_DELAY,
+    ) -> None:
+        self._saver = saver
+        self._ttl = ttl
+        self._max_size = max_size
+        self._retries = retries
+        self._delay = delay
+
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Один запис у сховище за раз
+        self._wakeup = threading.Condition(self._lock)
+        # (користувач, герой) -> хеш останнього записаного знімка
+        self._saved: dict[tuple[str, str], str] = {}
+        # (користувач, герой) -> (output, знімок), що чекає запису
+        self._pending: dict[tuple[str, str], tuple[OutputSpace, _Snapshot]] = {}
+        # (користувач, герой) -> (час, знімок) для завантаження
+        self._cache: OrderedDict[tuple[str, str], tuple[float, _Snapshot]] = (
+            OrderedDict()
+        )
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        _SAVERS.add(self)
+
+    # Запис
+
+    def save_hero(
+        self, hero: Hero, game_map: list | None, username: str, log: bool
+    ) -> None:
+        key = (username, hero.name)
+        snapshot = _Snapshot.take(hero, game_map)
+
+        with self._lock:
+            self._remember(key, snapshot)
+            pending = self._pending.get(key)
+            last = pending[1].digest if pending else self._saved.get(key)
+            if snapshot.digest == last:
+                hero.output.write(f"Героя '{hero.name}' збережено", log=log)
+                return
+            # Новіший знімок замінює той, що ще не записаний
+            self._pending[key] = (hero.output, snapshot)
+            closed = self._closed
+            self._start()
+            self._wakeup.notify()
+
+        # Після close() фонового потоку немає -- запис одразу
+        if closed:
+            self.flush(username)
+        hero.output.write(f"Героя '{hero.name}' збережено", log=log)
+
+    def flush(self, username: str | None = None) -> None:
+        """Негайний запис знімків, що чекають (усіх або одного користувача)"""
+
+        # Блокування запису на весь час, щоб видалення героя
+        # не випередило вже взятий з черги знімок
+        with self._write_lock:
+            with self._lock:
+                keys = [
+                    key
+                    for key in self._pending
+                    if username is None or key[0] == username
+                ]
+                batch = [(key, self._pending.pop(key)) for key in keys]
+                # Знімок, що записується, вважається збереженим, інакше
+                # таке саме збереження під час запису стане в чергу знову
+                for key, (_, snapshot) in batch:
+                    self._saved[key] = snapshot.digest
+            self._write(batch)
+
+    def close(self) -> None:
+        """Зупинка фонового потоку із записом усього, що чекає"""
+
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        self.flush()
+        _SAVERS.discard(self)
+
+    def _start(self) -> None:
+        """Запуск фонового потоку при першому збереженні"""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(
+                target=self._run, name="karatel-saver", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Фоновий потік: чекає збережень, дає їм об'єднатися та записує"""
+
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                # Збереження, що надійдуть за цей час, замінять попередні.
+                # close() перериває очікування
+                self._wakeup.wait_for(lambda: self._closed, timeout=self._delay)
+                if self._closed:
+                    return
+            self.flush()
+
+    def _write(self, batch: list) -> None:
+        """Запис знімків з обмеженою кількістю спроб. Знімок, який так
+        і не записався, повертається в чергу. Викликається під self._write_lock"""
+
+        for key, (output, snapshot) in batch:
+            username, hero_name = key
+            record = (hero_name, snapshot.hero, snapshot.game_map)
+            for attempt in range(self._retries + 1):
+                try:
+                    # Словники зі знімка йдуть у сховище без відновлення героя
+                    self._saver.save_records(username, [record])
+                    break
+                except Exception as e:
+                    if attempt == self._retries:
+                        output.write(
+                            f"Не вдалося зберегти героя '{hero_name}': {e}. "
+                            f"Повторна спроба -- під час наступного запису",
+                            log=True,
+                        )
+                        with self._lock:
+                            # Видалений герой не повертається, а новіший
+                            # знімок у черзі не замінюється старим
+                            if self._saved.get(key) == snapshot.digest:
+                                del self._saved[key]
+                                self._pending.setdefault(key, (output, snapshot))
+                        break
+                    time.sleep(min(2**attempt * 0.1, 2.0))
+
+    # Читання
+
+    def _remember(self, key: tuple[str, str], snapshot: _Snapshot) -> None:
+        """Запис у кеш завантажень. Викликається під self._lock"""
+        self._cache[key] = (time.monotonic() + self._ttl, snapshot)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def invalidate(self, username: str, hero_name: str | None = None) -> None:
+        """Видалення з кешу одного героя або всіх героїв користувача"""
+
+        with self._lock:
+            for key in list(self._cache):
+                if key[0] == username and hero_name in (None, key[1]):
+                    del self._cache[key]
+
+    def load_hero(
+        self, output: OutputSpace, username: str, hero_name: str, log: bool
+    ) -> tuple[Hero, list]:
+        key = (username, hero_name)
+
+        with self._lock:
+            pending = self._pending.get(key)
+            cached = self._cache.get(key)
+            if pending is not None:
+                snapshot = pending[1]
+            elif cached is not None and cached[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                snapshot = cached[1]
+            else:
+                snapshot = None
+        if snapshot is not None:
+            return snapshot.restore(output)
+
+        hero, game_map = self._saver.load_hero(
+            output=output, username=username, hero_name=hero_name, log=log
+        )
+        if hero is not None:
+            # Знімок з'являється вже після завантаження, тому не перезаписує
+            # новіше збереження з іншого потоку
+            snapshot = _Snapshot.take(hero, game_map)
+            with self._lock:
+                if key not in self._pending:
+                    self._remember(key, snapshot)
+                    self._saved.setdefault(key, snapshot.digest)
+        return hero, game_map
+
+    # Решта операцій -- без кешу
+
+    def list_hero(self, output: OutputSpace, username: str) -> list:
+        self.flush(username)
+        return self._saver.list_hero(output, username)
+
+    def list_summaries(self, output: OutputSpace, username: str) -> list[HeroSummary]:
+        self.flush(username)
+        return self._saver.list_summaries(output, username)
+
+    def _forget(self, username: str, hero_name: str | None = None) -> None:
+        """Видалення всіх слідів героя (або користувача) з кешів"""
+
+        with self._lock:
+            for store in (self._pending, self._saved, self._cache):
+                for key in list(store):
+                    if key[0] == username and hero_name in (None, key[1]):
+                        del store[key]
+
+    def delete_hero(self, output: OutputSpace, username: str, hero_name: str) -> bool:
+        self._forget(username, hero_name)
+        with self._write_lock:
+            return self._saver.delete_hero(
+                output=output, username=username, hero_name=hero_name
+            )
+
+    @property
+    def user_key(self) -> str:
+        return self._saver.user_key
+
+    def iter_users(self) -> Iterator[str]:
+        return self._saver.iter_users()
+
+    def iter_saves(self, username: str) -> Iterator[SaveRecord]:
+        self.flush(username)
+        return self._saver.iter_saves(username)
+
+    def import_saves(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        self._forget(username)
+        with self._write_lock:
+            return self._saver.import_saves(username, saves)
+
+    def save_records(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        self._forget(username)
+        with self._write_lock:
+            return self._saver.save_records(username, saves)
+
+    def register_user(
+        self, output: OutputSpace, username: str, password: str, log: bool
+    ) -> tuple[bool, str | int | None, str | None, str | None, str | None]:
+        return self._saver.register_user(output, username, password, log)
+
+    def validate_user(
+        self, output: OutputSpace, username: str, password: str, log: bool
+    ) -> tuple[bool, str | int | None, str | None, str | None, str | None]:
+        return self._saver.validate_user(output, username, password, log)
+
+    def delete_user(
+        self, output: OutputSpace, username: str, id_token: str, log: bool
+    ) -> bool:
+        self._forget(username)
+        with self._write_lock:
+            return self._saver.delete_user(output, username, id_token, log)
+
+    def update_password(
+        self, output: OutputSpace, id_token: str, password: str, log: bool
+    ) -> tuple[bool, str | None, str | None, str | None, str | None]:
+        return self._saver.update_password(output, id_token, password, log)
+
+    def check_username(self, output: OutputSpace, username: str, log: bool) -> bool:
+        return self._saver.check_username(output, username, log)
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import TYPE_CHECKING
+import weakref
+from itertools import islice
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Iterator
 
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
 
 from karatel.core.hero import HeroFactory
-from karatel.core.map import dict_to_map, map_to_dict
+from karatel.core.map import dict_to_map, map_to_save
+from karatel.storage.summary import HeroSummary
 from karatel.utils.settings import (
+    FIREBASE_BATCH_LIMIT,
     FIREBASE_CERTIFICATE_PATH,
     FIREBASE_LIMIT,
     FIREBASE_MAIN_COLLECTION,
@@ -18,6 +23,8 @@ from karatel.utils.settings import (
 )
 
 if TYPE_CHECKING:
+    from google.cloud.firestore import AsyncClient
+
     from karatel.core.hero import Hero
     from karatel.ui.abstract import OutputSpace
 
@@ -33,6 +40,63 @@ db = firestore.client(app)  # після цього можна створюва
 DB = db.collection(FIREBASE_MAIN_COLLECTION)
 
 
+def _saves(uid: str):
+    """Колекція збережень користувача"""
+    return DB.document(uid).collection(FIREBASE_SAVES_COLLECTION)
+
+
+def _save_document(
+    summary: HeroSummary, hero_dict: dict, map_dict: dict | list | None
+) -> dict:
+    """Документ збереження: герой та мапа як JSON рядки
+    та короткий опис для списку героїв"""
+
+    summary_dict = summary.to_dict()
+    summary_dict["updated_at"] = firestore.SERVER_TIMESTAMP
+
+    return {
+        "summary": summary_dict,
+        "hero": json.dumps(hero_dict, ensure_ascii=False),
+        "map": json.dumps(map_dict, ensure_ascii=False),
+    }
+
+
+def _hero_data(hero: Hero, game_map: list | None) -> dict:
+    """Документ збереження героя та мапи"""
+    return _save_document(
+        HeroSummary.from_hero(hero, game_map),
+        HeroFactory.hero_to_dict(hero),
+        map_to_save(game_map) if game_map is not None else None,
+    )
+
+
+def _parse_hero(
+    output: OutputSpace, json_hero: str | None, json_map: str | None
+) -> tuple[Hero | None, list | None]:
+    """Герой та мапа з JSON рядків документа"""
+
+    if json_hero is None:
+        return None, None
+
+    hero_dict = json.loads(json_hero)
+    hero = HeroFactory.dict_to_hero(output, hero_dict)
+
+    map_dict = json.loads(json_map)
+    game_map = (
+        dict_to_map(output=output, the_list=map_dict) if map_dict is not None else None
+    )
+
+    return hero, game_map
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    """Розбиття на списки довжиною не більше size"""
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 def save_email(uid: str, email: str) -> None:
     """Збереження email користувача у Firebase Firestore"""
 
@@ -46,25 +110,33 @@ def save_email(uid: str, email: str) -> None:
 def save_hero(hero: Hero, game_map: list | None, uid: str) -> None:
     """Збереження героя та мапи у Firebase Firestore"""
 
-    json_hero = json.dumps(HeroFactory.hero_to_dict(hero), ensure_ascii=False)
-    json_map = json.dumps(
-        map_to_dict(game_map) if game_map is not None else None, ensure_ascii=False
-    )
+    _saves(uid).document(hero.name).set(_hero_data(hero, game_map))
 
-    data = {
-        "hero": json_hero,
-        "map": json_map,
-    }
 
-    DB.document(uid).collection(FIREBASE_SAVES_COLLECTION).document(hero.name).set(data)
+def save_heroes(
+    heroes: Iterable[tuple[Hero, list | None]],
+    uid: str,
+    batch_size: int = FIREBASE_BATCH_LIMIT,
+) -> int:
+    """Збереження кількох героїв пакетами WriteBatch:
+    один запит на batch_size документів. Повертає кількість збережених"""
+
+    saves = _saves(uid)
+    counter = 0
+    for chunk in _chunks(heroes, batch_size):
+        batch = db.batch()
+        for hero, game_map in chunk:
+            batch.set(saves.document(hero.name), _hero_data(hero, game_map))
+        batch.commit()
+        counter += len(chunk)
+    return counter
 
 
 def select_hero(uid: str, hero_name: str) -> tuple[str | None, str | None]:
     """Вибірка героя та мапи з Firebase Firestore
     повернення в форматі JSON рядків"""
 
-    doc_ref = DB.document(uid).collection(FIREBASE_SAVES_COLLECTION).document(hero_name)
-    doc = doc_ref.get()
+    doc = _saves(uid).document(hero_name).get()
 
     if doc.exists:
         data = doc.to_dict()
@@ -84,78 +156,244 @@ def load_hero(
     """Завантаження героя та мапи з Firebase Firestore"""
 
     json_hero, json_map = select_hero(uid, hero_name)
+    return _parse_hero(output, json_hero, json_map)
 
-    if json_hero is None:
-        return None, None
 
-    hero_dict = json.loads(json_hero)
-    hero = HeroFactory.dict_to_hero(output, hero_dict)
+def _iter_pages(query, limit: int) -> Iterator[list]:
+    """Посторінкове читання запиту без рекурсії"""
 
-    map_dict = json.loads(json_map)
-    game_map = (
-        dict_to_map(output=output, the_list=map_dict) if map_dict is not None else None
-    )
+    query = query.order_by("__name__").limit(limit)
+    last_doc = None
+    while True:
+        page = query.start_after(last_doc) if last_doc is not None else query
+        # .get() повертає не звичайний список, тому конвертуємо його
+        docs = list(page.get())
+        if docs:
+            yield docs
+        if len(docs) < limit:
+            return
+        last_doc = docs[-1]
 
-    return hero, game_map
+
+def iter_heroes(
+    uid: str, limit: int = FIREBASE_LIMIT
+) -> Iterator[tuple[str, str | None, str | None]]:
+    """Генератор героїв та мап користувача з Firebase Firestore.
+    Сторінки по limit документів читаються лише за потреби"""
+
+    for docs in _iter_pages(_saves(uid), limit):
+        for doc in docs:
+            data = doc.to_dict()
+            yield doc.id, data.get("hero"), data.get("map")
 
 
 def fetch_heroes(
-    uid: str, limit: int = FIREBASE_LIMIT, last_doc=None
+    uid: str, limit: int = FIREBASE_LIMIT
 ) -> list[tuple[str, str | None, str | None]]:
-    """Отримання списку героїв та мап для користувача з Firebase Firestore
-    Обережно! Рекурсія! :)"""
+    """Отримання списку героїв та мап для користувача з Firebase Firestore"""
+    return list(iter_heroes(uid, limit))
 
-    the_list = []
 
-    query = (
-        DB.document(uid)
-        .collection(FIREBASE_SAVES_COLLECTION)
-        .order_by("__name__")
-        .limit(limit)
-    )
+def iter_users(page_size: int = FIREBASE_LIMIT) -> Iterator[str]:
+    """Генератор uid усіх користувачів.
+    list_documents повертає і документи, що мають лише збереження"""
 
-    if last_doc is not None:
-        query = query.start_after(last_doc)
+    for doc_ref in DB.list_documents(page_size=page_size):
+        yield doc_ref.id
 
-    docs = list(
-        query.get()
-    )  # .get() повертає не звичайний список, тому конвертуємо його
 
-    for doc in docs:
-        data = doc.to_dict()
-        the_list.append((doc.id, data.get("hero"), data.get("map")))
+def iter_saves(
+    uid: str, limit: int = FIREBASE_LIMIT
+) -> Iterator[tuple[str, dict, dict | list | None]]:
+    """Генератор збережень користувача як словників"""
 
-    if len(docs) == limit:
-        the_list += fetch_heroes(uid, limit, docs[-1])
+    for hero_name, json_hero, json_map in iter_heroes(uid, limit):
+        if json_hero is None:
+            continue
+        yield (
+            hero_name,
+            json.loads(json_hero),
+            json.loads(json_map) if json_map is not None else None,
+        )
 
-    return the_list
 
+def import_saves(
+    saves: Iterable[tuple[str, dict, dict | list | None]],
+    uid: str,
+    batch_size: int = FIREBASE_BATCH_LIMIT,
+) -> int:
+    """Запис збережень-словників пакетами WriteBatch"""
 
-def delete_all_heroes(uid: str, limit: int | None = FIREBASE_LIMIT) -> None:
+    collection = _saves(uid)
+    counter = 0
+    for chunk in _chunks(saves, batch_size):
+        batch = db.batch()
+        for hero_name, hero_dict, map_dict in chunk:
+            batch.set(
+                collection.document(hero_name),
+                _save_document(
+                    HeroSummary.from_save(hero_dict, map_dict), hero_dict, map_dict
+                ),
+            )
+        batch.commit()
+        counter += len(chunk)
+    return counter
+
+
+def _backfill_summaries(refs: list) -> dict[str, HeroSummary]:
+    """Описи старих збережень, де опису ще немає. Документи читаються
+    одним запитом get_all, а описи дописуються в них пакетом WriteBatch,
+    тож наступний перелік уже не читатиме героїв та мапи"""
+
+    summaries: dict[str, HeroSummary] = {}
+    batch = db.batch()
+    for doc in db.get_all(refs):
+        data = doc.to_dict() if doc.exists else None
+        if not data or data.get("hero") is None:
+            continue
+        summary = HeroSummary.from_json(data["hero"], data.get("map"))
+        summaries[doc.id] = summary
+        batch.update(doc.reference, {"summary": summary.to_dict()})
+    if summaries:
+        batch.commit()
+    return summaries
+
+
+def iter_summaries(uid: str, limit: int = FIREBASE_LIMIT) -> Iterator[HeroSummary]:
+    """Генератор коротких описів героїв користувача.
+    Маска полів select залишає у відповіді лише опис, без героя та мапи"""
+
+    for docs in _iter_pages(_saves(uid).select(["summary"]), limit):
+        summaries = [doc.to_dict().get("summary") for doc in docs]
+        legacy = [doc.reference for doc, data in zip(docs, summaries) if data is None]
+        backfilled = _backfill_summaries(legacy) if legacy else {}
+        for doc, data in zip(docs, summaries):
+            if data is not None:
+                yield HeroSummary.from_dict(data)
+            elif doc.id in backfilled:
+                yield backfilled[doc.id]
+
+
+def fetch_summaries(uid: str, limit: int = FIREBASE_LIMIT) -> list[HeroSummary]:
+    """Список коротких описів героїв користувача з Firebase Firestore"""
+    return list(iter_summaries(uid, limit))
+
+
+def delete_all_heroes(uid: str, limit: int = FIREBASE_BATCH_LIMIT) -> None:
     """Видалення всіх героїв користувача та самого користувача
-    з Firebase Firestore
-    Обережно! Рекурсія! :)"""
+    з Firebase Firestore. Документи видаляються пакетами WriteBatch,
+    а зі сторінок читаються лише посилання, без вмісту"""
 
-    counter = 0
-    docs = (
-        DB.document(uid)
-        .collection(FIREBASE_SAVES_COLLECTION)
-        .order_by("__name__")
-        .limit(limit)
-        .get()
-    )
-    for doc in docs:
-        doc.reference.delete()
-        counter += 1
+    # Наступна сторінка читається вже після видалення попередньої,
+    # тому start_after не потрібен -- беремо першу сторінку знову
+    query = _saves(uid).select(["__name__"]).order_by("__name__").limit(limit)
+    while True:
+        docs = list(query.get())
+        if docs:
+            batch = db.batch()
+            for doc in docs:
+                batch.delete(doc.reference)
+            batch.commit()
+        if len(docs) < limit:
+            break
 
-    if counter == limit:
-        delete_all_heroes(uid, limit)
-    if counter < limit:
-        DB.document(uid).delete()
+    DB.document(uid).delete()
 
 
 def delete_hero(uid: str, hero_name: str) -> bool:
     """Видалення героя з Firebase Firestore"""
-    doc_ref = DB.document(uid).collection(FIREBASE_SAVES_COLLECTION).document(hero_name)
-    doc_ref.delete()
+    _saves(uid).document(hero_name).delete()
     return True
+
+
+# Асинхронний шлях: кілька збережень та завантажень одночасно
+# в одному циклі подій
+
+
+# Цикл подій -> асинхронний клієнт. Канали клієнта прив'язані до циклу,
+# у якому їх створено, тому кожен цикл отримує власний клієнт
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def async_client() -> AsyncClient:
+    """Асинхронний клієнт Firestore для поточного циклу подій.
+    firestore_async.client кешує один клієнт на застосунок,
+    тому клієнт створюється напряму"""
+
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = firestore_async.AsyncClient(
+            credentials=app.credential.get_credential(), project=app.project_id
+        )
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+def _async_saves(uid: str):
+    """Колекція збережень користувача для асинхронного клієнта"""
+    return (
+        async_client()
+        .collection(FIREBASE_MAIN_COLLECTION)
+        .document(uid)
+        .collection(FIREBASE_SAVES_COLLECTION)
+    )
+
+
+async def async_save_hero(hero: Hero, game_map: list | None, uid: str) -> None:
+    """Асинхронне збереження героя та мапи у Firebase Firestore"""
+
+    await _async_saves(uid).document(hero.name).set(_hero_data(hero, game_map))
+
+
+async def async_select_hero(uid: str, hero_name: str) -> tuple[str | None, str | None]:
+    """Асинхронна вибірка героя та мапи з Firebase Firestore"""
+
+    doc = await _async_saves(uid).document(hero_name).get()
+
+    if doc.exists:
+        data = doc.to_dict()
+        return data["hero"], data["map"]
+
+    return None, None
+
+
+async def async_load_hero(
+    output: OutputSpace, uid: str, hero_name: str
+) -> tuple[Hero | None, list | None]:
+    """Асинхронне завантаження героя та мапи з Firebase Firestore"""
+
+    json_hero, json_map = await async_select_hero(uid, hero_name)
+    return _parse_hero(output, json_hero, json_map)
+
+
+async def async_load_heroes(
+    output: OutputSpace, uid: str, hero_names: Iterable[str]
+) -> list[tuple[Hero | None, list | None]]:
+    """Одночасне завантаження кількох героїв"""
+
+    return list(
+        await asyncio.gather(
+            *(async_load_hero(output, uid, hero_name) for hero_name in hero_names)
+        )
+    )
+
+
+async def async_iter_heroes(
+    uid: str, limit: int = FIREBASE_LIMIT
+) -> AsyncIterator[tuple[str, str | None, str | None]]:
+    """Асинхронний генератор героїв та мап користувача"""
+
+    query = _async_saves(uid).order_by("__name__").limit(limit)
+    last_doc = None
+    while True:
+        page = query.start_after(last_doc) if last_doc is not None else query
+        docs = await page.get()
+        for doc in docs:
+            data = doc.to_dict()
+            yield doc.id, data.get("hero"), data.get("map")
+        if len(docs) < limit:
+            return
+        last_doc = docs[-1]
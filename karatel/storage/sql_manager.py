@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""Спільна основа SQL-сховищ (SQLite, PostgreSQL).
+Таблиці users та saves з ключем (user_id, hero_name), upsert одним запитом.
+Нащадки задають з'єднання, плейсхолдер і перетворення JSON"""
+
+from __future__ import annotations
+
+import json
+import secrets
+from abc import abstractmethod
+from contextlib import AbstractContextManager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import dict_to_map, map_to_save
+from karatel.storage.abstract import SaveRecord, StorageManager
+from karatel.storage.summary import HeroSummary
+from karatel.utils.crypt import hash_pass, is_username_valid, validate_password
+
+if TYPE_CHECKING:
+    from karatel.core.hero import Hero
+    from karatel.ui.abstract import OutputSpace
+
+
+@dataclass(frozen=True)
+class SQLQueries:
+    """Запити до таблиць. {p} -- плейсхолдер параметра конкретної бази"""
+
+    upsert_save: str = """
+INSERT INTO saves (user_id, hero_name, summary, hero, map)
+VALUES ({p}, {p}, {p}, {p}, {p})
+ON CONFLICT (user_id, hero_name) DO UPDATE
+SET summary = excluded.summary,
+    hero = excluded.hero,
+    map = excluded.map,
+    updated_at = CURRENT_TIMESTAMP
+"""
+    select_save: str = (
+        "SELECT hero, map FROM saves WHERE user_id = {p} AND hero_name = {p}"
+    )
+    select_saves: str = (
+        "SELECT hero_name, hero, map FROM saves WHERE user_id = {p} ORDER BY hero_name"
+    )
+    select_summaries: str = (
+        "SELECT summary, updated_at FROM saves WHERE user_id = {p} ORDER BY hero_name"
+    )
+    delete_save: str = "DELETE FROM saves WHERE user_id = {p} AND hero_name = {p}"
+
+    insert_user: str = """
+INSERT INTO users (username, password) VALUES ({p}, {p})
+ON CONFLICT (username) DO NOTHING
+RETURNING id
+"""
+    select_user: str = "SELECT id, password FROM users WHERE username = {p}"
+    update_password: str = (
+        "UPDATE users SET password = {p} WHERE id = {p} RETURNING username"
+    )
+    delete_user: str = "DELETE FROM users WHERE id = {p}"
+    select_users: str = "SELECT username FROM users ORDER BY id"
+    select_user_id: str = "SELECT id FROM users WHERE username = {p}"
+    select_user_saves: str = """
+SELECT s.hero_name, s.hero, s.map
+FROM saves AS s JOIN users AS u ON u.id = s.user_id
+WHERE u.username = {p}
+ORDER BY s.hero_name
+"""
+
+    def with_placeholder(self, placeholder: str) -> SQLQueries:
+        """Запити з плейсхолдером конкретної бази"""
+        return SQLQueries(
+            **{
+                name: query.format(p=placeholder)
+                for name, query in asdict(self).items()
+            }
+        )
+
+
+class SQLSaver(StorageManager):
+    """Спільна логіка SQL-сховищ.
+    username у методах героїв -- ID користувача, який повертає validate_user,
+    у iter_users, iter_saves та import_saves -- ім'я користувача"""
+
+    # Задаються нащадками
+    queries: SQLQueries
+    error: type[Exception] = Exception
+
+    # З'єднання та виконання запитів
+
+    @abstractmethod
+    def _transaction(self) -> AbstractContextManager[Any]:
+        """З'єднання з фіксацією транзакції на виході"""
+        pass
+
+    def _execute(self, conn: Any, query: str, params: tuple = ()) -> Any:
+        """Виконання одного запиту. Повертає курсор"""
+        return conn.execute(query, params)
+
+    def _executemany(self, conn: Any, query: str, params: Iterable[tuple]) -> None:
+        """Виконання запиту для кількох наборів параметрів"""
+        conn.executemany(query, params)
+
+    def _stream(self, conn: Any, name: str, query: str, params: tuple = ()) -> Any:
+        """Рядки великої вибірки. name -- назва курсора, якщо база їх підтримує"""
+        return conn.execute(query, params)
+
+    # Перетворення значень
+
+    @staticmethod
+    @abstractmethod
+    def _dump(value: dict | list) -> Any:
+        """JSON-значення для запису в базу"""
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def _load(value: Any) -> dict | list:
+        """JSON-значення, прочитане з бази"""
+        pass
+
+    @staticmethod
+    def _timestamp(value: Any) -> datetime:
+        """Час, прочитаний з бази"""
+        return value
+
+    def _load_optional(self, value: Any) -> dict | list | None:
+        return self._load(value) if value is not None else None
+
+    def _save_params(self, hero: Hero, game_map: list | None, user_id: int) -> tuple:
+        """Параметри upsert для одного героя"""
+        return (
+            user_id,
+            hero.name,
+            self._dump(HeroSummary.from_hero(hero, game_map).to_dict()),
+            self._dump(HeroFactory.hero_to_dict(hero)),
+            self._dump(map_to_save(game_map)) if game_map is not None else None,
+        )
+
+    def _record_params(self, record: SaveRecord, user_id: int) -> tuple:
+        """Параметри upsert для збереження-словника"""
+
+        hero_name, hero_dict, map_dict = record
+        return (
+            user_id,
+            hero_name,
+            self._dump(HeroSummary.from_save(hero_dict, map_dict).to_dict()),
+            self._dump(hero_dict),
+            self._dump(map_dict) if map_dict is not None else None,
+        )
+
+    # Герої
+
+    def list_hero(self, output: OutputSpace, username: str) -> list:
+        with self._transaction() as conn:
+            rows = self._execute(conn, self.queries.select_saves, (int(username),))
+            return [
+                (
+                    hero_name,
+                    json.dumps(self._load(hero), ensure_ascii=False),
+                    (
+                        json.dumps(self._load(game_map), ensure_ascii=False)
+                        if game_map is not None
+                        else None
+                    ),
+                )
+                for hero_name, hero, game_map in rows
+            ]
+
+    def list_summaries(self, output: OutputSpace, username: str) -> list[HeroSummary]:
+        with self._transaction() as conn:
+            rows = self._execute(conn, self.queries.select_summaries, (int(username),))
+            return [
+                HeroSummary.from_dict(
+                    {**self._load(summary), "updated_at": self._timestamp(updated)}
+                )
+                for summary, updated in rows
+            ]
+
+    def save_hero(
+        self, hero: Hero, game_map: list | None, username: str, log: bool
+    ) -> None:
+        with self._transaction() as conn:
+            self._execute(
+                conn,
+                self.queries.upsert_save,
+                self._save_params(hero, game_map, int(username)),
+            )
+        hero.output.write(f"Героя '{hero.name}' збережено", log=log)
+
+    def save_heroes(
+        self, heroes: Iterable[tuple[Hero, list | None]], username: str
+    ) -> None:
+        """Збереження кількох героїв однією транзакцією (executemany)"""
+
+        user_id = int(username)
+        with self._transaction() as conn:
+            self._executemany(
+                conn,
+                self.queries.upsert_save,
+                (
+                    self._save_params(hero, game_map, user_id)
+                    for hero, game_map in heroes
+                ),
+            )
+
+    def load_hero(
+        self, output: OutputSpace, username: str, hero_name: str, log: bool
+    ) -> tuple[Hero | None, list | None]:
+        with self._transaction() as conn:
+            row = self._execute(
+                conn, self.queries.select_save, (int(username), hero_name)
+            ).fetchone()
+
+        if row is None:
+            output.write(f"Героя '{hero_name}' не знайдено", log=log)
+            return None, None
+
+        hero_value, map_value = row
+        hero = HeroFactory.dict_to_hero(output, self._load(hero_value))
+        game_map = (
+            dict_to_map(output=output, the_list=self._load(map_value))
+            if map_value is not None
+            else None
+        )
+        return hero, game_map
+
+    def delete_hero(self, output: OutputSpace, username: str, hero_name: str) -> bool:
+        with self._transaction() as conn:
+            cursor = self._execute(
+                conn, self.queries.delete_save, (int(username), hero_name)
+            )
+            return cursor.rowcount > 0
+
+    # Міграція
+
+    def iter_users(self) -> Iterator[str]:
+        with self._transaction() as conn:
+            for (username,) in self._stream(
+                conn, "karatel_users", self.queries.select_users
+            ):
+                yield username
+
+    def iter_saves(self, username: str) -> Iterator[SaveRecord]:
+        with self._transaction() as conn:
+            rows = self._stream(
+                conn, "karatel_saves", self.queries.select_user_saves, (username,)
+            )
+            for hero_name, hero_value, map_value in rows:
+                yield hero_name, self._load(hero_value), self._load_optional(map_value)
+
+    def import_saves(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        """Імпорт збережень однією транзакцією (executemany).
+        Новий користувач отримує випадковий пароль"""
+
+        with self._transaction() as conn:
+            self._execute(
+                conn,
+                self.queries.insert_user,
+                (username, hash_pass(secrets.token_urlsafe())),
+            ).fetchall()
+            (user_id,) = self._execute(
+                conn, self.queries.select_user_id, (username,)
+            ).fetchone()
+            return self._upsert_records(conn, user_id, saves)
+
+    def save_records(self, username: str, saves: Iterable[SaveRecord]) -> int:
+        with self._transaction() as conn:
+            return self._upsert_records(conn, int(username), saves)
+
+    def _upsert_records(
+        self, conn: Any, user_id: int, saves: Iterable[SaveRecord]
+    ) -> int:
+        """Upsert збережень-словників (executemany). Повертає їх кількість"""
+
+        counter = 0
+
+        def _params() -> Iterator[tuple]:
+            nonlocal counter
+            for record in saves:
+                counter += 1
+                yield self._record_params(record, user_id)
+
+        self._executemany(conn, self.queries.upsert_save, _params())
+        return counter
+
+    # Користувачі
+
+    def register_user(
+        self, output: OutputSpace, username: str, password: str, log: bool
+    ) -> tuple[bool, str | None, str | None, str | None, str | None]:
+        try:
+            with self._transaction() as conn:
+                row = self._execute(
+                    conn, self.queries.insert_user, (username, hash_pass(password))
+                ).fetchone()
+        except self.error as e:
+            output.write(f"Помилка реєстрації: {e}", log=log)
+            return False, None, None, None, None
+
+        if row is None:
+            output.write(f"Користувач '{username}' вже існує", log=log)
+            return False, None, None, None, None
+
+        user_id = str(row[0])
+        return True, user_id, username, user_id, None
+
+    def validate_user(
+        self, output: OutputSpace, username: str, password: str, log: bool
+    ) -> tuple[bool, str | None, str | None, str | None, str | None]:
+        try:
+            with self._transaction() as conn:
+                row = self._execute(
+                    conn, self.queries.select_user, (username,)
+                ).fetchone()
+        except self.error as e:
+            output.write(f"Помилка авторизації: {e}", log=log)
+            return False, None, None, None, None
+
+        if row is None or not validate_password(password, bytes(row[1])):
+            return False, None, None, None, None
+
+        user_id = str(row[0])
+        return True, user_id, username, user_id, None
+
+    def delete_user(
+        self, output: OutputSpace, username: str, id_token: str, log: bool
+    ) -> bool:
+        try:
+            # Збереження видаляються разом з користувачем (ON DELETE CASCADE)
+            with self._transaction() as conn:
+                cursor = self._execute(conn, self.queries.delete_user, (int(username),))
+                return cursor.rowcount > 0
+        except self.error as e:
+            output.write(f"Помилка видалення користувача: {e}", log=log)
+            return False
+
+    def update_password(
+        self, output: OutputSpace, id_token: str, password: str, log: bool
+    ) -> tuple[bool, str | None, str | None, str | None, str | None]:
+        try:
+            with self._transaction() as conn:
+                row = self._execute(
+                    conn,
+                    self.queries.update_password,
+                    (hash_pass(password), int(id_token)),
+                ).fetchone()
+        except self.error as e:
+            output.write(f"Помилка зміни пароля: {e}", log=log)
+            return False, None, None, None, None
+
+        if row is None:
+            return False, None, None, None, None
+
+        output.write("Пароль успішно змінено", log=log)
+        return True, id_token, row[0], id_token, None
+
+    @staticmethod
+    def check_username(output: OutputSpace, username: str, log: bool) -> bool:
+        uname = is_username_valid(username)
+        if not uname:
+            output.write(
+                "Ім'я користувача має містити мінімум 2 символи, "
+                + "може мати лише літери латинського алфавіту, "
+                + "цифри та знак підкреслення.",
+                log=log,
+            )
+        return uname
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Короткий опис збереження для списку героїв.
+Зберігається окремо від мапи, тому список не тягне важкі дані"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from karatel.core.hero import level_for_experience
+from karatel.utils.settings import EXPERIENCE_FOR_LEVEL, MAX_LEVEL
+from karatel.utils.utils import clamp_value, sanitize_word
+
+if TYPE_CHECKING:
+    from karatel.core.hero import Hero
+
+
+@dataclass(frozen=True)
+class HeroSummary:
+    """Короткий опис збереженого героя"""
+
+    name: str
+    sex: str
+    level: int
+    profession: str
+    lives: int
+    money: int
+    has_map: bool
+    updated_at: datetime | None = None
+
+    @classmethod
+    def from_hero(cls, hero: Hero, game_map: list | None) -> HeroSummary:
+        """Опис героя, що зберігається"""
+        return cls(
+            name=hero.name,
+            sex=hero.sex,
+            level=hero.level,
+            profession=hero.profession.name,
+            lives=hero.lives,
+            money=hero.money,
+            has_map=game_map is not None,
+        )
+
+    @classmethod
+    def from_dict(cls, the_dict: dict) -> HeroSummary:
+        """Опис зі словника збереження"""
+        return cls(
+            name=the_dict["name"],
+            sex=the_dict["sex"],
+            level=int(the_dict["level"]),
+            profession=the_dict["profession"],
+            lives=int(the_dict["lives"]),
+            money=int(the_dict["money"]),
+            has_map=bool(the_dict["has_map"]),
+            updated_at=the_dict.get("updated_at"),
+        )
+
+    @classmethod
+    def from_save(cls, hero_dict: dict, map_dict: dict | list | None) -> HeroSummary:
+        """Опис зі словників героя та мапи, без відновлення героя.
+        Значення обмежуються так само, як у HeroFactory.dict_to_hero"""
+
+        experience = clamp_value(
+            int(hero_dict["experience"] or "0"), 0, EXPERIENCE_FOR_LEVEL[-1]
+        )
+        return cls(
+            name=sanitize_word(hero_dict["name"]),
+            sex=hero_dict["sex"],
+            level=level_for_experience(experience),
+            profession=hero_dict["profession"],
+            lives=clamp_value(int(hero_dict["lives"] or "1"), 0, MAX_LEVEL),
+            money=clamp_value(int(hero_dict["money"] or "0"), 0, None),
+            has_map=map_dict is not None,
+        )
+
+    @classmethod
+    def from_json(cls, json_hero: str, json_map: str | None) -> HeroSummary:
+        """Опис зі старого збереження, де є лише JSON героя та мапи"""
+        return cls.from_save(
+            json.loads(json_hero),
+            json.loads(json_map) if json_map is not None else None,
+        )
+
+    def to_dict(self) -> dict:
+        """Словник для збереження"""
+        return asdict(self)
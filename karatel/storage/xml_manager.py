@@ -5,11 +5,13 @@ import xml.etree.ElementTree as ET
 from typing import TYPE_CHECKING
 
 from karatel.core.hero import Hero
-from karatel.core.items import ITEMS, SHIELDS, WEAPONS
-from karatel.core.professions import PROFESSIONS
-from karatel.core.skills import SKILLS
+from karatel.core.registry import (
+    ITEM_REGISTRY,
+    PROFESSION_REGISTRY,
+    SKILL_REGISTRY,
+    Registry,
+)
 from karatel.utils.settings import DEBUG, LOG
-from karatel.utils.utils import obj_finder
 
 if TYPE_CHECKING:
     from karatel.ui.abstract import OutputSpace
@@ -52,7 +54,7 @@ def xml_hero_saver(hero: Hero, path: str, log: bool = LOG) -> None:
 def xml_hero_loader(output: OutputSpace, path: str, log: bool = LOG) -> Hero | None:
     """Завантаження героя"""
 
-    def _create_list(parent_tag: str, child_tag: str, base: tuple) -> list:
+    def _create_list(parent_tag: str, child_tag: str, registry: Registry) -> list:
         """Допоміжна функція для забезпечення DRY"""
 
         the_list: list = []
@@ -60,7 +62,7 @@ def xml_hero_loader(output: OutputSpace, path: str, log: bool = LOG) -> Hero | N
         if parent_root is not None:
             tags = parent_root.findall(child_tag)
             for tag in tags:
-                the_list.append(obj_finder(tag.text, base))
+                the_list.append(registry.by_name(tag.text))
 
         return the_list
 
@@ -85,15 +87,15 @@ def xml_hero_loader(output: OutputSpace, path: str, log: bool = LOG) -> Hero | N
     hero = Hero(
         output=output,
         name=_find_text("name"),
-        profession=obj_finder(_find_text("profession"), PROFESSIONS),
+        profession=PROFESSION_REGISTRY.by_name(_find_text("profession")),
         experience=int(_find_text("experience") or "0"),
     )
     hero.lives = int(_find_text("lives") or "1")
     hero.money = int(_find_text("money") or "0")
-    hero.right_hand = obj_finder(_find_text("right_hand"), WEAPONS)
-    hero.left_hand = obj_finder(_find_text("left_hand"), SHIELDS)
-    hero.inventory = _create_list('inventory', 'item', ITEMS)
-    hero.skills = _create_list('skills', 'skill', SKILLS)
+    hero.right_hand = ITEM_REGISTRY.by_name(_find_text("right_hand"))
+    hero.left_hand = ITEM_REGISTRY.by_name(_find_text("left_hand"))
+    hero.inventory = _create_list('inventory', 'item', ITEM_REGISTRY)
+    hero.skills = _create_list('skills', 'skill', SKILL_REGISTRY)
 
     hero.output.write(f"Героя {hero.name} завантажено", log=log)
     return hero
@@ -3,10 +3,16 @@
 # python -m pytest karatel/tests/test_api.py --cov=karatel.api --cov-report=html
 
 
+import asyncio
+import os
+import time
+
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
 from karatel.api.fastapi import app  # Імпортуйте ваш FastAPI додаток
+from karatel.api.workers import WorkerPool
 
 
 @pytest.fixture
@@ -69,3 +75,83 @@ def test_root(client):
     data = response.json()
     assert "available_routes" in data
     assert isinstance(data["available_routes"], list)
+
+
+def test_best_move(client):
+    """Таблиця ходів знаходить виграшний хід"""
+    board = ["X", "X", "none", "O", "O", "none", "none", "none", "none"]
+    response = client.post("/ttt/move", json={"board": board, "max_player_symbol": "X"})
+    assert response.status_code == 200
+    assert response.json() == 2
+
+
+def test_pool_saturated():
+    """Переповнений пул одразу відповідає 503"""
+
+    async def _run(pool: WorkerPool) -> None:
+        busy = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as error:
+            await pool.run(time.sleep, 0)
+        assert error.value.status_code == 503
+        await busy
+        await pool.run(time.sleep, 0)
+
+    pool = WorkerPool(workers=1, queue=0)
+    try:
+        asyncio.run(_run(pool))
+    finally:
+        pool.shutdown()
+
+
+def test_pool_slot_held_until_job_finishes():
+    """Скасований запит тримає місце, доки задача виконується в процесі"""
+
+    async def _run(pool: WorkerPool) -> None:
+        busy = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0.1)
+        busy.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await busy
+        with pytest.raises(HTTPException):
+            await pool.run(time.sleep, 0)
+        await asyncio.sleep(1)
+        await pool.run(time.sleep, 0)
+
+    pool = WorkerPool(workers=1, queue=0)
+    try:
+        asyncio.run(_run(pool))
+    finally:
+        pool.shutdown()
+    assert WorkerPool(workers=None, queue=2).limit == (os.cpu_count() or 1) + 2
+
+
+def test_combat_odds(client):
+    """Точні шанси бою: однакові герої -- рівні шанси, погана шкода -- 400"""
+    hero = {
+        "ac": 15,
+        "attack_modifier": 3,
+        "damage": "1d8+1",
+        "max_hp": 20,
+        "initiative": 2,
+    }
+    response = client.post("/combat/odds", json={"a": hero, "b": hero})
+    assert response.status_code == 200
+    assert response.json()["win_a"] == pytest.approx(0.5)
+
+    response = client.post(
+        "/combat/odds", json={"a": hero | {"damage": "1d4-9"}, "b": hero}
+    )
+    assert response.status_code == 400
+
+    # Завеликі кубики відхиляються одразу, а не займають процес пулу
+    for damage in ("1d999999999", "999999999d1"):
+        start = time.perf_counter()
+        response = client.post(
+            "/combat/odds", json={"a": hero | {"damage": damage}, "b": hero}
+        )
+        assert response.status_code == 400
+        assert time.perf_counter() - start < 1
+
+    response = client.post("/combat/odds", json={"a": hero | {"ac": 10**9}, "b": hero})
+    assert response.status_code == 422
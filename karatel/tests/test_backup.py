@@ -0,0 +1,118 @@
+import gzip
+
+import pytest
+
+from karatel.backup import (
+    BackupError,
+    archive_user_key,
+    main,
+    map_users,
+    read_archive,
+    read_saves,
+    write_saves,
+)
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map
+from karatel.storage.sqlite_manager import SQLiteSaver
+from karatel.ui.abstract import NoneOutput
+
+output = NoneOutput()
+PASSWORD = "Secret_pass1!"
+
+
+def fill(saver: SQLiteSaver) -> None:
+    """Три користувачі з кількома героями кожен"""
+
+    for number in range(3):
+        _, user_id, *_ = saver.register_user(output, f"player{number}", PASSWORD, False)
+        heroes = []
+        for level in range(1, 5):
+            hero = HeroFactory.generate(output, level=level)
+            hero.name = f"Герой{level}"
+            the_map = generate_map(hero, seed=level) if level % 2 else None
+            heroes.append((hero, the_map))
+        saver.save_heroes(heroes, user_id)
+
+
+def dump(saver: SQLiteSaver) -> dict:
+    return {
+        username: sorted(saver.iter_saves(username)) for username in saver.iter_users()
+    }
+
+
+def test_export_import(tmp_path):
+    """Сховище -> архів -> інше сховище без втрат"""
+
+    source_path = tmp_path / "source.db"
+    target_path = tmp_path / "target.db"
+    archive = tmp_path / "saves.ndjson.gz"
+    source = SQLiteSaver(str(source_path))
+    fill(source)
+
+    main(["export", f"sqlite:{source_path}", str(archive), "--workers", "2"])
+    assert len(list(read_archive(str(archive)))) == 12
+    assert archive_user_key(str(archive)) == "username"
+
+    main(["import", str(archive), f"sqlite:{target_path}", "--batch", "5"])
+    target = SQLiteSaver(str(target_path))
+    assert dump(target) == dump(source)
+    # Перенесені користувачі отримують новий випадковий пароль
+    assert not target.validate_user(output, "player1", PASSWORD, False)[0]
+
+
+def test_copy_and_early_stop(tmp_path):
+    """Пряме копіювання та зупинка читання на півдорозі"""
+
+    source_path = tmp_path / "source.db"
+    target_path = tmp_path / "target.db"
+    source = SQLiteSaver(str(source_path))
+    fill(source)
+
+    main(["copy", f"sqlite:{source_path}", f"sqlite:{target_path}"])
+    assert dump(SQLiteSaver(str(target_path))) == dump(source)
+
+    saves = read_saves(source, workers=3, queue_size=1)
+    next(saves)
+    saves.close()
+
+
+def test_user_keys(tmp_path):
+    """Ключі різних видів переносяться лише за явною відповідністю"""
+
+    class UidSaver(SQLiteSaver):
+        user_key = "uid"
+
+    source = SQLiteSaver(str(tmp_path / "source.db"))
+    fill(source)
+    target = UidSaver(str(tmp_path / "target.db"))
+
+    with pytest.raises(BackupError):
+        map_users(read_saves(source), source.user_key, target.user_key)
+
+    users = {f"player{number}": f"uid{number}" for number in range(2)}
+    with pytest.raises(BackupError):
+        write_saves(target, map_users(read_saves(source), "username", "uid", users))
+
+    users["player2"] = "uid2"
+    saves = map_users(read_saves(source), source.user_key, target.user_key, users)
+    assert write_saves(target, saves) == 12
+    assert sorted(target.iter_users()) == ["uid0", "uid1", "uid2"]
+    assert sorted(target.iter_saves("uid1")) == sorted(source.iter_saves("player1"))
+
+
+def test_bad_archive(tmp_path):
+    """Чужий файл не імпортується"""
+
+    archive = tmp_path / "bad.ndjson.gz"
+    with gzip.open(archive, "wt", encoding="utf-8") as file:
+        file.write('{"format": "other", "version": 1}\n')
+    with pytest.raises(BackupError):
+        list(read_archive(str(archive)))
+
+    with gzip.open(archive, "wt", encoding="utf-8") as file:
+        file.write(
+            '{"format": "karatel-saves", "version": 2, "users": "username"}\n'
+            '{"user": 1}\n'
+        )
+    with pytest.raises(BackupError):
+        list(read_archive(str(archive)))
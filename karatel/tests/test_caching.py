@@ -0,0 +1,225 @@
+import time
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map, map_to_save
+from karatel.storage.abstract import StorageManager
+from karatel.storage.caching import CachingSaver
+from karatel.ui.abstract import BufferedOutput, NoneOutput
+
+output = NoneOutput()
+USERNAME = "user"
+
+
+class MemorySaver(StorageManager):
+    """Сховище в пам'яті, що рахує звернення"""
+
+    def __init__(self, failures: int = 0):
+        self.saves: dict = {}
+        self.writes = 0
+        self.reads = 0
+        self.failures = failures
+
+    def list_hero(self, output, username):
+        return [name for user, name in self.saves if user == username]
+
+    def list_summaries(self, output, username):
+        return self.list_hero(output, username)
+
+    def save_hero(self, hero, game_map, username, log):
+        map_save = map_to_save(game_map) if game_map is not None else None
+        self.save_records(
+            username, [(hero.name, HeroFactory.hero_to_dict(hero), map_save)]
+        )
+
+    def save_records(self, username, saves):
+        counter = 0
+        for hero_name, hero_dict, map_dict in saves:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("Немає зв'язку")
+            self.writes += 1
+            self.saves[username, hero_name] = (hero_dict, map_dict)
+            counter += 1
+        return counter
+
+    def iter_users(self):
+        yield from {user for user, _ in self.saves}
+
+    def load_hero(self, output, username, hero_name, log):
+        self.reads += 1
+        hero_dict, _ = self.saves[username, hero_name]
+        return HeroFactory.dict_to_hero(output, hero_dict), None
+
+    def delete_hero(self, output, username, hero_name):
+        return self.saves.pop((username, hero_name), None) is not None
+
+    def register_user(self, output, username, password, log):
+        return True, username, username, None, None
+
+    def validate_user(self, output, username, password, log):
+        return True, username, username, None, None
+
+    def delete_user(self, output, username, id_token, log):
+        return True
+
+    def update_password(self, output, user_id, password, log):
+        return True
+
+    @staticmethod
+    def check_username(output, username, log):
+        return True
+
+
+def test_unchanged_hero_is_not_written():
+    """Повторне збереження без змін не доходить до сховища"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=0)
+    hero = HeroFactory.generate(output, level=3)
+    the_map = generate_map(hero, seed=1)
+
+    for _ in range(5):
+        saver.save_hero(hero, the_map, USERNAME, log=False)
+    saver.flush()
+    saver.save_hero(hero, the_map, USERNAME, log=False)
+    saver.flush()
+    assert inner.writes == 1
+
+    hero.money += 10
+    saver.save_hero(hero, the_map, USERNAME, log=False)
+    saver.close()
+    assert inner.writes == 2
+    assert inner.saves[USERNAME, hero.name][0]["money"] == hero.money
+
+
+def test_rapid_saves_are_coalesced():
+    """З кількох змін поспіль записується лише остання"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=60)
+    hero = HeroFactory.generate(output, level=3)
+
+    for money in range(10):
+        hero.money = money
+        saver.save_hero(hero, None, USERNAME, log=False)
+    saver.flush()
+    assert inner.writes == 1
+    assert inner.saves[USERNAME, hero.name][0]["money"] == 9
+    saver.close()
+
+
+def test_bounded_retries():
+    """Помилки запису повторюються обмежену кількість разів"""
+
+    inner = MemorySaver(failures=2)
+    saver = CachingSaver(inner, delay=60, retries=2)
+    hero = HeroFactory.generate(output, level=3)
+    saver.save_hero(hero, None, USERNAME, log=False)
+    saver.flush()
+    assert inner.writes == 1
+
+    inner.failures = 10
+    hero.money += 1
+    hero.output = BufferedOutput()
+    saver.save_hero(hero, None, USERNAME, log=False)
+    saver.flush()
+    assert inner.writes == 1
+    assert "Не вдалося зберегти" in hero.output.read_buffer()
+
+    # Знімок повернувся в чергу і записується, щойно сховище оживає
+    inner.failures = 0
+    saver.flush()
+    assert inner.writes == 2
+    assert inner.saves[USERNAME, hero.name][0]["money"] == hero.money
+    saver.close()
+
+
+def test_failed_write_does_not_replace_newer_save():
+    """Невдалий запис не витісняє з черги новіший знімок"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=60, retries=0)
+    hero = HeroFactory.generate(output, level=3)
+    hero.money = 1
+    saver.save_hero(hero, None, USERNAME, log=False)
+
+    def fail_and_save(username, saves):
+        hero.money = 2
+        saver.save_hero(hero, None, USERNAME, log=False)
+        raise ConnectionError("Немає зв'язку")
+
+    inner.save_records = fail_and_save
+    saver.flush()
+    del inner.save_records
+    saver.close()
+    assert inner.saves[USERNAME, hero.name][0]["money"] == 2
+
+
+def test_save_after_close_is_written():
+    """Після close() збереження записується одразу"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=60)
+    saver.close()
+    hero = HeroFactory.generate(output, level=3)
+    saver.save_hero(hero, None, USERNAME, log=False)
+    assert inner.writes == 1
+
+
+def test_load_is_cached_until_invalidated():
+    """Завантаження читає сховище лише раз до інвалідації або TTL"""
+
+    inner = MemorySaver()
+    hero = HeroFactory.generate(output, level=5)
+    inner.save_hero(hero, None, USERNAME, log=False)
+
+    saver = CachingSaver(inner, delay=60)
+    for _ in range(3):
+        loaded, _ = saver.load_hero(output, USERNAME, hero.name, log=False)
+        assert loaded.experience == hero.experience
+        assert loaded is not hero
+    assert inner.reads == 1
+
+    saver.invalidate(USERNAME, hero.name)
+    saver.load_hero(output, USERNAME, hero.name, log=False)
+    assert inner.reads == 2
+
+    expired = CachingSaver(inner, ttl=0, delay=60)
+    expired.load_hero(output, USERNAME, hero.name, log=False)
+    expired.load_hero(output, USERNAME, hero.name, log=False)
+    assert inner.reads == 4
+    saver.close()
+    expired.close()
+
+
+def test_load_sees_pending_save_and_delete_drops_it():
+    """Незаписане збереження видно при завантаженні, а видалення його скасовує"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=60)
+    hero = HeroFactory.generate(output, level=4)
+    hero.money = 77
+    saver.save_hero(hero, None, USERNAME, log=False)
+
+    loaded, _ = saver.load_hero(output, USERNAME, hero.name, log=False)
+    assert loaded.money == 77
+    assert inner.reads == 0
+
+    saver.delete_hero(output, USERNAME, hero.name)
+    saver.close()
+    assert inner.writes == 0
+
+
+def test_background_flush():
+    """Фоновий потік записує збереження без явного flush"""
+
+    inner = MemorySaver()
+    saver = CachingSaver(inner, delay=0.01)
+    hero = HeroFactory.generate(output, level=2)
+    saver.save_hero(hero, None, USERNAME, log=False)
+
+    deadline = time.monotonic() + 5
+    while inner.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert inner.writes == 1
+    saver.close()
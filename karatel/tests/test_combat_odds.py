@@ -0,0 +1,104 @@
+import time
+
+import numpy as np
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.logic.combat_odds import (
+    attack_distribution,
+    combat_odds,
+    damage_distribution,
+    initiative_odds,
+)
+from karatel.logic.simulation import CombatStats, simulate_fights
+from karatel.ui.abstract import NoneOutput
+
+output = NoneOutput()
+
+num_simulations = 200_000
+tolerance = 0.01
+
+
+def test_distributions():
+    """Розподіли шкоди та атаки -- повні й точні"""
+
+    damage = dict(damage_distribution("2d6+4"))
+    assert min(damage) == 6 and max(damage) == 16
+    assert sum(damage.values()) == pytest.approx(1)
+    assert sum(v * p for v, p in damage.items()) == pytest.approx(11)
+
+    # Влучання лише критом: 1/20 на подвійну шкоду
+    attack = dict(attack_distribution(0, "1d1", 100))
+    assert attack == pytest.approx({0: 19 / 20, 2: 1 / 20})
+
+    assert initiative_odds(0, 0) == pytest.approx(0.5)
+    assert initiative_odds(30, 0) == 1
+
+    with pytest.raises(ValueError):
+        attack_distribution(0, "1d4-5", 10)
+
+
+@pytest.mark.parametrize("damage", ["1d999999999", "999999999d1", "2d400+1d300"])
+def test_wide_damage_rejected_early(damage):
+    """Надто широка шкода відхиляється до побудови розподілу"""
+
+    start = time.perf_counter()
+    with pytest.raises(ValueError):
+        damage_distribution(damage)
+    assert time.perf_counter() - start < 0.1
+
+
+def test_long_combat_rejected():
+    """Розрахунок, довший за бюджет кроків, відхиляється одразу"""
+
+    stats = CombatStats(
+        ac=0, attack_modifier=0, damage="10d100", max_hp=500, initiative=0
+    )
+    with pytest.raises(ValueError):
+        combat_odds(stats, stats)
+
+
+def test_closed_form():
+    """Герої з одним очком здоров'я: перемагає той, хто першим влучить"""
+
+    stats = CombatStats(ac=11, attack_modifier=0, damage="1d4", max_hp=1, initiative=0)
+    odds = combat_odds(stats, stats)
+    hit = 10 / 20  # 11..19 та 20
+    miss = 1 - hit
+    first = hit / (1 - miss * miss)
+    assert odds.win_a == pytest.approx(0.5)
+    assert odds.first_a == pytest.approx(0.5)
+    assert combat_odds(stats, stats, hp_a=1, hp_b=1).mean_turns == pytest.approx(
+        1 / hit
+    )
+    faster = CombatStats(
+        ac=11, attack_modifier=0, damage="1d4", max_hp=1, initiative=40
+    )
+    assert combat_odds(faster, stats).win_a == pytest.approx(first)
+
+
+@pytest.mark.parametrize(
+    "level, prof1, prof2",
+    [
+        (1, "commando", "hacker"),
+        (10, "hacker", "stuntman"),
+        (20, "influencer", "commando"),
+    ],
+)
+def test_matches_simulation(level, prof1, prof2):
+    """Точний розрахунок збігається з пакетною симуляцією"""
+
+    stats_a = CombatStats.from_hero(
+        HeroFactory.generate(output, level=level, profession=prof1)
+    )
+    stats_b = CombatStats.from_hero(
+        HeroFactory.generate(output, level=level, profession=prof2)
+    )
+    odds = combat_odds(stats_a, stats_b)
+    result = simulate_fights(
+        stats_a, stats_b, num_simulations, np.random.default_rng(level)
+    )
+
+    assert odds.win_a + odds.win_b == pytest.approx(1)
+    assert abs(odds.win_a - result.ratio_a) <= tolerance
+    assert odds.mean_turns == pytest.approx(result.mean_turns, rel=0.02)
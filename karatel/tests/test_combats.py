@@ -2,39 +2,44 @@ from itertools import combinations
 
 import pytest
 
-from karatel.core.hero import HeroFactory
 from karatel.core.professions import PROFESSIONS
-from karatel.logic.combat import fight
-from karatel.ui.abstract import NoneOutput
+from karatel.logic.balance import (
+    MAX_FIGHTS,
+    MAX_RATIO,
+    MIN_RATIO,
+    balance_matrix,
+    check_balance,
+)
 from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
 
-output = NoneOutput()
 
-num_tests = 1000
-min_ratio = 0.45
-max_ratio = 0.55
+@pytest.fixture(scope="module")
+def balance():
+    """Уся матриця одразу: пари розподіляються між процесами,
+    а кожна зупиняється, щойно рішення статистично визначене"""
+    return balance_matrix()
 
 
 @pytest.mark.parametrize("level", list(range(MIN_LEVEL, MAX_LEVEL + 1)))
 @pytest.mark.parametrize(
     "prof1, prof2", list(combinations(list(PROFESSIONS.keys()), 2))
 )
-def test_hero_combats(level, prof1, prof2):
-    wins1 = 0
-    wins2 = 0
+def test_hero_combats(balance, level, prof1, prof2):
+    result = balance[level, prof1, prof2]
+
+    assert result.fights <= MAX_FIGHTS
+    assert result.passed, (
+        f"частка перемог {result.ratio:.3f} за {result.fights} боїв "
+        f"поза межами [{MIN_RATIO}, {MAX_RATIO}]"
+    )
 
-    for _ in range(num_tests):
-        hero1 = HeroFactory.generate(output, level=level, profession=prof1)
-        hero2 = HeroFactory.generate(output, level=level, profession=prof2)
-        fight(hero1, hero2)
 
-        if hero1.alive and not hero2.alive:
-            wins1 += 1
-        elif hero2.alive and not hero1.alive:
-            wins2 += 1
+def test_sequential_stopping():
+    """Очевидні випадки вирішуються задовго до MAX_FIGHTS"""
 
-    total = wins1 + wins2
-    assert total == num_tests
+    mirror = check_balance(10, "hacker", "hacker", seed=1)
+    assert mirror.passed and mirror.early
 
-    ratio = wins1 / total
-    assert min_ratio <= ratio <= max_ratio
+    lopsided = check_balance(20, "influencer", "commando", seed=1)
+    assert not lopsided.passed and lopsided.early
+    assert lopsided.fights < MAX_FIGHTS // 4
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from karatel.utils.dice import Dice
+
+num_tests = 1000
+
+
+@pytest.mark.parametrize(
+    "dice_string, min_value, max_value",
+    [
+        ("1d20", 1, 20),
+        ("2d6+2", 4, 14),
+        ("1d15+5", 6, 20),
+        ("1d6-1", 0, 5),
+        ("2d6+1d4-1", 2, 15),
+        ("d8", 1, 8),
+        ("3", 3, 3),
+    ],
+)
+def test_roll_bounds(dice_string, min_value, max_value):
+    """Кидки не виходять за межі виразу"""
+
+    dice = Dice.compile(dice_string)
+    rolls = [dice.roll() for _ in range(num_tests)]
+    assert min(rolls) >= min_value and max(rolls) <= max_value
+
+    many = dice.roll_many(num_tests, np.random.default_rng(0))
+    assert many.shape == (num_tests,)
+    assert many.min() >= min_value and many.max() <= max_value
+
+
+def test_compile_is_cached():
+    """Повторна компіляція повертає той самий об'єкт"""
+    assert Dice.compile("1d6+4") is Dice.compile("1d6+4")
+
+
+@pytest.mark.parametrize("dice_string", ["", "abc", "1d", "2d6+", "1d0", "2d6 3d4"])
+def test_invalid_expression(dice_string):
+    """Некоректні вирази викликають ValueError"""
+    with pytest.raises(ValueError):
+        Dice.compile(dice_string)
@@ -0,0 +1,222 @@
+import pickle
+
+import pytest
+
+from karatel.core.hero import Hero, HeroFactory
+from karatel.core.items import (
+    SHIELDS,
+    STRENGTH_WEAPONS,
+    UNARMED_STRIKE,
+    select_shield,
+    select_weapon,
+)
+from karatel.core.professions import PROFESSIONS
+from karatel.core.skills import SKILLS
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.constants import Sex
+from karatel.utils.settings import (
+    BASE_SKILL_LEVELS,
+    EXPERIENCE_FOR_LEVEL,
+    MAX_LEVEL,
+    MIN_LEVEL,
+)
+from karatel.utils.utils import get_modifier
+
+output = NoneOutput()
+
+BASE_SKILLS = [
+    SKILLS[name]
+    for name in (
+        "self_heal_small",
+        "self_heal_medium",
+        "self_heal_strong",
+        "self_heal_ultimate",
+    )
+]
+
+
+def hero_state(hero: Hero) -> dict:
+    """Стан героя без менеджерів та output"""
+    return {
+        "name": hero.name,
+        "sex": hero.sex,
+        "profession": hero.profession,
+        "level": hero.level,
+        "experience": hero.experience,
+        "hp": hero.hp,
+        "max_hp": hero.max_hp,
+        "lives": hero.lives,
+        "money": hero.money,
+        "stats": dict(hero.stats),
+        "skills": list(hero.skills),
+        "inventory": list(hero.inventory),
+        "left_hand": hero.left_hand,
+        "right_hand": hero.right_hand,
+    }
+
+
+def build_hero(level: int, profession: str, right_hand=None, left_hand=None) -> Hero:
+    """Герой, створений без шаблонів -- як до появи кешу"""
+
+    hero = Hero(
+        output=output,
+        name="Андрій",
+        sex=Sex.M,
+        profession=PROFESSIONS[profession],
+        experience=EXPERIENCE_FOR_LEVEL[level - 1],
+    )
+    hero.equipment.equip_shield(left_hand or select_shield(hero.level))
+    hero.equipment.equip_weapon(
+        right_hand or select_weapon(hero.level, hero.profession.main_bonuses[0])
+    )
+    return hero
+
+
+@pytest.mark.parametrize("level", list(range(MIN_LEVEL, MAX_LEVEL + 1)))
+@pytest.mark.parametrize("profession", list(PROFESSIONS.keys()))
+def test_generate_matches_full_build(level, profession):
+    """Герой із шаблону збігається з героєм, створеним з нуля"""
+
+    expected = build_hero(level, profession)
+    hero = HeroFactory.generate(
+        output, level=level, profession=profession, name="Андрій", sex=Sex.M
+    )
+    assert hero_state(hero) == hero_state(expected)
+
+    expected = build_hero(level, profession, STRENGTH_WEAPONS[-1], SHIELDS[3])
+    hero = HeroFactory.generate(
+        output,
+        level=level,
+        profession=profession,
+        name="Андрій",
+        sex=Sex.M,
+        right_hand=STRENGTH_WEAPONS[-1],
+        left_hand=SHIELDS[3],
+    )
+    assert hero_state(hero) == hero_state(expected)
+
+
+def test_clones_are_independent():
+    """Зміни одного героя не впливають на інших героїв з того ж шаблону"""
+
+    hero_a, hero_b = HeroFactory.generate_many(
+        output, 2, level=MAX_LEVEL, profession="commando"
+    )
+    hero_a.stats["Strength"] += 5
+    hero_a.skills.clear()
+    hero_a.inventory.append(SHIELDS[1])
+    hero_a.hp -= 5
+
+    assert hero_b.stats["Strength"] == hero_a.stats["Strength"] - 5
+    assert hero_b.skills
+    assert SHIELDS[1] not in hero_b.inventory
+    assert hero_b.hp == hero_b.max_hp
+    assert hero_a.leveling.hero is hero_a
+    assert hero_b.equipment.hero is hero_b
+
+
+def test_slots_and_stats():
+    """Герой без __dict__, характеристики поводяться як словник
+    і переживають pickle"""
+
+    hero = HeroFactory.generate(output, level=MAX_LEVEL, profession="commando")
+    assert not hasattr(hero, "__dict__")
+    assert not hasattr(hero.stats, "__dict__")
+
+    hero.stats = {"Strength": 15}
+    assert dict(hero.stats) == {
+        "Strength": 15,
+        "Dexterity": 10,
+        "Constitution": 10,
+        "Intelligence": 10,
+        "Charisma": 10,
+    }
+    with pytest.raises(KeyError):
+        hero.stats["Luck"] = 1
+    with pytest.raises(TypeError):
+        del hero.stats["Strength"]
+
+    restored = pickle.loads(pickle.dumps(hero))
+    assert HeroFactory.hero_to_dict(restored) == HeroFactory.hero_to_dict(hero)
+    assert restored.stats == hero.stats
+    assert restored.equipment.hero is restored
+
+
+def derived(hero: Hero) -> tuple[int, int, int]:
+    """Клас броні, атака та ініціатива, пораховані з нуля"""
+    dexterity = get_modifier(hero.stats["Dexterity"])
+    return (
+        10 + dexterity + hero.left_hand.ac_bonus,
+        get_modifier(hero.stats[hero.right_hand.stat]),
+        dexterity,
+    )
+
+
+def test_derived_cache_invalidation():
+    """Кеш похідних характеристик оновлюється після змін
+    характеристик, предметів у руках та рівня"""
+
+    hero = HeroFactory.generate(output, level=MIN_LEVEL, profession="commando")
+
+    def check() -> None:
+        assert (hero.ac, hero.attack_modifier, hero.initiative) == derived(hero)
+
+    check()
+    hero.stats["Dexterity"] += 4
+    check()
+    hero.stats = {"Strength": 18, "Dexterity": 7}
+    check()
+    hero.equipment.equip_shield(SHIELDS[3])
+    check()
+    hero.equipment.equip_weapon(STRENGTH_WEAPONS[-1])
+    check()
+    hero.right_hand = UNARMED_STRIKE
+    check()
+    hero.leveling.add_experience(EXPERIENCE_FOR_LEVEL[-1])
+    check()
+
+    assert hero.alive
+    hero.lives = 0
+    assert not hero.alive and hero.hp == 0
+
+
+def level_step_by_step(hero: Hero, amount: int) -> None:
+    """Підвищення рівня по одному, як до появи bisect"""
+
+    hero.experience += amount
+    while (
+        hero.level < MAX_LEVEL and hero.experience >= EXPERIENCE_FOR_LEVEL[hero.level]
+    ):
+        hero.level += 1
+        for stat in hero.profession.main_bonuses:
+            hero.stats[stat] += 2
+        for stat in hero.profession.secondary_bonuses:
+            hero.stats[stat] += 1
+        hero.stats["Constitution"] += 1
+        hero.leveling.set_hp()
+        if hero.level in BASE_SKILL_LEVELS:
+            tier = BASE_SKILL_LEVELS.index(hero.level)
+            if tier > 0:
+                hero.skill_manager.forget_skill(BASE_SKILLS[tier - 1])
+            hero.skill_manager.learn_skill(BASE_SKILLS[tier])
+
+
+@pytest.mark.parametrize("profession", list(PROFESSIONS.keys()))
+def test_bulk_experience_matches_step_by_step(profession):
+    """Підвищення на кілька рівнів одразу дає той самий стан,
+    що й підвищення по одному рівню"""
+
+    extra = BASE_SKILLS[1:3]
+    for start in range(MIN_LEVEL, MAX_LEVEL + 1):
+        for target in range(start, MAX_LEVEL + 1):
+            amount = EXPERIENCE_FOR_LEVEL[target - 1] - EXPERIENCE_FOR_LEVEL[start - 1]
+            for skills in ([], extra[:1], extra):
+                heroes = []
+                for _ in range(2):
+                    hero = build_hero(start, profession)
+                    hero.skills = hero.skills[:1] + skills
+                    heroes.append(hero)
+                bulk, expected = heroes
+                bulk.leveling.add_experience(amount + 1)
+                level_step_by_step(expected, amount + 1)
+                assert hero_state(bulk) == hero_state(expected)
@@ -0,0 +1,246 @@
+import json
+import pickle
+from random import Random
+from types import SimpleNamespace
+
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.core.items import SHIELDS
+from karatel.core.map import (
+    EMPTY_CELL,
+    BaseMap,
+    Cell,
+    CellType,
+    DungeonMap,
+    EnemyLine,
+    MapLimits,
+    MapSize,
+    dict_to_map,
+    generate_lazy_map,
+    generate_map,
+    map_to_dict,
+    map_to_save,
+)
+from karatel.logic.map import move_hero
+from karatel.ui.abstract import NoneOutput
+
+output = NoneOutput()
+
+
+def test_generate_map_size():
+    """Згенерована мапа має розміри MapSize та одного героя"""
+
+    hero = HeroFactory.generate(output, level=3)
+    the_map = generate_map(hero)
+
+    assert len(the_map) == MapSize.Y
+    assert all(len(line) == MapSize.X for line in the_map)
+    heroes = [
+        cell.obj for line in the_map for cell in line if cell.type == CellType.HERO
+    ]
+    assert heroes == [hero]
+    assert the_map[MapSize.Y - 1][MapSize.X - 1].type == CellType.EXIT
+
+
+def test_dict_round_trip():
+    """Конвертація в словник і назад не змінює мапу"""
+
+    hero = HeroFactory.generate(output, level=7)
+    the_map = generate_map(hero)
+    the_dict = map_to_dict(the_map)
+
+    assert map_to_dict(dict_to_map(output, the_dict)) == the_dict
+    assert map_to_dict(pickle.loads(pickle.dumps(the_map))) == the_dict
+
+
+def test_cells_write_through():
+    """Запис у клітинку змінює саму мапу"""
+
+    the_map = DungeonMap(height=3, width=4)
+    assert all(cell.type == CellType.EMPTY for line in the_map for cell in line)
+
+    the_map[1][2] = Cell(CellType.GOLD, None, gold=15)
+    the_map[2][3].type = CellType.ITEM
+    the_map[2][3].obj = SHIELDS[1]
+
+    assert the_map[1][2].type == CellType.GOLD and the_map[1][2].gold == 15
+    assert the_map[2][3].obj is SHIELDS[1]
+
+    # Переміщення, як у move_hero
+    the_map[0][0] = the_map[2][3]
+    the_map[2][3] = EMPTY_CELL
+
+    assert the_map[0][0].obj is SHIELDS[1]
+    assert the_map[2][3].type == CellType.EMPTY and the_map[2][3].obj is None
+    assert list(the_map.objects) == [0]
+
+    with pytest.raises(IndexError):
+        the_map[3][0]
+    with pytest.raises(IndexError):
+        the_map[0][4]
+
+
+def test_positions_follow_moves():
+    """Індекс позицій оновлюється при кожному записі в мапу"""
+
+    hero = HeroFactory.generate(output, level=2)
+    the_map = DungeonMap(height=4, width=5)
+    the_map[0][0] = Cell(CellType.HERO, hero)
+    the_map[3][4] = Cell(CellType.EXIT, None, gold=10)
+    the_map[1][3] = Cell(CellType.ENEMY, HeroFactory.generate(output, level=1))
+    the_map[3][1] = Cell(CellType.ENEMY, HeroFactory.generate(output, level=1))
+    the_map[2][2].type = CellType.ITEM
+
+    assert the_map.hero_position() == (0, 0)
+    assert the_map.nearest(CellType.ENEMY, 0, 0) == (1, 3)
+    assert the_map.count(CellType.ITEM) == 1
+
+    the_map[1][3] = the_map[0][0]
+    the_map[0][0] = EMPTY_CELL
+
+    assert the_map.hero_position() == (1, 3)
+    assert the_map.coordinates(CellType.ENEMY) == [(3, 1)]
+    assert the_map.coordinates(CellType.EXIT) == [(3, 4)]
+
+    the_map[2][2] = EMPTY_CELL
+    assert the_map.count(CellType.ITEM) == 0
+    assert DungeonMap(2, 2).hero_position() == (None, None)
+
+
+def test_positions_match_scan():
+    """Індекс позицій збігається з повним скануванням мапи"""
+
+    the_map = generate_map(HeroFactory.generate(output, level=5))
+    loaded = dict_to_map(output, map_to_dict(the_map))
+
+    for a_map in (the_map, loaded):
+        for cell_type in (CellType.HERO, CellType.ENEMY, CellType.ITEM):
+            scanned = [
+                (y, x)
+                for y, line in enumerate(a_map)
+                for x, cell in enumerate(line)
+                if cell.type == cell_type
+            ]
+            assert a_map.coordinates(cell_type) == scanned
+
+
+def test_lazy_map_is_deterministic():
+    """Чанки залежать лише від зерна, а не від порядку генерації"""
+
+    map_a = generate_lazy_map(HeroFactory.generate(output, level=4), 200, 300, seed=7)
+    map_b = generate_lazy_map(HeroFactory.generate(output, level=4), 200, 300, seed=7)
+    start_chunks = len(map_a.chunks)
+
+    # Мапу B обходимо у зворотному порядку
+    cells_a = [(cell.type, cell.gold, cell.experience) for cell in map_a[150]]
+    cells_b = [
+        (cell.type, cell.gold, cell.experience)
+        for cell in (map_b[150][x] for x in reversed(range(300)))
+    ]
+
+    assert cells_a == cells_b[::-1]
+    assert map_a.start == map_b.start
+    assert start_chunks < len(map_a.chunks) < 200 * 300 // MapLimits.CHUNK**2
+
+
+def test_lazy_map_keeps_rules():
+    """На великій мапі зберігаються герой, вихід та лінія ворогів"""
+
+    hero = HeroFactory.generate(output, level=3)
+    the_map = generate_lazy_map(hero, MapLimits.MAX, MapLimits.MAX, seed=1)
+
+    assert the_map[the_map.start[0]][the_map.start[1]].obj is hero
+    assert the_map.hero_position() == the_map.start
+    assert the_map[MapLimits.MAX - 1][MapLimits.MAX - 1].type == CellType.EXIT
+    for y in range(MapLimits.MAX - EnemyLine.Y, MapLimits.MAX):
+        for x in range(MapLimits.MAX - EnemyLine.X, MapLimits.MAX - 1):
+            assert the_map[y][x].type == CellType.ENEMY
+            assert the_map[y][x].obj.level == hero.level + EnemyLine.MULTIPLIER
+
+
+@pytest.mark.parametrize("height, width", [(0, 10), (10, MapLimits.MAX + 1)])
+def test_map_size_limits(height, width):
+    """Розмір мапи обмежено"""
+
+    hero = HeroFactory.generate(output, level=1)
+    with pytest.raises(ValueError):
+        generate_map(hero, height, width)
+    with pytest.raises(ValueError):
+        generate_lazy_map(hero, height, width)
+
+
+def _play(the_map, moves: int, seed: int) -> None:
+    """Кілька випадкових ходів героя по мапі"""
+
+    gsm = SimpleNamespace(output=output, can_generate_map=False, rng=Random(seed))
+    for _ in range(moves):
+        step_y, step_x = gsm.rng.choice((-1, 0, 1)), gsm.rng.choice((-1, 0, 1))
+        if move_hero(gsm, step_y, step_x, the_map, log=False) is None:
+            break
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_delta_round_trip(seed):
+    """Мапа, відтворена з зерна та змін, збігається з оригіналом"""
+
+    hero = HeroFactory.generate(output, level=seed * 4 + 1)
+    the_map = generate_map(hero, seed=seed)
+    _play(the_map, 60, seed)
+
+    saved = map_to_save(the_map)
+    assert saved["seed"] == seed and len(saved["delta"]) < MapSize.X * MapSize.Y
+    assert len(json.dumps(saved)) < len(json.dumps(map_to_dict(the_map))) / 2
+
+    # Порівнюємо з завантаженням повного формату
+    expected = map_to_dict(dict_to_map(output, map_to_dict(the_map)))
+    loaded = dict_to_map(output, json.loads(json.dumps(saved)))
+    assert map_to_dict(loaded) == expected
+
+
+def test_delta_round_trip_lazy():
+    """Велика мапа зберігається лише змінами в згенерованих чанках"""
+
+    hero = HeroFactory.generate(output, level=8)
+    the_map = generate_lazy_map(hero, 500, 400, seed=3)
+    _play(the_map, 40, 3)
+    saved = map_to_save(the_map)
+
+    loaded = dict_to_map(output, saved)
+    assert loaded.hero_position() == the_map.hero_position()
+    for y in range(40):
+        assert map_to_dict([loaded[y]]) == map_to_dict([the_map[y]])
+
+
+def test_full_format_still_loads():
+    """Старий формат (всі клітинки) завантажується та зберігається повністю"""
+
+    the_map = generate_map(HeroFactory.generate(output, level=2))
+    full = map_to_dict(the_map)
+    loaded = dict_to_map(output, full)
+
+    assert loaded.seed is None
+    assert map_to_save(loaded) == full
+
+
+def test_seed_range():
+    """Зерно мапи має вміщатися у 32 біти без знака, як у знімку"""
+
+    hero = HeroFactory.generate(output, level=1)
+    generate_map(hero, seed=2**32 - 1)
+    for seed in (-1, 2**32):
+        with pytest.raises(ValueError):
+            generate_map(hero, seed=seed)
+        with pytest.raises(ValueError):
+            generate_lazy_map(hero, height=50, width=50, seed=seed)
+
+
+def test_base_map_is_abstract():
+    """Мапу без усіх методів інтерфейсу не можна створити"""
+
+    class PartialMap(BaseMap):
+        def cell(self, y, x):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialMap()
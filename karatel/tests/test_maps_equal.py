@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from karatel.core.hero import HeroFactory
+from karatel.core.hero import Hero, HeroFactory
 from karatel.core.map import CellType, MapSize, generate_map
 from karatel.core.professions import PROFESSIONS
 from karatel.storage.abstract import FirebaseSaver
@@ -13,7 +13,6 @@ from karatel.ui.abstract import NoneOutput
 from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
 
 if TYPE_CHECKING:
-    from karatel.core.hero import Hero
     from karatel.core.map import Cell
 
 output = NoneOutput()
@@ -25,22 +24,16 @@ USERNAME = "test_user"
 def heroes_equal(hero_a: Hero, hero_b: Hero) -> bool:
     """Перевірка рівності героїв"""
 
-    # Видаляємо менеджери, бо вони завжди не збігаються,
-    # але це не проблема
-    IGNORE_KEYS = [
-        'leveling',
-        'equipment',
-        'display',
-        'skill_manager',
-        'output',
-    ]
-
-    hero_a_dict = hero_a.__dict__.copy()
-    hero_b_dict = hero_b.__dict__.copy()
-
-    for key in IGNORE_KEYS:
-        hero_a_dict.pop(key, None)
-        hero_b_dict.pop(key, None)
+    # output завжди не збігається, а кеш похідних характеристик
+    # може бути ще не порахований, але це не проблема
+    IGNORE_KEYS = ['output', '_ac', '_attack_modifier', '_initiative', '_derived']
+
+    hero_a_dict = {
+        key: getattr(hero_a, key) for key in Hero.__slots__ if key not in IGNORE_KEYS
+    }
+    hero_b_dict = {
+        key: getattr(hero_b, key) for key in Hero.__slots__ if key not in IGNORE_KEYS
+    }
 
     return hero_a_dict == hero_b_dict
 
@@ -0,0 +1,32 @@
+from karatel.ui.abstract import BufferedOutput, NoneOutput
+
+
+def test_write_lazy_formats_when_enabled():
+    """Шаблон та функція форматуються, якщо вивід увімкнено"""
+
+    output = BufferedOutput()
+    output.write_lazy("{} отримує {} досвіду", "Андрій", 300)
+    output.write_lazy(lambda: "Модифікатор {:+d}".format(2))
+    output.write_lazy("Без аргументів")
+
+    assert output.buffer == [
+        "Андрій отримує 300 досвіду",
+        "Модифікатор +2",
+        "Без аргументів",
+    ]
+
+
+def test_write_lazy_skips_disabled():
+    """Повідомлення не формується, якщо його не буде збережено"""
+
+    def _fail() -> str:
+        raise AssertionError("Повідомлення не мало формуватися")
+
+    buffered = BufferedOutput()
+    buffered.write_lazy(_fail, log=False)
+    assert buffered.buffer == []
+    assert not buffered.enabled(False)
+
+    none = NoneOutput()
+    none.write_lazy(_fail)
+    assert not none.enabled(True)
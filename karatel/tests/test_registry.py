@@ -0,0 +1,55 @@
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.core.items import ITEMS
+from karatel.core.professions import PROFESSIONS
+from karatel.core.registry import (
+    ITEM_REGISTRY,
+    PROFESSION_REGISTRY,
+    SKILL_REGISTRY,
+    Registry,
+    stable_id,
+)
+from karatel.core.skills import SKILLS
+from karatel.tests.test_hero import hero_state
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.utils import obj_finder
+
+output = NoneOutput()
+
+
+@pytest.mark.parametrize(
+    "registry, base",
+    [
+        (ITEM_REGISTRY, ITEMS),
+        (SKILL_REGISTRY, SKILLS),
+        (PROFESSION_REGISTRY, PROFESSIONS),
+    ],
+)
+def test_same_as_linear_search(registry, base):
+    """Пошук за назвою дає той самий об'єкт, що й лінійний пошук"""
+
+    for obj in registry:
+        assert registry.by_name(obj.name) is obj_finder(obj.name, base)
+        assert registry.by_id(registry.id_of(obj)) is obj
+    assert registry.by_name("Немає такого") is None
+    assert registry.by_name(None) is None
+
+
+def test_stable_ids():
+    """ID залежить лише від назви"""
+
+    item = ITEMS[3]
+    assert ITEM_REGISTRY.id_of(item) == stable_id(item.name)
+    assert Registry("Зворотний", reversed(ITEMS)).id_of(item) == stable_id(item.name)
+    with pytest.raises(KeyError):
+        ITEM_REGISTRY.by_id(-1)
+
+
+@pytest.mark.parametrize("level", [1, 10, 20])
+def test_dict_to_hero(level):
+    """Герой зі словника збігається з оригіналом"""
+
+    hero = HeroFactory.generate(output, level=level)
+    loaded = HeroFactory.dict_to_hero(output, HeroFactory.hero_to_dict(hero))
+    assert hero_state(loaded) == hero_state(hero)
@@ -0,0 +1,56 @@
+import random
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map, map_to_dict
+from karatel.logic.next_number import get_sequence
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.dice import Dice
+from karatel.utils.rng import get_rng, seeded, use_rng
+
+output = NoneOutput()
+
+
+def _session() -> tuple:
+    """Все, що залежить від випадковості"""
+
+    hero = HeroFactory.generate(output)
+    rolls = [Dice.roll(output, "2d6+1d4") for _ in range(20)]
+    return HeroFactory.hero_to_dict(hero), rolls, get_sequence(6)
+
+
+def test_seeded_session_is_reproducible():
+    """Однакове зерно -- однакові герої, кидки та ігри"""
+
+    with seeded(42):
+        session_a = _session()
+    with seeded(42):
+        session_b = _session()
+    with seeded(43):
+        session_c = _session()
+
+    assert session_a == session_b
+    assert session_a != session_c
+
+
+def test_rng_context_is_restored():
+    """Після виходу з блоку знову використовується глобальний random"""
+
+    rng = random.Random(1)
+    with use_rng(rng):
+        assert get_rng() is rng
+        with seeded(2):
+            assert get_rng() is not rng
+        assert get_rng() is rng
+    assert get_rng() is random
+
+
+def test_map_from_seed():
+    """Мапа відтворюється з зерна"""
+
+    hero = HeroFactory.generate(output, level=6)
+    map_a = generate_map(hero, seed=123)
+    map_b = generate_map(hero, seed=123)
+
+    assert map_a.seed == map_b.seed == 123
+    assert map_to_dict(map_a) == map_to_dict(map_b)
+    assert map_to_dict(generate_map(hero, seed=124)) != map_to_dict(map_a)
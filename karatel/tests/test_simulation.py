@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.logic.combat import fight
+from karatel.logic.simulation import CombatStats, simulate_fights, simulate_matrix
+from karatel.ui.abstract import NoneOutput
+
+output = NoneOutput()
+
+num_tests = 2000
+num_simulations = 200_000
+tolerance = 0.05
+
+
+@pytest.mark.parametrize(
+    "level, prof1, prof2",
+    [
+        (1, "commando", "hacker"),
+        (10, "hacker", "stuntman"),
+        (20, "influencer", "commando"),
+    ],
+)
+def test_simulation_matches_fight(level, prof1, prof2):
+    """Частка перемог у симуляції збігається з fight()"""
+
+    wins1 = 0
+    for _ in range(num_tests):
+        hero1 = HeroFactory.generate(output, level=level, profession=prof1)
+        hero2 = HeroFactory.generate(output, level=level, profession=prof2)
+        fight(hero1, hero2)
+        if hero1.alive:
+            wins1 += 1
+
+    result = simulate_fights(
+        CombatStats.from_hero(hero1),
+        CombatStats.from_hero(hero2),
+        num_simulations,
+        np.random.default_rng(level),
+    )
+
+    assert result.wins_a + result.wins_b == num_simulations
+    assert result.turns.sum() == num_simulations
+    assert abs(result.ratio_a - wins1 / num_tests) <= tolerance
+
+
+def test_simulation_matrix():
+    """Прогін матриці професій на кількох рівнях"""
+
+    results = simulate_matrix(output, 1000, levels=[1, 20])
+
+    assert len(results) == 2 * 6
+    for result in results.values():
+        assert result.wins_a + result.wins_b == 1000
+        assert 0 <= result.hp_left_a and 0 <= result.hp_left_b
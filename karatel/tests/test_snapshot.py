@@ -0,0 +1,92 @@
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.core.items import SHIELDS, STRENGTH_WEAPONS
+from karatel.core.map import (
+    Cell,
+    CellType,
+    DungeonMap,
+    dict_to_map,
+    generate_map,
+    map_to_dict,
+    map_to_save,
+)
+from karatel.core.professions import PROFESSIONS
+from karatel.core.snapshot import (
+    SnapshotError,
+    bytes_to_hero,
+    bytes_to_map,
+    hero_to_bytes,
+    map_to_bytes,
+)
+from karatel.tests.test_hero import hero_state
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
+
+output = NoneOutput()
+
+
+@pytest.mark.parametrize("level", [MIN_LEVEL, 7, MAX_LEVEL])
+@pytest.mark.parametrize("profession", list(PROFESSIONS.keys()))
+def test_hero_round_trip(level, profession):
+    """Герой зі знімка збігається з оригіналом, включно з поточним здоров'ям"""
+
+    hero = HeroFactory.generate(output, level=level, profession=profession)
+    hero.hp -= 3
+    hero.money = 1234
+    hero.inventory += [SHIELDS[2], STRENGTH_WEAPONS[4]]
+
+    restored = bytes_to_hero(output, hero_to_bytes(hero))
+
+    assert hero_state(restored) == hero_state(hero)
+    assert restored.output is output
+    assert restored.leveling.hero is restored
+
+
+def test_map_round_trip():
+    """Мапа зі знімка збігається з оригіналом та зберігає зерно і зміни"""
+
+    the_map = generate_map(HeroFactory.generate(output, level=9), seed=5)
+    the_map[0][0].gold = 77
+
+    restored = bytes_to_map(output, map_to_bytes(the_map))
+
+    assert map_to_dict(restored) == map_to_dict(the_map)
+    assert map_to_save(restored) == map_to_save(the_map)
+    assert restored.hero_position() == the_map.hero_position()
+
+    # Мапа без зерна (старий формат)
+    old = dict_to_map(output, map_to_dict(the_map))
+    restored = bytes_to_map(output, map_to_bytes(old))
+    assert restored.seed is None and restored.changed is None
+    assert map_to_dict(restored) == map_to_dict(old)
+
+
+def test_broken_snapshots():
+    """Пошкоджені знімки викликають SnapshotError"""
+
+    hero = HeroFactory.generate(output, level=3)
+    data = hero_to_bytes(hero)
+
+    with pytest.raises(SnapshotError):
+        bytes_to_hero(output, data[:-3])
+    with pytest.raises(SnapshotError):
+        bytes_to_hero(output, b"KH\x63" + data[3:])
+    with pytest.raises(SnapshotError):
+        bytes_to_map(output, data)
+
+    # Останній об'єкт -- предмет: індекс клітинки, тип, ID предмета
+    the_map = DungeonMap(height=2, width=2)
+    the_map[1][1] = Cell(CellType.ITEM, SHIELDS[2])
+    data_map = map_to_bytes(the_map)
+    assert bytes_to_map(output, data_map).objects == the_map.objects
+    broken = data_map[:-9] + (4).to_bytes(4, "little") + data_map[-5:]
+    with pytest.raises(SnapshotError):
+        bytes_to_map(output, broken)
+
+    # Рівень лежить після заголовка, імені, статі та професії
+    offset = 3 + 2 + len(hero.name.encode("utf-8")) + 1 + 4
+    for level in (0, MAX_LEVEL + 1):
+        broken = data[:offset] + bytes([level]) + data[offset + 1 :]
+        with pytest.raises(SnapshotError):
+            bytes_to_hero(output, broken)
@@ -0,0 +1,108 @@
+import threading
+
+import pytest
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map
+from karatel.storage.sqlite_manager import SQLiteSaver
+from karatel.tests.test_hero import hero_state
+from karatel.ui.abstract import NoneOutput
+
+output = NoneOutput()
+PASSWORD = "Secret_pass1!"
+
+
+@pytest.fixture
+def saver(tmp_path):
+    saver = SQLiteSaver(str(tmp_path / "karatel.db"))
+    yield saver
+    saver.close()
+
+
+@pytest.fixture
+def user_id(saver):
+    is_valid, user_id, *_ = saver.register_user(output, "player", PASSWORD, False)
+    assert is_valid
+    return user_id
+
+
+def test_users(saver, user_id):
+    """Реєстрація, вхід, зміна пароля"""
+
+    assert not saver.register_user(output, "player", PASSWORD, False)[0]
+    assert saver.validate_user(output, "player", PASSWORD, False)[1] == user_id
+    assert not saver.validate_user(output, "player", "Wrong_pass1!", False)[0]
+
+    assert saver.update_password(output, user_id, "New_pass1!", False)[0]
+    assert saver.validate_user(output, "player", "New_pass1!", False)[0]
+
+
+def test_save_load_upsert(saver, user_id):
+    """Повторне збереження оновлює той самий запис"""
+
+    hero = HeroFactory.generate(output, level=6)
+    the_map = generate_map(hero, seed=3)
+    saver.save_hero(hero, the_map, user_id, log=False)
+
+    hero.money += 100
+    saver.save_hero(hero, None, user_id, log=False)
+
+    summaries = saver.list_summaries(output, user_id)
+    assert len(summaries) == 1
+    assert summaries[0].money == hero.money
+    assert not summaries[0].has_map
+    assert summaries[0].updated_at is not None
+
+    loaded, loaded_map = saver.load_hero(output, user_id, hero.name, log=False)
+    assert hero_state(loaded) == hero_state(hero)
+    assert loaded_map is None
+    assert saver.load_hero(output, user_id, "Немає", log=False) == (None, None)
+
+
+def test_bulk_and_delete(saver, user_id):
+    """Пакетне збереження та каскадне видалення з користувачем"""
+
+    heroes = []
+    for number in range(20):
+        hero = HeroFactory.generate(output, level=number % 5 + 1)
+        hero.name = f"Герой{number}"
+        heroes.append((hero, generate_map(hero, seed=number) if number % 2 else None))
+    saver.save_heroes(heroes, user_id)
+
+    summaries = saver.list_summaries(output, user_id)
+    assert [summary.name for summary in summaries] == sorted(
+        hero.name for hero, _ in heroes
+    )
+    assert sum(summary.has_map for summary in summaries) == 10
+
+    assert saver.delete_hero(output, user_id, "Герой0")
+    assert not saver.delete_hero(output, user_id, "Герой0")
+    assert len(saver.list_hero(output, user_id)) == 19
+
+    assert saver.delete_user(output, user_id, user_id, False)
+    assert saver.list_hero(output, user_id) == []
+
+
+def test_thread_local_connections(saver, user_id):
+    """Кожен потік має власне з'єднання"""
+
+    errors = []
+
+    def _save(number: int) -> None:
+        try:
+            hero = HeroFactory.generate(output, level=2)
+            hero.name = f"Потік{number}"
+            saver.save_hero(hero, None, user_id, log=False)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+        finally:
+            saver.close()
+
+    threads = [threading.Thread(target=_save, args=(number,)) for number in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(saver.list_summaries(output, user_id)) == 8
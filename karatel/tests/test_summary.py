@@ -0,0 +1,48 @@
+import json
+
+from karatel.core.hero import HeroFactory
+from karatel.core.map import generate_map, map_to_save
+from karatel.storage.summary import HeroSummary
+from karatel.ui.abstract import NoneOutput
+from karatel.utils.settings import MAX_LEVEL, MIN_LEVEL
+
+output = NoneOutput()
+
+
+def test_summary_round_trip():
+    """Опис героя відновлюється зі словника збереження"""
+
+    hero = HeroFactory.generate(output, level=7)
+    summary = HeroSummary.from_hero(hero, generate_map(hero, seed=1))
+
+    assert summary.name == hero.name
+    assert summary.level == 7
+    assert summary.profession == hero.profession.name
+    assert summary.has_map
+    assert HeroSummary.from_dict(summary.to_dict()) == summary
+
+
+def test_summary_from_old_save():
+    """Опис старого збереження збігається з описом героя"""
+
+    hero = HeroFactory.generate(output, level=12)
+    json_hero = json.dumps(HeroFactory.hero_to_dict(hero), ensure_ascii=False)
+    json_map = json.dumps(map_to_save(generate_map(hero, seed=2)))
+
+    assert HeroSummary.from_json(json_hero, json_map) == HeroSummary.from_hero(hero, [])
+    assert not HeroSummary.from_json(json_hero, json.dumps(None)).has_map
+
+
+def test_summary_from_save_matches_hero():
+    """Опис зі словників збігається з описом відновленого героя"""
+
+    for level in range(MIN_LEVEL, MAX_LEVEL + 1):
+        hero = HeroFactory.generate(output, level=level)
+        hero.money = level * 7
+        hero_dict = HeroFactory.hero_to_dict(hero)
+        for changes in ({}, {"experience": hero.experience + 1}, {"lives": 0}):
+            the_dict = hero_dict | changes
+            restored = HeroFactory.dict_to_hero(output, the_dict)
+            assert HeroSummary.from_save(the_dict, None) == HeroSummary.from_hero(
+                restored, None
+            )
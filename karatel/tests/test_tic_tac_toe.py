@@ -0,0 +1,108 @@
+import math
+import random
+from functools import cache
+
+import pytest
+
+import karatel.logic.tic_tac_toe_3x3 as ttt
+from karatel.utils.constants import Emoji
+
+EMPTY = Emoji.EMPTY.value
+
+
+@cache
+def reference_minimax(board: tuple, is_max_turn: bool, max_symbol, min_symbol) -> int:
+    """Початковий рекурсивний мінімакс, лише з пам'яттю для швидкості тесту"""
+
+    winner = ttt.check_winner(list(board))
+    if winner == max_symbol:
+        return 1
+    if winner == min_symbol:
+        return -1
+    if winner == ttt.TTT.DRAW.value:
+        return 0
+
+    symbol = max_symbol if is_max_turn else min_symbol
+    scores = [
+        reference_minimax(
+            board[:i] + (symbol,) + board[i + 1 :],
+            not is_max_turn,
+            max_symbol,
+            min_symbol,
+        )
+        for i in range(9)
+        if board[i] == EMPTY
+    ]
+    return max(scores) if is_max_turn else min(scores)
+
+
+def reference_best_move(board: list, max_symbol: str, min_symbol: str) -> int:
+    best_score = -math.inf
+    move = None
+    for i in range(9):
+        if board[i] == EMPTY:
+            changed = tuple(board[:i] + [max_symbol] + board[i + 1 :])
+            score = reference_minimax(changed, False, max_symbol, min_symbol)
+            if score > best_score:
+                best_score = score
+                move = i
+    if move is None:
+        raise ValueError("Немає доступних ходів на дошці")
+    return move
+
+
+def legal_positions() -> set[tuple]:
+    """Усі позиції, досяжні з порожньої дошки"""
+
+    seen = set()
+    stack = [tuple(ttt.START_BOARD)]
+    while stack:
+        board = stack.pop()
+        if board in seen:
+            continue
+        seen.add(board)
+        if ttt.check_winner(list(board)) is None:
+            symbol = "X" if board.count("X") == board.count("O") else "O"
+            for i in range(9):
+                if board[i] == EMPTY:
+                    stack.append(board[:i] + (symbol,) + board[i + 1 :])
+    return seen
+
+
+def test_legal_positions_match_reference():
+    """Для кожної з 5478 позицій -- той самий хід і та сама оцінка"""
+
+    positions = legal_positions()
+    assert len(positions) == 5478
+
+    for board in positions:
+        for max_symbol, min_symbol in (("X", "O"), ("O", "X")):
+            for is_max_turn in (True, False):
+                assert ttt.minimax(
+                    list(board), is_max_turn, max_symbol, min_symbol
+                ) == reference_minimax(board, is_max_turn, max_symbol, min_symbol)
+            if EMPTY in board:
+                assert ttt.best_move(
+                    list(board), max_symbol, min_symbol
+                ) == reference_best_move(list(board), max_symbol, min_symbol)
+
+
+def test_arbitrary_boards_match_reference():
+    """Недосяжні в грі дошки (як може надіслати API) -- теж без розбіжностей"""
+
+    rng = random.Random(7)
+    for _ in range(2000):
+        board = [rng.choice(("X", "O", EMPTY)) for _ in range(9)]
+        if EMPTY not in board:
+            with pytest.raises(ValueError):
+                ttt.best_move(board, "X", "O")
+            continue
+        assert ttt.best_move(board, "X", "O") == reference_best_move(board, "X", "O")
+
+
+def test_encode():
+    board = ["X", "O"] + [EMPTY] * 7
+    assert ttt.encode(board, "X", "O") == 1 + 2 * 3
+    assert ttt.encode(board, "O", "X") == 2 + 1 * 3
+    with pytest.raises(ValueError):
+        ttt.encode(["?"] + [EMPTY] * 8, "X", "O")
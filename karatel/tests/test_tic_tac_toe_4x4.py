@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+import karatel.logic.tic_tac_toe_4x4 as ttt
+from karatel.utils.constants import Emoji
+
+EMPTY = Emoji.EMPTY.value
+
+
+def reference_negamax(board: list[str], me: str, other: str, ply: int = 0) -> int:
+    """Повний перебір без відсікань, таблиць і бітбордів"""
+
+    winner = ttt.check_winner(board)
+    if winner == other:
+        return ply - ttt.WIN_SCORE
+    if winner == ttt.TTT.DRAW.value:
+        return 0
+    best = -ttt.WIN_SCORE - 1
+    for i in range(16):
+        if board[i] == EMPTY:
+            board[i] = me
+            best = max(best, -reference_negamax(board, other, me, ply + 1))
+            board[i] = EMPTY
+    return best
+
+
+def random_board(rng: random.Random, filled: int) -> list[str]:
+    """Випадкова позиція без переможця, де ходить X"""
+
+    while True:
+        board = [EMPTY] * 16
+        for number, cell in enumerate(rng.sample(range(16), filled)):
+            board[cell] = "X" if number % 2 == 0 else "O"
+        if ttt.check_winner(board) is None:
+            return board
+
+
+def transform(board: list[str], perm: tuple[int, ...]) -> list[str]:
+    result = [EMPTY] * 16
+    for cell, symbol in enumerate(board):
+        result[perm[cell]] = symbol
+    return result
+
+
+def test_full_search_matches_reference():
+    """Повний пошук дає точну оцінку та хід, що її досягає"""
+
+    rng = random.Random(5)
+    for _ in range(15):
+        board = random_board(rng, 10)
+        result = ttt.search(board, "X", "O", budget=60)
+        assert result.complete
+        assert result.score == reference_negamax(board.copy(), "X", "O")
+
+        board[result.move] = "X"
+        assert -reference_negamax(board, "O", "X", 1) == result.score
+
+
+def test_shared_table_and_symmetries():
+    """Симетричні позиції мають однакову оцінку, а хід переходить разом з дошкою"""
+
+    rng = random.Random(11)
+    table = ttt.TranspositionTable(bits=12)
+    board = random_board(rng, 8)
+    expected = ttt.search(board, "X", "O", budget=60, table=table)
+    assert expected.complete
+
+    for perm in ttt.SYMMETRIES:
+        changed = transform(board, perm)
+        result = ttt.search(changed, "X", "O", budget=60, table=table)
+        assert result.score == expected.score
+        changed[result.move] = "X"
+        assert -reference_negamax(changed, "O", "X", 1) == expected.score
+
+
+def test_wins_and_blocks():
+    """Виграє одразу, а якщо не може -- блокує лінію суперника"""
+
+    board = [EMPTY] * 16
+    for cell in (0, 1, 2):
+        board[cell] = "X"
+    for cell in (4, 5, 6):
+        board[cell] = "O"
+    assert ttt.best_move(board, "X", "O") == 3
+    assert ttt.best_move(board, "O", "X") == 7
+
+    board[6] = EMPTY
+    board[9] = "O"
+    assert ttt.best_move(board, "O", "X") == 3
+
+
+def test_time_budget():
+    """Порожня дошка: пошук зупиняється в межах бюджету з легальним ходом"""
+
+    result = ttt.search(ttt.START_BOARD, "X", "O", budget=0.2)
+    assert 0 <= result.move < 16
+    assert result.depth >= 1
+
+    full = [("X" if i % 2 else "O") for i in range(16)]
+    with pytest.raises(ValueError):
+        ttt.best_move(full, "X", "O")
+
+
+def test_evaluate_position():
+    """Оцінка дошки: квадрат кількості фішок на кожній незаблокованій лінії"""
+
+    rng = random.Random(5)
+    for filled in range(0, 12):
+        board = random_board(rng, filled)
+        expected = 0
+        for combo in ttt.WIN_POSITIONS:
+            mine = sum(board[i] == "X" for i in combo)
+            theirs = sum(board[i] == "O" for i in combo)
+            if not theirs:
+                expected += mine**2
+            elif not mine:
+                expected -= theirs**2
+        assert ttt.evaluate_position(board, "X", "O") == expected
+        assert ttt.evaluate_position(board, "O", "X") == -expected
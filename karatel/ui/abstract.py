@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Callable
 
 
 class OutputSpace(ABC):
@@ -13,6 +14,24 @@ class OutputSpace(ABC):
         """Виводимо текст у 'відкритий простір'"""
         pass
 
+    def enabled(self, log: bool = True) -> bool:
+        """Чи буде збережено повідомлення з таким рівнем логування"""
+        return log
+
+    def write_lazy(
+        self, message: str | Callable[[], str], *args, log: bool = True, **kwargs
+    ) -> None:
+        """Відкладений вивід. Шаблон (str.format) з аргументами або функція,
+        що повертає текст. Текст формується лише якщо його буде збережено"""
+
+        if not self.enabled(log):
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message.format(*args)
+        self.write(message, log=log, **kwargs)
+
 
 class NoneOutput(OutputSpace):
     """Без виводу"""
@@ -20,6 +39,9 @@ class NoneOutput(OutputSpace):
     def write(self, *args, **kwargs) -> None:
         pass
 
+    def enabled(self, log: bool = True) -> bool:
+        return False
+
 
 class ConsoleOutput(OutputSpace):
     """Вивід в консоль"""
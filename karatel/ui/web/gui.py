@@ -1,7 +1,5 @@
 # -*- coding: utf-8 -*-
 
-import json
-
 import streamlit as st
 
 import karatel.logic.tic_tac_toe_4x4 as ttt
@@ -25,6 +23,7 @@ from karatel.ui.web.elements import (
 )
 from karatel.ui.web.logic import check_username_and_password, user_params_update
 from karatel.utils.constants import Emoji, Sex
+from karatel.utils.rng import use_rng
 from karatel.utils.settings import HERO_LIVES, LOG, MAX_LEVEL, MIN_LEVEL
 from karatel.utils.utils import generate_random_prefix
 
@@ -432,13 +431,14 @@ def hero() -> None:
                     type="secondary",
                     width=BUTTON_WIDTH,
                 ):
-                    st.session_state.hero = HeroFactory.generate(
-                        output=st.session_state.gsm.output,
-                        level=level,
-                        profession=profession,
-                        name=name,
-                        sex=sex,
-                    )
+                    with use_rng(st.session_state.gsm.rng):
+                        st.session_state.hero = HeroFactory.generate(
+                            output=st.session_state.gsm.output,
+                            level=level,
+                            profession=profession,
+                            name=name,
+                            sex=sex,
+                        )
                     st.session_state.hero.lives = HERO_LIVES
                     st.rerun()
             with col2:
@@ -473,7 +473,10 @@ def game_map() -> None:
         show_log(expanded=True)
         if 'game_map' in st.session_state:
             if not st.session_state.game_map:
-                st.session_state.game_map = generate_map(st.session_state.hero)
+                st.session_state.game_map = generate_map(
+                    st.session_state.hero,
+                    seed=st.session_state.gsm.rng.getrandbits(32),
+                )
             if st.session_state.game_map:
                 with st.expander(f"{Emoji.DUNG.value} Мапа", expanded=True):
                     render_map(st.session_state.gsm.output, st.session_state.game_map)
@@ -496,13 +499,14 @@ def game_map() -> None:
 def load_hero() -> None:
     st.title(TITLE)
     st.header(f"{Emoji.LOG.value} Список збережених {Emoji.HERO.value} героїв")
-    all_saved_heroes = st.session_state.gsm.saver.list_hero(
+    # Лише короткі описи -- мапа завантажується при відновленні героя
+    all_saved_heroes = st.session_state.gsm.saver.list_summaries(
         output=st.session_state.gsm.output, username=st.session_state.gsm.local_id
     )
 
-    columns = [1, 6, 3, 2, 4, 4]
+    columns = [1, 6, 3, 2, 2, 4, 4]
 
-    col1, col2, col3, col4, col5, col6 = st.columns(columns)
+    col1, col2, col3, col4, col5, col6, col7 = st.columns(columns)
     with col1:
         st.html("<b>№</b>")
     with col2:
@@ -510,29 +514,31 @@ def load_hero() -> None:
     with col3:
         st.html("<b>Стать</b>")
     with col4:
-        st.html("<b>Мапа</b>")
+        st.html("<b>Рівень</b>")
     with col5:
-        pass
+        st.html("<b>Мапа</b>")
     with col6:
         pass
+    with col7:
+        pass
 
-    for number, saved_hero in enumerate(all_saved_heroes):
-        hero_name, json_hero, json_map = saved_hero
-        col1, col2, col3, col4, col5, col6 = st.columns(columns)
+    for number, summary in enumerate(all_saved_heroes):
+        hero_name = summary.name
+        col1, col2, col3, col4, col5, col6, col7 = st.columns(columns)
         with col1:
             st.text(number + 1)
         with col2:
             st.text(hero_name)
         with col3:
-            hero_data = json.loads(json_hero)
-            sex = hero_data.get("sex")
-            st.text(sex)
+            st.text(summary.sex)
         with col4:
-            if json.loads(json_map) is not None:
+            st.text(summary.level)
+        with col5:
+            if summary.has_map:
                 st.text(Emoji.CHECK.value)
             else:
                 st.text(Emoji.X.value)
-        with col5:
+        with col6:
             if st.button(
                 "Відновити",
                 icon=Emoji.LOAD.value,
@@ -563,7 +569,7 @@ def load_hero() -> None:
                     # )
                 st.session_state.game_state = GameState.HERO.value
                 st.rerun()
-        with col6:
+        with col7:
             if st.button(
                 "Видалити",
                 icon=Emoji.TRASH.value,
@@ -5,10 +5,17 @@ import streamlit as st
 import karatel.logic.tic_tac_toe_4x4 as ttt
 from karatel.core.game_state_manager import GameStateManager
 from karatel.storage.abstract import FirebaseSaver  # SQLiteSaver
+from karatel.storage.caching import CachingSaver
 from karatel.ui.abstract import BufferedOutput
 from karatel.utils.settings import LOG
 
 
+@st.cache_resource
+def shared_saver() -> CachingSaver:
+    """Спільне для всіх сесій сховище з кешем та фоновим записом"""
+    return CachingSaver(FirebaseSaver())
+
+
 def init_session_state():
     """Ініціалізує всі змінні сесії"""
 
@@ -28,7 +35,7 @@ def init_session_state():
 
     if st.session_state.first_start:
         st.session_state.gsm = GameStateManager(
-            output=BufferedOutput(), saver=FirebaseSaver(), can_generate_map=False
+            output=BufferedOutput(), saver=shared_saver(), can_generate_map=False
         )
         st.session_state.ttt_board = ttt.START_BOARD.copy()
         st.session_state.first_start = False
@@ -1,15 +1,103 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import random
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from karatel.utils.settings import DEBUG
+import numpy as np
+
+from karatel.utils.rng import get_rng
+from karatel.utils.settings import DEBUG, DICE_CACHE_SIZE
 
 if TYPE_CHECKING:
     from karatel.ui.abstract import OutputSpace
 
 
+# Один доданок виразу: "+2d6", "-1d4", "+3", "d20"
+_TERM = re.compile(r"([+-]?)(\d*)(?:d(\d+))?")
+
+
+class DiceExpression:
+    """Скомпільований вираз кидка кубиків, наприклад "2d6+1d4-1".
+    Рядок розбирається один раз, далі лише кидки"""
+
+    __slots__ = ("expression", "dice", "modifier")
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        # Кортеж (кількість кубиків, граней, знак) для кожного доданка з кубиками
+        self.dice: tuple[tuple[int, int, int], ...] = ()
+        self.modifier = 0
+
+        text = expression.lower().replace(" ", "")
+        if not text:
+            raise ValueError("Порожній вираз кидка кубиків")
+
+        dice = []
+        position = 0
+        while position < len(text):
+            match = _TERM.match(text, position)
+            sign, count, sides = match.groups()
+            if match.end() == position or (position > 0 and not sign):
+                raise ValueError(f"Некоректний вираз кидка кубиків: '{expression}'")
+            sign = -1 if sign == "-" else 1
+            if sides is not None:
+                if int(sides) < 1:
+                    raise ValueError(f"Кубик без граней у виразі: '{expression}'")
+                dice.append((int(count or 1), int(sides), sign))
+            elif count:
+                self.modifier += sign * int(count)
+            else:
+                raise ValueError(f"Некоректний вираз кидка кубиків: '{expression}'")
+            position = match.end()
+
+        self.dice = tuple(dice)
+
+    def __repr__(self) -> str:
+        return f"DiceExpression('{self.expression}')"
+
+    def roll(self, output: OutputSpace | None = None) -> int:
+        """Кидок. Повертає суму кидків + модифікатор.
+        Повідомлення формуються лише якщо output їх збереже"""
+
+        randint = get_rng().randint
+        total = 0
+        for count, sides, sign in self.dice:
+            for _ in range(count):
+                total += sign * randint(1, sides)
+        result = total + self.modifier
+
+        if output is not None and output.enabled(DEBUG):
+            output.write_lazy(
+                "Вираз: {}, Модифікатор: {:+d}",
+                self.expression,
+                self.modifier,
+                log=DEBUG,
+            )
+            output.write_lazy(
+                "Загальний результат: {} це сума кидків: {} плюс модифікатор: {}\n",
+                result,
+                total,
+                self.modifier,
+                log=DEBUG,
+            )
+
+        return result
+
+    def roll_many(self, n: int, rng: np.random.Generator | None = None) -> np.ndarray:
+        """Пакетний кидок. Повертає масив з n результатів"""
+
+        if rng is None:
+            rng = np.random.default_rng()
+
+        total = np.full(n, self.modifier, dtype=np.int64)
+        for count, sides, sign in self.dice:
+            rolls = rng.integers(1, sides + 1, size=(n, count)).sum(axis=1)
+            total += sign * rolls
+        return total
+
+
 class Dice:
     """
     Клас-утиліта для операцій з кидками кубиків (dice rolls),
@@ -19,7 +107,14 @@ class Dice:
     @staticmethod
     def make_string(num_dice: int, num_sides: int, modifier: int = 0) -> str:
         """Створює строку формату XdY+Z для кидка кубика."""
-        return f"{num_dice}d{num_sides}+{modifier}"
+        return f"{num_dice}d{num_sides}{modifier:+d}"
+
+    @staticmethod
+    @lru_cache(maxsize=DICE_CACHE_SIZE)
+    def compile(dice_string: str) -> DiceExpression:
+        """Компілює рядок кидка. Результат кешується
+        (найдавніше використані вирази витісняються)"""
+        return DiceExpression(dice_string)
 
     @staticmethod
     def roll(output: OutputSpace, dice_string: str) -> int:
@@ -27,29 +122,6 @@ class Dice:
         Виконує кидок кубика у форматі XdY+Z.
         Повертає суму кидків + модифікатор.
 
-        Примітка: цей парсер очікує формат "XdY" або "XdY+Z".
-        Не підтримує від'ємні модифікатори (-Z).
+        Підтримує від'ємні модифікатори та кілька доданків: "2d6+1d4-1".
         """
-        # Беремо строку, розділювач "d"
-        num_dice, dice_expression = dice_string.lower().split("d")
-        # Беремо строку, розділювач "+", додаємо "0", якщо в функцію
-        # не передали модифікатор, вибираємо тільки два перші елементи
-        num_sides, modifier = (dice_expression.split("+") + [0])[:2]
-        output.write(
-            f"Кубиків: {num_dice}, Граней: {num_sides}, Модифікатор: {modifier}",
-            log=DEBUG,
-        )
-
-        total = 0
-        for _ in range(int(num_dice)):
-            value = random.randint(1, int(num_sides))
-            total += value
-
-        result = total + int(modifier)
-        output.write(
-            f"Загальний результат: {result} це сума кидків: {total} "
-            + f"плюс модифікатор: {modifier}\n",
-            log=DEBUG,
-        )
-
-        return result
+        return Dice.compile(dice_string).roll(output)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Генератор випадкових чисел поточної сесії або підземелля.
+# ContextVar -- окремий для кожного потоку та async-задачі
+_current_rng: ContextVar[random.Random | None] = ContextVar("current_rng", default=None)
+
+
+def get_rng() -> random.Random:
+    """Поточний генератор випадкових чисел.
+    Якщо генератор не встановлено -- глобальний модуль random"""
+
+    rng = _current_rng.get()
+    return rng if rng is not None else random  # type: ignore[return-value]
+
+
+@contextmanager
+def use_rng(rng: random.Random):
+    """Встановлює генератор випадкових чисел на час виконання блоку"""
+
+    token = _current_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _current_rng.reset(token)
+
+
+def seeded(seed: int):
+    """Встановлює новий генератор з зерном seed на час виконання блоку"""
+    return use_rng(random.Random(seed))
+
+
+SEED_BITS = 32  # Зерна мап -- цілі 0..2**SEED_BITS - 1
+
+
+def new_seed() -> int:
+    """Нове зерно з поточного генератора"""
+    return get_rng().getrandbits(SEED_BITS)
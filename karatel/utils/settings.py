@@ -4,8 +4,28 @@ FIREBASE_CERTIFICATE_PATH = "./karatel/storage/karatel-game-firebase-admin_sdk.j
 FIREBASE_MAIN_COLLECTION = "karatel_database"
 FIREBASE_SAVES_COLLECTION = "saves"
 FIREBASE_LIMIT = 100
+FIREBASE_BATCH_LIMIT = 500  # максимум операцій в одному WriteBatch
 
-# SQLITE_PATH = "./karatel/saves/karatel.db"
+SAVE_CACHE_TTL = 300  # секунд, скільки завантажений герой лишається в кеші
+SAVE_CACHE_SIZE = 256  # героїв у кеші завантажень
+SAVE_RETRIES = 3  # повторних спроб запису у сховище
+SAVE_FLUSH_DELAY = 0.5  # секунд на об'єднання частих збережень
+
+PSQL_POOL_MIN = 1  # з'єднань PostgreSQL у пулі
+PSQL_POOL_MAX = 10
+
+BACKUP_WORKERS = 4  # потоків читання при експорті збережень
+BACKUP_BATCH = 500  # збережень в одному пакеті запису
+BACKUP_QUEUE = 1000  # збережень, що прочитані, але ще не записані
+
+API_WORKERS = None  # процесів для важких ендпоінтів, None -- за кількістю ядер
+API_QUEUE = 32  # задач, що чекають на вільний процес, понад це -- 503
+API_RETRY_AFTER = 1  # секунд у заголовку Retry-After відповіді 503
+
+TTT_TIME_BUDGET = 1.0  # секунд на хід ШІ в хрестиках-ноликах 4x4
+TTT_TABLE_BITS = 18  # таблиця транспозицій 4x4 на 2**18 записів
+
+SQLITE_PATH = "./karatel/saves/karatel.db"
 # USERS_SQL_TABLE = "users"
 # HERO_SQL_TABLE = "saves"
 
@@ -23,6 +43,8 @@ XP_MULTIPLIER = 50
 
 BASE_SKILL_LEVELS = (1, 6, 12, 18)
 
+DICE_CACHE_SIZE = 256  # Кількість скомпільованих виразів кидків у кеші
+
 MIN_LEVEL = 1
 
 EXPERIENCE_FOR_LEVEL = (